@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Benchmark for plugin and pedalboard extraction
+# Generates synthetic LV2 plugin and pedalboard bundles in a temporary directory and times the main lilvlib calls.
+# Each benchmark runs in its own process, so timings and peak memory usage do not affect each other.
+# Results are written as JSON, to be compared between lilvlib (or lilv) versions.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+PLUGIN_URI_PREFIX = "http://lilvlib.benchmark/plugins/"
+
+BENCHMARKS = (
+    'get_plugins_info',
+    'get_plugin_info',
+    'plugin_has_modgui',
+    'get_pedalboard_info',
+    'get_pedalboard_info_fast',
+    'get_pedalboard_name',
+)
+
+# ------------------------------------------------------------------------------------------------------------
+# Bundle generator
+
+def write_file(filename, data):
+    with open(filename, 'w') as fh:
+        fh.write(data)
+
+def generate_plugin_bundle(bundle, index, ports, scalepoints, presets, modgui):
+    uri = "%splugin%d" % (PLUGIN_URI_PREFIX, index)
+    os.makedirs(bundle)
+
+    # manifest
+    manifest = """@prefix lv2:  <http://lv2plug.in/ns/lv2core#> .
+@prefix pset: <http://lv2plug.in/ns/ext/presets#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+<%s>
+    a lv2:Plugin ;
+    lv2:binary <plugin.so> ;
+    rdfs:seeAlso <plugin.ttl>%s .
+""" % (uri, " , <modgui.ttl>" if modgui else "")
+
+    for i in range(presets):
+        manifest += """
+<%s#preset%d>
+    a pset:Preset ;
+    lv2:appliesTo <%s> ;
+    rdfs:label "Preset %d" ;
+    rdfs:seeAlso <presets.ttl> .
+""" % (uri, i, uri, i)
+
+    write_file(os.path.join(bundle, "manifest.ttl"), manifest)
+
+    # plugin data
+    portsdata = []
+
+    for i, (symbol, kind) in enumerate((("in", "Input"), ("out", "Output"))):
+        portsdata.append("""[
+        a lv2:AudioPort , lv2:%sPort ;
+        lv2:index %d ;
+        lv2:symbol "%s" ;
+        lv2:name "Audio %s"
+    ]""" % (kind, i, symbol, kind))
+
+    for i in range(ports):
+        points = "".join("""
+        lv2:scalePoint [ rdfs:label "Point %d" ; rdf:value %d.0 ] ;""" % (j, j) for j in range(scalepoints))
+        portsdata.append("""[
+        a lv2:ControlPort , lv2:InputPort ;
+        lv2:index %d ;
+        lv2:symbol "param%d" ;
+        lv2:name "Parameter %d" ;
+        lv2:shortName "Param %d" ;
+        lv2:default 0.0 ;
+        lv2:minimum 0.0 ;
+        lv2:maximum %d.0 ;%s%s
+        units:unit units:db
+    ]""" % (i + 2, i, i, i, max(1, scalepoints), points,
+            "\n        lv2:portProperty lv2:enumeration ;" if scalepoints > 1 else ""))
+
+    write_file(os.path.join(bundle, "plugin.ttl"), """@prefix doap:  <http://usefulinc.com/ns/doap#> .
+@prefix foaf:  <http://xmlns.com/foaf/0.1/> .
+@prefix lv2:   <http://lv2plug.in/ns/lv2core#> .
+@prefix mod:   <http://moddevices.com/ns/mod#> .
+@prefix rdf:   <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs:  <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix units: <http://lv2plug.in/ns/extensions/units#> .
+
+<%s>
+    a lv2:Plugin , lv2:DelayPlugin ;
+    doap:name "Benchmark Plugin %d" ;
+    doap:license <http://opensource.org/licenses/isc> ;
+    doap:maintainer [
+        foaf:name "lilvlib" ;
+        foaf:homepage <http://lilvlib.benchmark/> ;
+        foaf:mbox <mailto:benchmark@lilvlib.benchmark>
+    ] ;
+    mod:brand "lilvlib" ;
+    mod:label "Plugin %d" ;
+    rdfs:comment "Synthetic plugin used for benchmarks" ;
+    lv2:minorVersion 2 ;
+    lv2:microVersion 0 ;
+    lv2:port %s .
+""" % (uri, index, index, " , ".join(portsdata)))
+
+    # presets
+    if presets:
+        presetsdata = "".join("""
+<%s#preset%d>
+    lv2:port [ lv2:symbol "param0" ; pset:value %d.0 ] .
+""" % (uri, i, i % 2) for i in range(presets)) if ports else ""
+
+        write_file(os.path.join(bundle, "presets.ttl"), """@prefix lv2:  <http://lv2plug.in/ns/lv2core#> .
+@prefix pset: <http://lv2plug.in/ns/ext/presets#> .
+""" + presetsdata)
+
+    # modgui
+    if modgui:
+        resdir = os.path.join(bundle, "modgui")
+        os.makedirs(resdir)
+
+        for filename in ("icon.html", "settings.html", "script.js", "stylesheet.css", "screenshot.png", "thumbnail.png"):
+            write_file(os.path.join(resdir, filename), "\n")
+
+        guiports = " , ".join("""[
+            lv2:index %d ;
+            lv2:symbol "param%d" ;
+            lv2:name "Param %d"
+        ]""" % (i, i, i) for i in range(ports))
+
+        write_file(os.path.join(bundle, "modgui.ttl"), """@prefix lv2:    <http://lv2plug.in/ns/lv2core#> .
+@prefix modgui: <http://moddevices.com/ns/modgui#> .
+
+<%s>
+    modgui:gui [
+        modgui:resourcesDirectory <modgui> ;
+        modgui:iconTemplate <modgui/icon.html> ;
+        modgui:settingsTemplate <modgui/settings.html> ;
+        modgui:javascript <modgui/script.js> ;
+        modgui:stylesheet <modgui/stylesheet.css> ;
+        modgui:screenshot <modgui/screenshot.png> ;
+        modgui:thumbnail <modgui/thumbnail.png> ;
+        modgui:brand "lilvlib" ;
+        modgui:label "Plugin %d"%s
+    ] .
+""" % (uri, index, (" ;\n        modgui:port " + guiports) if ports else ""))
+
+def generate_pedalboard_bundle(bundle, index, blocks, arcs, plugins):
+    name = "Benchmark%d" % index
+    os.makedirs(bundle)
+
+    write_file(os.path.join(bundle, "manifest.ttl"), """@prefix ingen: <http://drobilla.net/ns/ingen#> .
+@prefix lv2:   <http://lv2plug.in/ns/lv2core#> .
+@prefix pedal: <http://moddevices.com/ns/modpedal#> .
+@prefix rdfs:  <http://www.w3.org/2000/01/rdf-schema#> .
+
+<%s.ttl>
+    lv2:prototype ingen:GraphPrototype ;
+    a lv2:Plugin , ingen:Graph , pedal:Pedalboard ;
+    rdfs:seeAlso <%s.ttl> .
+""" % (name, name))
+
+    # audio signal goes capture_1 -> block0 -> block1 -> ... -> playback_1, then extra arcs from capture_1
+    endpoints = ["capture_1"]
+    for i in range(blocks):
+        endpoints += ["block%d/in" % i, "block%d/out" % i]
+    endpoints.append("playback_1")
+
+    chain = [(endpoints[i], endpoints[i+1]) for i in range(0, len(endpoints), 2)]
+    extra = [("capture_1", "block%d/in" % (i % blocks)) for i in range(1, max(0, arcs - len(chain)) + 1)] if blocks else []
+    connections = (chain + extra)[:max(arcs, 0)]
+
+    data = ""
+
+    for i, (tail, head) in enumerate(connections):
+        data += """_:b%d
+    ingen:tail <%s> ;
+    ingen:head <%s> .
+
+""" % (i + 1, tail, head)
+
+    for i in range(blocks):
+        data += """<block%d>
+    ingen:canvasX %d.0 ;
+    ingen:canvasY 400.0 ;
+    ingen:enabled true ;
+    ingen:polyphonic false ;
+    lv2:microVersion 0 ;
+    lv2:minorVersion 2 ;
+    mod:builderVersion 1 ;
+    mod:releaseNumber 0 ;
+    lv2:port <block%d/in> , <block%d/out> ;
+    lv2:prototype <%splugin%d> ;
+    pedal:instanceNumber %d ;
+    a ingen:Block .
+
+<block%d/in> a lv2:AudioPort , lv2:InputPort .
+<block%d/out> a lv2:AudioPort , lv2:OutputPort .
+
+""" % (i, 100 * i, i, i, PLUGIN_URI_PREFIX, i % max(1, plugins), i, i, i)
+
+    data += """<capture_1>
+    lv2:index 0 ;
+    lv2:name "Capture 1" ;
+    lv2:symbol "capture_1" ;
+    a lv2:AudioPort , lv2:InputPort .
+
+<playback_1>
+    lv2:index 1 ;
+    lv2:name "Playback 1" ;
+    lv2:symbol "playback_1" ;
+    a lv2:AudioPort , lv2:OutputPort .
+
+<>
+    doap:name "%s" ;
+    pedal:screenshot <screenshot.png> ;
+    pedal:thumbnail <thumbnail.png> ;
+    pedal:width 1920 ;
+    pedal:height 1080 ;%s%s
+    lv2:port <capture_1> , <playback_1> ;
+    a lv2:Plugin , ingen:Graph , pedal:Pedalboard .
+""" % (name,
+       ("\n    ingen:arc " + " , ".join("_:b%d" % (i + 1) for i in range(len(connections))) + " ;") if connections else "",
+       ("\n    ingen:block " + " , ".join("<block%d>" % i for i in range(blocks)) + " ;") if blocks else "")
+
+    write_file(os.path.join(bundle, name + ".ttl"), """@prefix doap:  <http://usefulinc.com/ns/doap#> .
+@prefix ingen: <http://drobilla.net/ns/ingen#> .
+@prefix lv2:   <http://lv2plug.in/ns/lv2core#> .
+@prefix mod:   <http://moddevices.com/ns/mod#> .
+@prefix pedal: <http://moddevices.com/ns/modpedal#> .
+
+""" + data)
+
+# Generate all bundles inside @a directory, plugins go in "plugins" and pedalboards in "pedalboards"
+def generate_bundles(directory, args):
+    for i in range(args.plugins):
+        generate_plugin_bundle(os.path.join(directory, "plugins", "plugin%d.lv2" % i), i,
+                               args.ports, args.scalepoints, args.presets, args.modgui)
+
+    for i in range(args.pedalboards):
+        generate_pedalboard_bundle(os.path.join(directory, "pedalboards", "Benchmark%d.pedalboard" % i), i,
+                                   args.blocks, args.arcs, args.plugins)
+
+def list_bundles(directory):
+    if not os.path.isdir(directory):
+        return []
+    return [os.path.join(directory, entry) + os.sep for entry in sorted(os.listdir(directory))]
+
+# ------------------------------------------------------------------------------------------------------------
+# Benchmarks, these run in a child process
+
+def get_peak_rss_kb():
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return maxrss // 1024 if sys.platform == "darwin" else maxrss
+
+def run_benchmark(name, directory, bulkPortsMin = None):
+    import lilvlib
+    import lilvlib.lilvlib
+    from lilvlib.lilvlib import PLUGIN_INFO_SECTIONS, PluginInfo
+
+    # compare bulk port reading against plain lilv
+    lilvlib.lilvlib.BULK_PORTS_MIN = bulkPortsMin
+
+    plugins     = list_bundles(os.path.join(directory, "plugins"))
+    pedalboards = list_bundles(os.path.join(directory, "pedalboards"))
+    phases      = {}
+    items       = 0
+
+    def add_phase(phase, start):
+        phases[phase] = phases.get(phase, 0.0) + time.perf_counter() - start
+
+    def loaded_world():
+        world = lilvlib.WorldPool()
+        for bundle in plugins:
+            world.add_bundle(bundle)
+        return world
+
+    start = time.perf_counter()
+
+    if name == 'get_plugins_info':
+        t = time.perf_counter()
+        world = lilvlib.WorldPool()
+        add_phase('world', t)
+        t = time.perf_counter()
+        items = len(lilvlib.get_plugins_info(plugins, world)) if plugins else 0
+        add_phase('extract', t)
+
+    elif name == 'get_plugin_info':
+        # same work as get_plugin_info, but timing each section on its own
+        world = loaded_world()
+        start = time.perf_counter()
+        for plugin in world.get_all_plugins():
+            info = PluginInfo(world, plugin, False)
+            for section, func, keys in PLUGIN_INFO_SECTIONS:
+                t = time.perf_counter()
+                info.load_section(section, func)
+                add_phase(section, t)
+            t = time.perf_counter()
+            info['errors']
+            add_phase('validation', t)
+            items += 1
+
+    elif name == 'plugin_has_modgui':
+        world = loaded_world()
+        start = time.perf_counter()
+        for plugin in world.get_all_plugins():
+            lilvlib.plugin_has_modgui(world, plugin)
+            items += 1
+
+    elif name in ('get_pedalboard_info', 'get_pedalboard_info_fast'):
+        for bundle in pedalboards:
+            lilvlib.get_pedalboard_info(bundle, None, name == 'get_pedalboard_info_fast')
+            items += 1
+
+    elif name == 'get_pedalboard_name':
+        for bundle in pedalboards:
+            lilvlib.get_pedalboard_name(bundle)
+            items += 1
+
+    else:
+        raise Exception('run_benchmark(%s) - unknown benchmark' % name)
+
+    return {
+        'wall'  : time.perf_counter() - start,
+        'phases': phases,
+        'items' : items,
+        'maxrss': get_peak_rss_kb(),
+    }
+
+# ------------------------------------------------------------------------------------------------------------
+# Main, runs each benchmark in a child process and collects the results
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle-1] + values[middle]) / 2
+
+def run_child(name, directory, bulkPortsMin = None):
+    command = [sys.executable, os.path.abspath(__file__), "--child", name, directory]
+    if bulkPortsMin is not None:
+        command += ["--bulk-ports-min", str(bulkPortsMin)]
+    output = subprocess.check_output(command)
+    return json.loads(output.decode("utf-8"))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lilvlib extraction using synthetic LV2 bundles")
+    parser.add_argument("--plugins", type=int, default=100, help="number of plugin bundles to generate")
+    parser.add_argument("--ports", type=int, default=16, help="number of control ports per plugin")
+    parser.add_argument("--scalepoints", type=int, default=4, help="number of scale points per control port")
+    parser.add_argument("--presets", type=int, default=8, help="number of presets per plugin")
+    parser.add_argument("--no-modgui", dest="modgui", action="store_false", help="do not generate modgui data")
+    parser.add_argument("--pedalboards", type=int, default=50, help="number of pedalboard bundles to generate")
+    parser.add_argument("--blocks", type=int, default=10, help="number of plugin blocks per pedalboard")
+    parser.add_argument("--arcs", type=int, default=20, help="number of connections per pedalboard")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs of each benchmark")
+    parser.add_argument("--only", action="append", choices=BENCHMARKS, help="benchmark to run (can be repeated)")
+    parser.add_argument("--directory", help="use (or generate, if empty) bundles in this directory and keep them")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--bulk-ports-min", type=int, default=None,
+                        help="read port data in bulk for plugins with at least this many ports (default: never)")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_benchmark(args.child[0], args.child[1], args.bulk_ports_min)))
+        return
+
+    directory = args.directory or tempfile.mkdtemp(prefix="lilvlib-benchmark-")
+
+    try:
+        if not os.path.isdir(directory) or not os.listdir(directory):
+            generate_bundles(directory, args)
+
+        results = {}
+
+        for name in args.only or BENCHMARKS:
+            runs = [run_child(name, directory, args.bulk_ports_min) for _ in range(max(1, args.repeat))]
+            wall = [run['wall'] for run in runs]
+
+            results[name] = {
+                'runs': len(runs),
+                'items': runs[0]['items'],
+                'wall': {
+                    'min'   : min(wall),
+                    'median': median(wall),
+                    'mean'  : sum(wall) / len(wall),
+                },
+                'phases': dict((phase, median([run['phases'].get(phase, 0.0) for run in runs]))
+                               for phase in runs[0]['phases']),
+                'maxrss_kb': max(run['maxrss'] for run in runs),
+            }
+
+    finally:
+        if args.directory is None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    import lilvlib
+
+    report = {
+        'lilvlib': lilvlib.__version__,
+        'python' : platform.python_version(),
+        'machine': platform.machine(),
+        'params' : {
+            'plugins'    : args.plugins,
+            'ports'      : args.ports,
+            'scalepoints': args.scalepoints,
+            'presets'    : args.presets,
+            'modgui'     : args.modgui,
+            'pedalboards': args.pedalboards,
+            'blocks'     : args.blocks,
+            'arcs'       : args.arcs,
+            'bulkPortsMin': args.bulk_ports_min,
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(report, fh, indent=4, sort_keys=True)
+    else:
+        print(json.dumps(report, indent=4, sort_keys=True))
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+
+# ------------------------------------------------------------------------------------------------------------
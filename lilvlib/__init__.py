@@ -1,5 +1,53 @@
-from lilvlib.lilvlib import (
-    get_pedalboard_info, get_pedalboard_name, plugin_has_modgui, get_plugin_info, get_plugins_info, get_bundle_dirname, NS
+import importlib as _importlib
+
+# everything is imported on first use, so modules that do not need lilv (like lilvlib.catalog) work without it
+_exports = {
+    'lilvlib.lilvlib': (
+        'get_pedalboard_info', 'get_pedalboard_name', 'plugin_has_modgui', 'get_plugin_info', 'get_plugins_info',
+        'get_bundle_dirname', 'NS', 'WorldPool', 'get_bundle_fingerprint', 'get_plugins_info_parallel',
+        'iter_plugins_info', 'iter_world_plugins_info', 'get_pedalboard_info_fast', 'get_pedalboards_info',
+        'PluginInfo', 'Vocabulary', 'get_vocabulary', 'get_plugins_summary',
+        'get_plugin_presets', 'get_preset_info', 'PresetIndex', 'ModguiResolver', 'plugins_have_modgui',
+    ),
+    'lilvlib.aio': (
+        'AsyncExtractor', 'aget_pedalboard_info', 'aget_pedalboard_name', 'aget_pedalboards_info', 'aget_plugins_info',
+        'aiter_plugins_info',
+    ),
+    'lilvlib.cache': ('PluginInfoCache',),
+    'lilvlib.client': ('LilvlibClient',),
+    'lilvlib.catalog': ('PluginCatalog', 'export_catalog', 'import_catalog'),
+    'lilvlib.dependencies': (
+        'get_pedalboards_dependencies', 'get_plugin_dependents', 'resolve_pedalboard_dependencies',
+    ),
+    'lilvlib.graph': ('PedalboardGraph', 'get_pedalboard_graph'),
+    'lilvlib.index': ('PluginIndex',),
+    'lilvlib.profiling': ('Profiler',),
+    'lilvlib.records': ('Interner', 'PluginRecord', 'PortRecord', 'compact_plugins_info'),
+    'lilvlib.scanner': ('BundleScanner',),
+    'lilvlib.validate': ('Validator',),
+    'lilvlib.validation': ('ValidationReport', 'register_plugin_check', 'register_plugin_rule'),
+}
+
+_modules = dict((name, module) for module, names in _exports.items() for name in names)
+
+# submodules are imported on first use too, like with 'import lilvlib; lilvlib.lilvlib.get_plugin_info'
+_submodules = (
+    'aio', 'cache', 'catalog', 'client', 'daemon', 'dependencies', 'graph', 'index', 'lilvlib', 'profiling',
+    'records', 'scanner', 'turtle', 'validate', 'validation',
 )
 
+__all__ = sorted(_modules)
+
 __version__ = '1.1.0'
+
+def __getattr__(name):
+    if name in _submodules:
+        return _importlib.import_module('lilvlib.' + name)
+    if name not in _modules:
+        raise AttributeError("module 'lilvlib' has no attribute '%s'" % name)
+    value = getattr(_importlib.import_module(_modules[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
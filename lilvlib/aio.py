@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# asyncio versions of the lilvlib calls, for use in asyncio servers
+# All the work runs in a bounded thread pool so the event loop keeps running during scans.
+# Each call uses its own lilv world, worlds are never shared between concurrent calls.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import asyncio
+import weakref
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from lilvlib.lilvlib import (
+    WorldPool, get_pedalboard_info, get_pedalboard_name, get_pedalboards_info, get_plugin_info, PLUGIN_INFO_FIELDS
+)
+
+# ------------------------------------------------------------------------------------------------------------
+# AsyncExtractor
+
+# Runs lilvlib calls in a thread pool of @a workers threads
+# @a concurrency is the maximum number of jobs queued or running at once, extra ones wait in the event loop.
+# Cancelling a call stops it at the next job boundary (each plugin is a job), a job that already started still
+# finishes in the background.
+class AsyncExtractor(object):
+    def __init__(self, workers = 2, concurrency = None):
+        self.executor    = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lilvlib")
+        self.concurrency = concurrency or workers
+
+        # asyncio semaphores belong to a single event loop, keep one per loop
+        self.semaphores = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # Run a function in the thread pool
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+
+        if loop not in self.semaphores:
+            self.semaphores[loop] = asyncio.Semaphore(self.concurrency)
+
+        async with self.semaphores[loop]:
+            return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def aget_pedalboard_info(self, bundle, fast = False, fields = None):
+        return await self.run(get_pedalboard_info, bundle, None, fast, fields)
+
+    async def aget_pedalboard_name(self, bundle, fast = False):
+        return await self.run(get_pedalboard_name, bundle, None, fast)
+
+    async def aget_pedalboards_info(self, dir_or_bundles, fields = None, fast = True):
+        return await self.run(get_pedalboards_info, dir_or_bundles, fields, None, fast)
+
+    # Async iterator version of iter_plugins_info, with the same arguments plus @a fields as in get_plugin_info
+    # @a onerror is called with the plugin uri and the exception when a plugin fails to be extracted.
+    async def aiter_plugins_info(self, bundles, useAbsolutePath = False, onerror = None, validate = True, fields = None):
+        if fields is not None and not set(fields).issubset(PLUGIN_INFO_FIELDS):
+            raise Exception('aiter_plugins_info() - unknown fields requested')
+
+        def load():
+            world = WorldPool()
+            for bundle in bundles:
+                world.add_bundle(bundle)
+            return world, world.get_bundles_plugins(bundles)
+
+        world, plugins = await self.run(load)
+
+        for plugin in plugins:
+            try:
+                info = await self.run(get_plugin_info, world, plugin, useAbsolutePath, fields, validate)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if onerror is not None:
+                    onerror(str(plugin.get_uri()), e)
+                continue
+
+            yield info
+
+    # Async version of get_plugins_info
+    async def aget_plugins_info(self, bundles, fields = None, validate = True):
+        # if empty, do nothing
+        if len(bundles) == 0:
+            raise Exception('aget_plugins_info() - no bundles provided')
+
+        # unlike aiter_plugins_info, a plugin that fails aborts the whole call
+        def onerror(uri, e):
+            raise e
+
+        infos = [info async for info in self.aiter_plugins_info(bundles, False, onerror, validate, fields)]
+
+        # make sure the bundles include something
+        if len(infos) == 0:
+            raise Exception('aget_plugins_info() - selected bundles have no plugins')
+
+        return infos
+
+# ------------------------------------------------------------------------------------------------------------
+# Module-level functions, using a shared AsyncExtractor
+
+_extractor = None
+
+def get_default_extractor():
+    global _extractor
+    if _extractor is None:
+        _extractor = AsyncExtractor()
+    return _extractor
+
+async def aget_pedalboard_info(bundle, fast = False, fields = None):
+    return await get_default_extractor().aget_pedalboard_info(bundle, fast, fields)
+
+async def aget_pedalboard_name(bundle, fast = False):
+    return await get_default_extractor().aget_pedalboard_name(bundle, fast)
+
+async def aget_pedalboards_info(dir_or_bundles, fields = None, fast = True):
+    return await get_default_extractor().aget_pedalboards_info(dir_or_bundles, fields, fast)
+
+async def aget_plugins_info(bundles, fields = None, validate = True):
+    return await get_default_extractor().aget_plugins_info(bundles, fields, validate)
+
+def aiter_plugins_info(bundles, useAbsolutePath = False, onerror = None, validate = True, fields = None):
+    return get_default_extractor().aiter_plugins_info(bundles, useAbsolutePath, onerror, validate, fields)
+
+# ------------------------------------------------------------------------------------------------------------
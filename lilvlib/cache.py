@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import json
+import os
+import sqlite3
+
+from lilvlib.lilvlib import WorldPool, bundle_abspath, get_bundle_fingerprint, get_plugin_info
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+# bump this whenever the contents of the plugin info change, so old caches get discarded
+CACHE_VERSION = "1"
+
+# ------------------------------------------------------------------------------------------------------------
+# PluginInfoCache
+
+# Persistent cache for get_plugin_info results, stored in a single SQLite file
+# Each bundle is stored together with the fingerprint of its ttl files (and of any other bundle its plugins
+# take data from), only bundles whose fingerprint changed since the last call are extracted again.
+class PluginInfoCache(object):
+    def __init__(self, filename):
+        self.filename = filename
+        self.db = sqlite3.connect(filename)
+
+        version = None
+        try:
+            row = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is not None:
+                version = row[0]
+        except sqlite3.DatabaseError:
+            pass
+
+        if version != CACHE_VERSION:
+            self.db.executescript("""
+                DROP TABLE IF EXISTS meta;
+                DROP TABLE IF EXISTS bundles;
+                DROP TABLE IF EXISTS plugins;
+                CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE bundles (bundle TEXT, absolute INTEGER, fingerprint TEXT, depends TEXT,
+                                      PRIMARY KEY (bundle, absolute));
+                CREATE TABLE plugins (bundle TEXT, absolute INTEGER, uri TEXT, info TEXT);
+                CREATE INDEX plugins_bundle ON plugins (bundle, absolute);
+            """)
+            self.db.execute("INSERT INTO meta VALUES ('version', ?)", (CACHE_VERSION,))
+            self.db.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def clear(self):
+        self.db.execute("DELETE FROM bundles")
+        self.db.execute("DELETE FROM plugins")
+        self.db.commit()
+
+    def remove_bundle(self, bundle):
+        bundle = bundle_abspath(bundle)
+        self.db.execute("DELETE FROM bundles WHERE bundle = ?", (bundle,))
+        self.db.execute("DELETE FROM plugins WHERE bundle = ?", (bundle,))
+        self.db.commit()
+
+    # Get the fingerprint of a bundle plus the bundles it depends on
+    def get_fingerprint(self, bundle, depends):
+        return ":".join(get_bundle_fingerprint(b) for b in [bundle] + depends)
+
+    # Get the cached plugin info of a bundle, or None if missing or outdated
+    def get_bundle_info(self, bundle, useAbsolutePath = False):
+        bundle = bundle_abspath(bundle)
+        row = self.db.execute("SELECT fingerprint, depends FROM bundles WHERE bundle = ? AND absolute = ?",
+                              (bundle, int(useAbsolutePath))).fetchone()
+
+        if row is None or row[0] != self.get_fingerprint(bundle, json.loads(row[1])):
+            return None
+
+        return [json.loads(r[0]) for r in self.db.execute("SELECT info FROM plugins WHERE bundle = ? AND absolute = ?",
+                                                          (bundle, int(useAbsolutePath)))]
+
+    # Store the plugin info of a bundle
+    # @a depends is a list of other bundles the info was taken from, as given by the plugin data uris.
+    def set_bundle_info(self, bundle, infos, depends = (), useAbsolutePath = False):
+        bundle  = bundle_abspath(bundle)
+        depends = sorted(set(bundle_abspath(b) for b in depends) - set((bundle,)))
+        absflag = int(useAbsolutePath)
+
+        self.db.execute("DELETE FROM plugins WHERE bundle = ? AND absolute = ?", (bundle, absflag))
+        self.db.execute("INSERT OR REPLACE INTO bundles VALUES (?, ?, ?, ?)",
+                        (bundle, absflag, self.get_fingerprint(bundle, depends), json.dumps(depends)))
+        self.db.executemany("INSERT INTO plugins VALUES (?, ?, ?, ?)",
+                            [(bundle, absflag, info['uri'], json.dumps(info, separators=(",",":"))) for info in infos])
+        self.db.commit()
+
+    # Cached version of get_plugins_info
+    # @a bundles is a list of strings, consisting of directories in the filesystem (absolute pathnames).
+    # @a world is an optional WorldPool to use when some bundles need to be extracted again.
+    def get_plugins_info(self, bundles, useAbsolutePath = False, world = None):
+        # if empty, do nothing
+        if len(bundles) == 0:
+            raise Exception('get_plugins_info() - no bundles provided')
+
+        bundles = [bundle_abspath(bundle) for bundle in bundles]
+        results = []
+        stale   = []
+
+        for bundle in bundles:
+            infos = self.get_bundle_info(bundle, useAbsolutePath)
+            if infos is None:
+                stale.append(bundle)
+            else:
+                results += infos
+
+        if len(stale) != 0:
+            if world is None:
+                world = WorldPool()
+
+            # reload outdated bundles, then load everything else so cross-bundle data is found like before
+            for bundle in stale:
+                world.remove_bundle(bundle)
+            for bundle in bundles:
+                world.add_bundle(bundle)
+
+            for bundle in stale:
+                infos   = []
+                depends = []
+
+                for plugin in world.get_bundle_plugins(bundle):
+                    infos.append(get_plugin_info(world, plugin, useAbsolutePath))
+                    for node in plugin.get_data_uris():
+                        depends.append(os.path.dirname(node.get_path()))
+
+                self.set_bundle_info(bundle, infos, depends, useAbsolutePath)
+                results += infos
+
+        # make sure the bundles include something
+        if len(results) == 0:
+            raise Exception('get_plugins_info() - selected bundles have no plugins')
+
+        # same order as lilv gives us
+        results.sort(key=lambda info: info['uri'])
+        return results
+
+# ------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Plugin catalog files, for reloading the results of get_plugins_info without lilv
+#
+# A catalog is a JSON-lines file:
+#  - a header, with the format name, version and number of plugins
+#  - a string table, with all strings (keys and values) that repeat across plugins
+#  - one line per plugin info, sorted by uri, where strings in the table are written as "@" plus their base36 index
+#    (strings that really start with "@" get an extra "@")
+#  - a footer, with the uri and byte offset of each plugin line
+# This module does not import lilv, so it can be used by processes that only need to read the catalog.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import json
+import mmap
+import os
+
+from collections.abc import Mapping
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+CATALOG_FORMAT  = "lilvlib-catalog"
+CATALOG_VERSION = 1
+
+# strings shorter than this are not worth a reference
+MIN_INTERNED_LENGTH = 3
+
+# ------------------------------------------------------------------------------------------------------------
+# Utilities
+
+BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def base36(number):
+    digits = ""
+    while True:
+        number, digit = divmod(number, 36)
+        digits = BASE36_DIGITS[digit] + digits
+        if number == 0:
+            return digits
+
+def count_strings(value, counts):
+    if isinstance(value, str):
+        counts[value] = counts.get(value, 0) + 1
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            counts[key] = counts.get(key, 0) + 1
+            count_strings(item, counts)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            count_strings(item, counts)
+
+def encode_value(value, refs):
+    if isinstance(value, str):
+        ref = refs.get(value)
+        if ref is not None:
+            return ref
+        return "@" + value if value.startswith("@") else value
+    if isinstance(value, dict):
+        return dict((encode_value(key, refs), encode_value(item, refs)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item, refs) for item in value]
+    return value
+
+def decode_value(value, strings):
+    if isinstance(value, str):
+        if not value.startswith("@"):
+            return value
+        if value.startswith("@@"):
+            return value[1:]
+        return strings[int(value[1:], 36)]
+    if isinstance(value, dict):
+        return dict((decode_value(key, strings), decode_value(item, strings)) for key, item in value.items())
+    if isinstance(value, list):
+        return [decode_value(item, strings) for item in value]
+    return value
+
+def dump_line(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",",":")).encode("utf-8") + b"\n"
+
+# ------------------------------------------------------------------------------------------------------------
+# export_catalog
+
+# Write a list of plugin info (as returned by get_plugins_info) into a catalog file
+# The file is written next to @a filename first and then moved into place, so readers never see it half-written.
+def export_catalog(filename, infos):
+    infos  = sorted(infos, key=lambda info: info['uri'])
+    counts = {}
+
+    for info in infos:
+        count_strings(info, counts)
+
+    # most used strings first, so they get the shortest references
+    strings = [s for s, count in sorted(counts.items(), key=lambda sc: (-sc[1], sc[0]))
+               if count > 1 and len(s) >= MIN_INTERNED_LENGTH]
+    refs    = dict((s, "@" + base36(i)) for i, s in enumerate(strings))
+
+    tmpfilename = filename + ".tmp"
+
+    with open(tmpfilename, 'wb') as fh:
+        fh.write(dump_line({ 'format': CATALOG_FORMAT, 'version': CATALOG_VERSION, 'count': len(infos) }))
+        fh.write(dump_line(strings))
+
+        uris    = []
+        offsets = []
+
+        for info in infos:
+            uris.append(info['uri'])
+            offsets.append(fh.tell())
+            fh.write(dump_line(encode_value(info, refs)))
+
+        fh.write(dump_line({ 'uris': uris, 'offsets': offsets }))
+
+    os.replace(tmpfilename, filename)
+
+# ------------------------------------------------------------------------------------------------------------
+# PluginCatalog
+
+# Read-only access to a catalog file, as a mapping of plugin uri to plugin info
+# The file is memory-mapped and each plugin is only decoded when accessed.
+class PluginCatalog(Mapping):
+    def __init__(self, filename):
+        self.filename = filename
+
+        with open(filename, 'rb') as fh:
+            self.data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            headerend = self.data.find(b"\n")
+            header    = json.loads(self.data[:headerend].decode("utf-8"))
+
+            if header.get('format') != CATALOG_FORMAT or header.get('version') != CATALOG_VERSION:
+                raise Exception('PluginCatalog(%s) - unsupported catalog format or version' % filename)
+
+            tableend     = self.data.find(b"\n", headerend + 1)
+            self.strings = json.loads(self.data[headerend+1:tableend].decode("utf-8"))
+
+            footerstart = self.data.rfind(b"\n", 0, len(self.data) - 1) + 1
+            footer      = json.loads(self.data[footerstart:].decode("utf-8"))
+
+        except ValueError:
+            self.close()
+            raise Exception('PluginCatalog(%s) - invalid catalog file' % filename)
+
+        self.uris    = footer['uris']
+        self.offsets = dict(zip(footer['uris'], footer['offsets']))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+
+    def __getitem__(self, uri):
+        offset = self.offsets[uri]
+        end    = self.data.find(b"\n", offset)
+        return decode_value(json.loads(self.data[offset:end].decode("utf-8")), self.strings)
+
+    def __iter__(self):
+        return iter(self.uris)
+
+    def __len__(self):
+        return len(self.uris)
+
+    def __contains__(self, uri):
+        return uri in self.offsets
+
+    # Get the info of all plugins, in the same format as get_plugins_info
+    def get_plugins_info(self):
+        return [self[uri] for uri in self.uris]
+
+# ------------------------------------------------------------------------------------------------------------
+# import_catalog
+
+# Read all plugin info from a catalog file, in the same format as get_plugins_info
+def import_catalog(filename):
+    with PluginCatalog(filename) as catalog:
+        return catalog.get_plugins_info()
+
+# ------------------------------------------------------------------------------------------------------------
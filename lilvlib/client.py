@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Client for the lilvlib daemon (see lilvlib.daemon for the protocol)
+# This module does not import lilv.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import json
+import os
+import socket
+import tempfile
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+# methods of LilvlibService that clients can call
+SERVICE_METHODS = (
+    'ping',
+    'list_plugins',
+    'get_plugin_info',
+    'get_plugins_info',
+    'get_pedalboard_info',
+    'get_pedalboard_name',
+    'rescan_bundle',
+    'remove_bundle',
+    'get_errors',
+)
+
+# clients that stay idle for longer than this are disconnected, so they do not block everyone else
+CLIENT_TIMEOUT = 30
+
+def get_default_socket_path():
+    return os.path.join(os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir()), "lilvlib.sock")
+
+# ------------------------------------------------------------------------------------------------------------
+# LilvlibClient
+
+# Client for a running LilvlibServer, does not need lilv
+# Each method of LilvlibService is available with the same name, errors are raised as exceptions.
+class LilvlibClient(object):
+    def __init__(self, socketPath = None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.sock.connect(socketPath or get_default_socket_path())
+        except OSError:
+            self.sock.close()
+            raise
+        self.file   = self.sock.makefile('rwb')
+        self.nextId = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self.sock is not None:
+            self.file.close()
+            self.sock.close()
+            self.sock = None
+
+    def call(self, method, **params):
+        self.nextId += 1
+
+        request = { 'id': self.nextId, 'method': method, 'params': params }
+        self.file.write(json.dumps(request, separators=(",",":")).encode("utf-8") + b"\n")
+        self.file.flush()
+
+        line = self.file.readline()
+        if not line:
+            raise Exception('LilvlibClient.call(%s) - connection closed by server' % method)
+
+        reply = json.loads(line.decode("utf-8"))
+
+        if 'error' in reply:
+            raise Exception('LilvlibClient.call(%s) - %s' % (method, reply['error']))
+
+        return reply['result']
+
+    def __getattr__(self, name):
+        if name not in SERVICE_METHODS:
+            raise AttributeError(name)
+        return lambda **params: self.call(name, **params)
+
+# ------------------------------------------------------------------------------------------------------------
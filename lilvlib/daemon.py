@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Resident lilvlib service, keeps a warm lilv world and the extracted info in memory and answers queries over a
+# Unix socket, so tools do not need to start Python, import lilv and scan bundles for every query.
+#
+# The protocol is JSON lines, each request is an object like:
+#   {"id": 1, "method": "get_plugin_info", "params": {"uri": "http://example.org/plugin"}}
+# and gets a single line as reply, with the same id plus either "result" or "error":
+#   {"id": 1, "result": {...}}
+#   {"id": 1, "error": "unknown plugin"}
+# A connection can send any number of requests, the server handles one connection at a time.
+#
+# Start the server with:
+#   lilvlib-daemon serve [--socket PATH] [--cache FILE] BUNDLE...
+# and query it from the shell with:
+#   lilvlib-daemon call get_plugin_info '{"uri": "http://example.org/plugin"}'
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+
+from lilvlib.cache import PluginInfoCache
+from lilvlib.client import CLIENT_TIMEOUT, SERVICE_METHODS, LilvlibClient, get_default_socket_path
+from lilvlib.lilvlib import (
+    WorldPool, bundle_abspath, get_bundle_fingerprint, get_pedalboard_info, get_plugin_info
+)
+
+# ------------------------------------------------------------------------------------------------------------
+# LilvlibService
+
+# The state kept by the daemon: a single lilv world with all known bundles loaded, the info of all their plugins,
+# and the info of recently requested pedalboards.
+# @a cacheFile is an optional PluginInfoCache file, so that restarting the daemon does not extract everything again.
+class LilvlibService(object):
+    def __init__(self, bundles = (), cacheFile = None):
+        self.world = WorldPool()
+        self.cache = PluginInfoCache(cacheFile) if cacheFile else None
+
+        # uri -> plugin info
+        self.plugins = {}
+        # bundle -> list of plugin uris
+        self.bundles = {}
+        # (bundle, fast) -> (fingerprint, pedalboard info)
+        self.pedalboards = {}
+        # bundle -> list of { 'uri', 'error' } for the plugins that failed to extract, uri is None if the whole
+        # bundle failed
+        self.errors = {}
+
+        if bundles:
+            self.load_bundles(bundles)
+
+    def close(self):
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    # Load and extract bundles, plugin data can span several bundles so all of them are loaded first
+    # Failures do not stop the other bundles or plugins from being loaded, they are kept in self.errors instead.
+    def load_bundles(self, bundles):
+        bundles = [bundle_abspath(bundle) for bundle in bundles]
+        loaded  = []
+
+        for bundle in bundles:
+            try:
+                self.world.add_bundle(bundle)
+            except Exception as e:
+                self.forget_bundle(bundle)
+                self.bundles[bundle] = []
+                self.errors[bundle]  = [{ 'uri': None, 'error': str(e) }]
+                continue
+            loaded.append(bundle)
+
+        for bundle in loaded:
+            self.extract_bundle(bundle)
+
+        return bundles
+
+    def extract_bundle(self, bundle):
+        self.forget_bundle(bundle)
+
+        infos = self.cache.get_bundle_info(bundle) if self.cache is not None else None
+
+        if infos is None:
+            infos   = []
+            depends = []
+            errors  = []
+
+            try:
+                plugins = self.world.get_bundle_plugins(bundle)
+            except Exception as e:
+                plugins = []
+                errors.append({ 'uri': None, 'error': str(e) })
+
+            for plugin in plugins:
+                try:
+                    infos.append(get_plugin_info(self.world, plugin, False))
+                except Exception as e:
+                    errors.append({ 'uri': str(plugin.get_uri()), 'error': str(e) })
+                    continue
+                for node in plugin.get_data_uris():
+                    depends.append(os.path.dirname(node.get_path()))
+
+            # bundles with errors are not cached, so they are tried again on the next start
+            if errors:
+                self.errors[bundle] = errors
+            elif self.cache is not None:
+                self.cache.set_bundle_info(bundle, infos, depends)
+
+        self.bundles[bundle] = [info['uri'] for info in infos]
+
+        for info in infos:
+            self.plugins[info['uri']] = info
+
+    # Protocol methods
+
+    def ping(self):
+        return "pong"
+
+    def list_plugins(self):
+        return sorted(self.plugins)
+
+    def get_plugin_info(self, uri):
+        try:
+            return self.plugins[uri]
+        except KeyError:
+            raise Exception('get_plugin_info(%s) - unknown plugin' % uri)
+
+    # Same as lilvlib.get_plugins_info, bundles that are not loaded yet get loaded and stay loaded
+    # Without @a bundles, the info of all known plugins is returned.
+    def get_plugins_info(self, bundles = None):
+        if bundles is None:
+            return [self.plugins[uri] for uri in sorted(self.plugins)]
+
+        # if empty, do nothing
+        if len(bundles) == 0:
+            raise Exception('get_plugins_info() - no bundles provided')
+
+        bundles = [bundle_abspath(bundle) for bundle in bundles]
+        missing = [bundle for bundle in bundles if bundle not in self.bundles]
+
+        if missing:
+            self.load_bundles(missing)
+
+        uris = sorted(set(uri for bundle in bundles for uri in self.bundles[bundle]))
+
+        # make sure the bundles include something
+        if len(uris) == 0:
+            raise Exception('get_plugins_info() - selected bundles have no plugins')
+
+        return [self.plugins[uri] for uri in uris]
+
+    # Pedalboards are kept until their ttl files change
+    def get_pedalboard_info(self, bundle, fast = True):
+        key         = (bundle_abspath(bundle), fast)
+        fingerprint = get_bundle_fingerprint(bundle)
+        cached      = self.pedalboards.get(key)
+
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        info = get_pedalboard_info(bundle, None if fast else self.world, fast)
+        self.pedalboards[key] = (fingerprint, info)
+        return info
+
+    def get_pedalboard_name(self, bundle, fast = True):
+        return self.get_pedalboard_info(bundle, fast)['name']
+
+    # Extract a bundle again after it changed on disk, or forget about it if it was removed
+    # Returns the uris of the plugins now in the bundle, plugins that failed to extract are in get_errors.
+    def rescan_bundle(self, bundle):
+        bundle = bundle_abspath(bundle)
+
+        if not os.path.exists(os.path.join(bundle, "manifest.ttl")):
+            self.remove_bundle(bundle)
+            return []
+
+        self.world.remove_bundle(bundle)
+
+        if self.cache is not None:
+            self.cache.remove_bundle(bundle)
+
+        self.load_bundles((bundle,))
+        return self.bundles[bundle]
+
+    # Forget the plugins and errors of a bundle, the bundle stays loaded in the world
+    def forget_bundle(self, bundle):
+        for uri in self.bundles.pop(bundle, ()):
+            self.plugins.pop(uri, None)
+
+        self.errors.pop(bundle, None)
+
+    def remove_bundle(self, bundle):
+        bundle = bundle_abspath(bundle)
+
+        self.forget_bundle(bundle)
+
+        for key in [key for key in self.pedalboards if key[0] == bundle]:
+            del self.pedalboards[key]
+
+        if self.cache is not None:
+            self.cache.remove_bundle(bundle)
+
+        return self.world.remove_bundle(bundle)
+
+    # Get the extraction errors, as a dictionary of bundle -> list of { 'uri', 'error' }
+    # With @a bundle, only the errors of that bundle are returned (an empty list if it has none).
+    def get_errors(self, bundle = None):
+        if bundle is None:
+            return self.errors
+
+        return self.errors.get(bundle_abspath(bundle), [])
+
+    # Run a single protocol request, returns the reply
+    def handle_request(self, request):
+        reply = {}
+
+        if isinstance(request, dict) and 'id' in request:
+            reply['id'] = request['id']
+
+        try:
+            if not isinstance(request, dict):
+                raise Exception('invalid request')
+
+            method = request.get('method')
+            params = request.get('params') or {}
+
+            if method not in SERVICE_METHODS:
+                raise Exception('unknown method %s' % method)
+            if not isinstance(params, dict):
+                raise Exception('params must be an object')
+
+            reply['result'] = getattr(self, method)(**params)
+
+        except Exception as e:
+            reply['error'] = str(e)
+
+        return reply
+
+# ------------------------------------------------------------------------------------------------------------
+# LilvlibServer
+
+class LilvlibRequestHandler(socketserver.StreamRequestHandler):
+    timeout = CLIENT_TIMEOUT
+
+    def handle(self):
+        while True:
+            try:
+                line = self.rfile.readline()
+            except socket.timeout:
+                break
+
+            if not line:
+                break
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line.decode("utf-8"))
+            except ValueError:
+                request = None
+
+            reply = self.server.service.handle_request(request)
+
+            try:
+                self.wfile.write(json.dumps(reply, separators=(",",":")).encode("utf-8") + b"\n")
+                self.wfile.flush()
+            except OSError:
+                break
+
+# Unix socket server for a LilvlibService
+# lilv is not thread-safe, so connections are handled one at a time.
+class LilvlibServer(socketserver.UnixStreamServer):
+    def __init__(self, socketPath, service):
+        self.socketPath = socketPath
+        self.service    = service
+
+        # remove stale sockets from a previous run, but never steal one that is still in use
+        if os.path.exists(socketPath):
+            if not stat.S_ISSOCK(os.stat(socketPath).st_mode):
+                raise Exception('LilvlibServer(%s) - path exists and is not a socket' % socketPath)
+            try:
+                LilvlibClient(socketPath).close()
+            except OSError:
+                os.unlink(socketPath)
+            else:
+                raise Exception('LilvlibServer(%s) - another server is already running' % socketPath)
+
+        socketserver.UnixStreamServer.__init__(self, socketPath, LilvlibRequestHandler)
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if os.path.exists(self.socketPath):
+            os.unlink(self.socketPath)
+
+# ------------------------------------------------------------------------------------------------------------
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Resident lilvlib service over a Unix socket")
+    parser.add_argument("--socket", default=get_default_socket_path(), help="path of the Unix socket")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve = subparsers.add_parser("serve", help="run the server")
+    serve.add_argument("--cache", help="PluginInfoCache file to keep extracted info between runs")
+    serve.add_argument("bundles", nargs="*", help="bundles to load on startup")
+
+    call = subparsers.add_parser("call", help="send a single request to a running server and print the result")
+    call.add_argument("method", choices=SERVICE_METHODS)
+    call.add_argument("params", nargs="?", default="{}", help="request params, as a JSON object")
+
+    args = parser.parse_args()
+
+    if args.command == "call":
+        with LilvlibClient(args.socket) as client:
+            try:
+                result = client.call(args.method, **json.loads(args.params))
+            except Exception as e:
+                sys.exit(str(e))
+        print(json.dumps(result, indent=4, sort_keys=True))
+        return
+
+    # turn SIGTERM into a normal exit, so the socket gets removed
+    def terminate(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, terminate)
+
+    service = LilvlibService(args.bundles, args.cache)
+    server  = LilvlibServer(args.socket, service)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+
+# ------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Check which plugins used by pedalboards are missing or outdated, against already extracted plugin info
+# The installed plugins can be anything with the plugin info by uri: a list of get_plugins_info results, a
+# PluginCatalog, a PluginIndex, or a list of PluginRecords. Plugin info is never extracted again here.
+# This module does not import lilv (except for get_pedalboards_dependencies).
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+from collections.abc import Mapping
+
+# ------------------------------------------------------------------------------------------------------------
+# Utilities
+
+# Get a field of a plugin info, works for both dictionaries and PluginRecords
+def get_info_field(info, field, fallback = None):
+    if isinstance(info, Mapping):
+        return info.get(field, fallback)
+    return getattr(info, field, fallback)
+
+# Turn a list of plugin info into something that can be looked up by uri
+def get_installed_lookup(installed):
+    if isinstance(installed, (list, tuple)):
+        return dict((get_info_field(info, 'uri'), info) for info in installed)
+    return installed
+
+# Get the version of a plugin as a tuple that can be compared
+# minorVersion and microVersion are always used, builder and release only when the installed info has them.
+def get_version_key(info, installed):
+    key = (get_info_field(info, 'minorVersion', 0), get_info_field(info, 'microVersion', 0))
+
+    for field in ('release', 'builder'):
+        if get_info_field(installed, field) is not None:
+            key += (get_info_field(info, field, 0),)
+
+    return key
+
+# ------------------------------------------------------------------------------------------------------------
+# resolve_pedalboard_dependencies
+
+# Check the plugins of already read pedalboards against the installed plugins
+# @a pedalboards is a dictionary of bundle -> pedalboard info (as returned by get_pedalboards_info, only the
+# 'plugins' field is needed).
+# Returns a dictionary of bundle -> { 'missing': [uri...], 'outdated': [{ 'uri', 'instance', 'required',
+# 'installed' }...] }, with versions as in get_version_key. Pedalboards using only installed plugins are included too,
+# with empty lists.
+def resolve_pedalboard_dependencies(pedalboards, installed):
+    installed = get_installed_lookup(installed)
+
+    # each plugin is looked up only once, even if used by many pedalboards (PluginCatalog decodes on every access)
+    plugins = {}
+
+    def get_installed(uri):
+        if uri not in plugins:
+            plugins[uri] = installed[uri] if uri in installed else None
+        return plugins[uri]
+
+    results = {}
+
+    for bundle, info in pedalboards.items():
+        missing  = []
+        outdated = []
+
+        for plugin in info['plugins']:
+            uri   = plugin['uri']
+            found = get_installed(uri)
+
+            if found is None:
+                if uri not in missing:
+                    missing.append(uri)
+                continue
+
+            required = get_version_key(plugin, found)
+            current  = get_version_key(found, found)
+
+            if current < required:
+                outdated.append({
+                    'uri'      : uri,
+                    'instance' : plugin['instance'],
+                    'required' : required,
+                    'installed': current,
+                })
+
+        results[bundle] = {
+            'missing' : sorted(missing),
+            'outdated': outdated,
+        }
+
+    return results
+
+# Get the pedalboards using each plugin, as a dictionary of plugin uri -> sorted list of bundles
+# Answers "which pedalboards break if this plugin is removed" with a single lookup.
+def get_plugin_dependents(pedalboards):
+    dependents = {}
+
+    for bundle, info in pedalboards.items():
+        for plugin in info['plugins']:
+            if plugin['uri'] not in dependents:
+                dependents[plugin['uri']] = set()
+            dependents[plugin['uri']].add(bundle)
+
+    return dict((uri, sorted(bundles)) for uri, bundles in dependents.items())
+
+# ------------------------------------------------------------------------------------------------------------
+# get_pedalboards_dependencies
+
+# Read many pedalboards (plugins only) and check them against the installed plugins in a single pass
+# @a dir_or_bundles, @a world and @a fast are the same as in get_pedalboards_info.
+# Returns a tuple of 2 dictionaries, results (see resolve_pedalboard_dependencies) and error message by bundle.
+def get_pedalboards_dependencies(dir_or_bundles, installed, world = None, fast = True):
+    from lilvlib.lilvlib import get_pedalboards_info
+
+    pedalboards, errors = get_pedalboards_info(dir_or_bundles, ('plugins',), world, fast)
+    return resolve_pedalboard_dependencies(pedalboards, installed), errors
+
+# ------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Graph view of a pedalboard, built from the 'plugins' and 'connections' of get_pedalboard_info
+# Connection paths are "instance/symbol" for plugin ports and just a name (like "capture_1") for hardware ports.
+# Adjacency is computed once, so the signal path queries below do not need to go through the connections again.
+# This module does not import lilv (except for get_pedalboard_graph).
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+from collections import deque
+from heapq import heappop, heappush
+
+# ------------------------------------------------------------------------------------------------------------
+# Utilities
+
+# Split a connection path into its node (plugin instance or hardware port) and port symbol (None for hardware)
+def split_port_path(path):
+    if "/" in path:
+        instance, symbol = path.split("/", 1)
+        return instance, symbol
+    return path, None
+
+# ------------------------------------------------------------------------------------------------------------
+# PedalboardGraph
+
+class PedalboardGraph(object):
+    def __init__(self, plugins, connections):
+        # instance -> plugin info, in pedalboard order
+        self.plugins = dict((plugin['instance'], plugin) for plugin in plugins)
+        # hardware ports used as a source (capture) or target (playback)
+        self.hardwareInputs  = set()
+        self.hardwareOutputs = set()
+        # node -> list of connections (source, target), with the full paths
+        self.inputs  = dict((instance, []) for instance in self.plugins)
+        self.outputs = dict((instance, []) for instance in self.plugins)
+        # node -> set of nodes, hardware ports included
+        self.successors   = dict((instance, set()) for instance in self.plugins)
+        self.predecessors = dict((instance, set()) for instance in self.plugins)
+
+        for connection in connections:
+            source, target = connection['source'], connection['target']
+            sourceNode, sourceSymbol = split_port_path(source)
+            targetNode, targetSymbol = split_port_path(target)
+
+            if sourceSymbol is None:
+                self.hardwareInputs.add(sourceNode)
+            if targetSymbol is None:
+                self.hardwareOutputs.add(targetNode)
+
+            for node in (sourceNode, targetNode):
+                if node not in self.successors:
+                    self.inputs[node]       = []
+                    self.outputs[node]      = []
+                    self.successors[node]   = set()
+                    self.predecessors[node] = set()
+
+            self.outputs[sourceNode].append((source, target))
+            self.inputs[targetNode].append((source, target))
+            self.successors[sourceNode].add(targetNode)
+            self.predecessors[targetNode].add(sourceNode)
+
+    # Build a graph from the result of get_pedalboard_info
+    @classmethod
+    def from_info(cls, info):
+        return cls(info['plugins'], info['connections'])
+
+    def is_hardware(self, node):
+        return node not in self.plugins
+
+    # Get all nodes reachable from @a starts following @a adjacency, not including the starts themselves
+    def walk(self, starts, adjacency):
+        seen  = set()
+        queue = deque(starts)
+
+        while queue:
+            for node in adjacency.get(queue.popleft(), ()):
+                if node not in seen:
+                    seen.add(node)
+                    queue.append(node)
+
+        return seen
+
+    # Plugin instances that get signal from any hardware input
+    def get_reachable_from_inputs(self):
+        return set(node for node in self.walk(self.hardwareInputs, self.successors) if node in self.plugins)
+
+    # Plugin instances whose signal gets to any hardware output
+    def get_reaching_outputs(self):
+        return set(node for node in self.walk(self.hardwareOutputs, self.predecessors) if node in self.plugins)
+
+    # Plugin instances without any connection
+    def get_disconnected(self):
+        return [instance for instance in self.plugins if not self.inputs[instance] and not self.outputs[instance]]
+
+    # Plugin instances whose signal never gets to a hardware output (disconnected ones included)
+    def get_orphans(self):
+        reaching = self.get_reaching_outputs()
+        return [instance for instance in self.plugins if instance not in reaching]
+
+    # Get the groups of plugin instances that feed back into themselves, each sorted by instance
+    # Uses Tarjan's strongly connected components algorithm, without recursion so big pedalboards are fine.
+    def get_feedback_loops(self):
+        index    = {}
+        lowlink  = {}
+        onstack  = set()
+        stack    = []
+        loops    = []
+        counter  = 0
+
+        for root in self.plugins:
+            if root in index:
+                continue
+
+            work = [(root, iter(sorted(self.successors[root])))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            onstack.add(root)
+
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+
+                if child is not None:
+                    if child not in self.plugins:
+                        continue
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        onstack.add(child)
+                        work.append((child, iter(sorted(self.successors[child]))))
+                    elif child in onstack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                    continue
+
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] != index[node]:
+                    continue
+
+                component = []
+                while True:
+                    member = stack.pop()
+                    onstack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+
+                if len(component) > 1 or node in self.successors[node]:
+                    loops.append(sorted(component))
+
+        return sorted(loops)
+
+    def has_feedback(self):
+        return len(self.get_feedback_loops()) != 0
+
+    # Get the plugin instances sorted so that each one comes after everything that feeds it
+    # Instances with no order between them keep the pedalboard order.
+    def get_topological_order(self):
+        positions = dict((instance, i) for i, instance in enumerate(self.plugins))
+        pending   = dict((instance, len([n for n in self.predecessors[instance] if n in self.plugins]))
+                         for instance in self.plugins)
+        ready     = [positions[instance] for instance in self.plugins if pending[instance] == 0]
+        instances = list(self.plugins)
+        order     = []
+
+        while ready:
+            instance = instances[heappop(ready)]
+            order.append(instance)
+
+            for node in self.successors[instance]:
+                if node not in self.plugins:
+                    continue
+                pending[node] -= 1
+                if pending[node] == 0:
+                    heappush(ready, positions[node])
+
+        if len(order) != len(self.plugins):
+            raise Exception('PedalboardGraph.get_topological_order() - pedalboard has feedback loops')
+
+        return order
+
+# ------------------------------------------------------------------------------------------------------------
+# get_pedalboard_graph
+
+# Get the graph of a pedalboard bundle, only the plugins and connections are read
+# @a world and @a fast are the same as in get_pedalboard_info.
+def get_pedalboard_graph(bundle, world = None, fast = True):
+    from lilvlib.lilvlib import get_pedalboard_info
+
+    return PedalboardGraph.from_info(get_pedalboard_info(bundle, world, fast, ('plugins', 'connections')))
+
+# ------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# In-memory index of plugin info, for plugin browsers and other code that repeatedly looks plugins up
+# Built from the results of get_plugins_info (or a PluginCatalog), every lookup by uri is a dictionary access and
+# every filter is an intersection of precomputed sets, instead of a scan of the full plugin list.
+# This module does not import lilv.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import re
+
+from bisect import bisect_left
+from collections.abc import Mapping
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+# port types and directions that get counted, as in the 'ports' of get_plugin_info
+INDEXED_PORT_TYPES = ('audio', 'control', 'cv', 'midi')
+INDEXED_PORT_DIRS  = ('input', 'output')
+
+# fields used for text search
+INDEXED_TEXT_FIELDS = ('name', 'label', 'comment', 'brand')
+
+WORD_REGEX = re.compile(r"\w+")
+
+# ------------------------------------------------------------------------------------------------------------
+# Utilities
+
+def get_words(text):
+    return set(WORD_REGEX.findall(text.lower())) if text else set()
+
+# Get the number of ports of each type and direction, as a dictionary of (type, direction) -> count
+def get_port_counts(info):
+    ports = info.get('ports', {})
+    return dict(((typ, direction), len(ports.get(typ, {}).get(direction, ())))
+                for typ in INDEXED_PORT_TYPES for direction in INDEXED_PORT_DIRS)
+
+def add_to_set(table, key, uri):
+    if key not in table:
+        table[key] = set()
+    table[key].add(uri)
+
+def remove_from_set(table, key, uri):
+    uris = table.get(key)
+    if uris is None:
+        return
+    uris.discard(uri)
+    if not uris:
+        del table[key]
+
+# ------------------------------------------------------------------------------------------------------------
+# PluginIndex
+
+# Index of plugin info, by uri plus sets of uris for each category, brand, stability, port count and word
+# Plugins can be added and removed at any time, for example from the results of a BundleScanner.
+# @a infos is a list of plugin info, or a mapping of uri -> plugin info (like a PluginCatalog).
+class PluginIndex(object):
+    def __init__(self, infos = ()):
+        self.plugins     = {}
+        self.categories  = {}
+        self.brands      = {}
+        self.stabilities = {}
+        self.modguis     = { True: set(), False: set() }
+        # (type, direction) -> count -> uris
+        self.portcounts  = dict(((typ, direction), {})
+                                for typ in INDEXED_PORT_TYPES for direction in INDEXED_PORT_DIRS)
+        # word -> uris, plus a sorted list of all words for prefix search (built on first search)
+        self.words       = {}
+        self.sortedwords = None
+
+        if isinstance(infos, Mapping):
+            infos = infos.values()
+
+        for info in infos:
+            self.add(info)
+
+    def __len__(self):
+        return len(self.plugins)
+
+    def __contains__(self, uri):
+        return uri in self.plugins
+
+    def __iter__(self):
+        return iter(self.plugins)
+
+    def __getitem__(self, uri):
+        return self.plugins[uri]
+
+    def get(self, uri, default = None):
+        return self.plugins.get(uri, default)
+
+    # Add a plugin info, replacing any previous one with the same uri
+    def add(self, info):
+        uri = info['uri']
+
+        if uri in self.plugins:
+            self.remove(uri)
+
+        self.plugins[uri] = info
+
+        for category in info.get('category', ()):
+            add_to_set(self.categories, category, uri)
+
+        add_to_set(self.brands, info.get('brand', ""), uri)
+        add_to_set(self.stabilities, info.get('stability', ""), uri)
+        self.modguis[bool(info.get('gui'))].add(uri)
+
+        for key, count in get_port_counts(info).items():
+            add_to_set(self.portcounts[key], count, uri)
+
+        for word in self.get_plugin_words(info):
+            if word not in self.words:
+                self.sortedwords = None
+            add_to_set(self.words, word, uri)
+
+    def remove(self, uri):
+        info = self.plugins.pop(uri, None)
+
+        if info is None:
+            return False
+
+        for category in info.get('category', ()):
+            remove_from_set(self.categories, category, uri)
+
+        remove_from_set(self.brands, info.get('brand', ""), uri)
+        remove_from_set(self.stabilities, info.get('stability', ""), uri)
+        self.modguis[bool(info.get('gui'))].discard(uri)
+
+        for key, count in get_port_counts(info).items():
+            remove_from_set(self.portcounts[key], count, uri)
+
+        for word in self.get_plugin_words(info):
+            remove_from_set(self.words, word, uri)
+            if word not in self.words:
+                self.sortedwords = None
+
+        return True
+
+    def get_plugin_words(self, info):
+        words = set()
+        for field in INDEXED_TEXT_FIELDS:
+            words |= get_words(info.get(field))
+        return words
+
+    # Values present in the index, for filling filter menus
+    def get_categories(self):
+        return sorted(self.categories)
+
+    def get_brands(self):
+        return sorted(self.brands)
+
+    def get_stabilities(self):
+        return sorted(self.stabilities)
+
+    # Get the uris of plugins whose name, label, comment or brand has words starting with each word of @a text
+    def search(self, text):
+        if self.sortedwords is None:
+            self.sortedwords = sorted(self.words)
+
+        result = None
+
+        for prefix in get_words(text):
+            uris  = set()
+            start = bisect_left(self.sortedwords, prefix)
+
+            for word in self.sortedwords[start:]:
+                if not word.startswith(prefix):
+                    break
+                uris |= self.words[word]
+
+            result = uris if result is None else result & uris
+
+            if not result:
+                break
+
+        return set(self.plugins) if result is None else result
+
+    # Get the uris of plugins whose number of ports of @a typ and @a direction is @a count
+    # @a count can be a number or a (minimum, maximum) tuple, where None means no limit.
+    def get_port_count_uris(self, typ, direction, count):
+        counts = self.portcounts[(typ, direction)]
+
+        if not isinstance(count, tuple):
+            return counts.get(count, set())
+
+        minimum, maximum = count
+        uris = set()
+
+        for value, valueuris in counts.items():
+            if minimum is not None and value < minimum:
+                continue
+            if maximum is not None and value > maximum:
+                continue
+            uris |= valueuris
+
+        return uris
+
+    # Get the info of all plugins matching every given filter, sorted by uri
+    # @a ports is a dictionary of (type, direction) -> count, see get_port_count_uris.
+    # @a text is a search string, see search.
+    def filter(self, category = None, brand = None, stability = None, hasModgui = None, ports = None, text = None):
+        sets = []
+
+        if category is not None:
+            sets.append(self.categories.get(category, set()))
+        if brand is not None:
+            sets.append(self.brands.get(brand, set()))
+        if stability is not None:
+            sets.append(self.stabilities.get(stability, set()))
+        if hasModgui is not None:
+            sets.append(self.modguis[bool(hasModgui)])
+        if ports is not None:
+            for (typ, direction), count in ports.items():
+                sets.append(self.get_port_count_uris(typ, direction, count))
+        if text:
+            sets.append(self.search(text))
+
+        if len(sets) == 0:
+            uris = self.plugins.keys()
+        else:
+            sets.sort(key=len)
+            uris = sets[0].intersection(*sets[1:])
+
+        return [self.plugins[uri] for uri in sorted(uris)]
+
+# ------------------------------------------------------------------------------------------------------------
@@ -4,10 +4,19 @@
 # ------------------------------------------------------------------------------------------------------------
 # Imports
 
+import hashlib
 import json
 import lilv
 import os
 
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from lilvlib.profiling import profile_phase
+from lilvlib.validation import ValidationReport
+from lilvlib.turtle import (
+    BlankNode, Graph, Literal, PREFIX_XSD, TurtleError, URIRef, file_uri, parse_turtle_file, sort_nodes
+)
 from math import fmod
 
 # ------------------------------------------------------------------------------------------------------------
@@ -19,6 +28,11 @@ PREFIX_MOD      = "http://moddevices.com/ns/mod#"
 PREFIX_MODGUI   = "http://moddevices.com/ns/modgui#"
 PREFIX_MODPEDAL = "http://moddevices.com/ns/modpedal#"
 
+# all the keys returned by get_pedalboard_info
+PEDALBOARD_INFO_FIELDS = (
+    'name', 'uri', 'author', 'unit', 'hardware', 'size', 'screenshot', 'thumbnail', 'connections', 'plugins'
+)
+
 # ------------------------------------------------------------------------------------------------------------
 # Utilities
 
@@ -35,6 +49,39 @@ class NS(object):
             self._cache[attr] = self.world.new_uri(self.base + attr)
         return self._cache[attr]
 
+# All the namespaces lilvlib uses, created once per world so their uri nodes are reused across calls
+class Vocabulary(object):
+    def __init__(self, world):
+        self.rdf      = NS(world, lilv.LILV_NS_RDF)
+        self.rdfs     = NS(world, lilv.LILV_NS_RDFS)
+        self.lv2core  = NS(world, lilv.LILV_NS_LV2)
+        self.doap     = NS(world, lilv.LILV_NS_DOAP)
+        self.foaf     = NS(world, lilv.LILV_NS_FOAF)
+        self.atom     = NS(world, "http://lv2plug.in/ns/ext/atom#")
+        self.midi     = NS(world, "http://lv2plug.in/ns/ext/midi#")
+        self.morph    = NS(world, "http://lv2plug.in/ns/ext/morph#")
+        self.pprops   = NS(world, "http://lv2plug.in/ns/ext/port-props#")
+        self.pset     = NS(world, "http://lv2plug.in/ns/ext/presets#")
+        self.state    = NS(world, "http://lv2plug.in/ns/ext/state#")
+        self.units    = NS(world, "http://lv2plug.in/ns/extensions/units#")
+        self.ingen    = NS(world, PREFIX_INGEN)
+        self.mod      = NS(world, PREFIX_MOD)
+        self.modgui   = NS(world, PREFIX_MODGUI)
+        self.modpedal = NS(world, PREFIX_MODPEDAL)
+
+# Get the Vocabulary of a world (lilv world or WorldPool), created on first use and kept in the world itself
+def get_vocabulary(world):
+    vocabulary = getattr(world, 'lilvlib_vocabulary', None)
+
+    if vocabulary is None:
+        vocabulary = Vocabulary(world)
+        try:
+            world.lilvlib_vocabulary = vocabulary
+        except AttributeError:
+            pass
+
+    return vocabulary
+
 def is_integer(string):
     return string.strip().lstrip("-+").isdigit()
 
@@ -79,99 +126,143 @@ def get_short_port_name(portName):
 
     return portName.strip()
 
+# Get the stability of a plugin from its version
+def get_stability(minorVersion, microVersion):
+    # 0.x is experimental
+    if minorVersion == 0:
+        return "experimental"
+
+    # odd x.2 or 2.x is testing/development
+    if minorVersion % 2 != 0 or microVersion % 2 != 0:
+        return "testing"
+
+    # otherwise it's stable
+    return "stable"
+
+# Get the brand to use for plugins without mod:brand, taken from the author name
+def get_default_brand(authorName):
+    brand = authorName.split(" - ",1)[0].split(" ",1)[0]
+    brand = brand.rstrip(",").rstrip(";")
+    return brand[:16]
+
+# Get the label to use for plugins without mod:label, taken from the plugin name
+def get_default_label(name, bundle):
+    if len(name) <= 24:
+        return name
+
+    labels = name.split(" - ",1)[0].split(" ")
+    if labels[0].lower() in bundle.lower() and len(labels) > 1 and not labels[1].startswith(("(","[")):
+        label = labels[1]
+    else:
+        label = labels[0]
+
+    return label[:24]
+
 # ------------------------------------------------------------------------------------------------------------
 
+# lv2 plugin class -> categories
+LV2_CATEGORY_INDEXES = {
+    'DelayPlugin': ['Delay'],
+    'DistortionPlugin': ['Distortion'],
+    'WaveshaperPlugin': ['Distortion', 'Waveshaper'],
+    'DynamicsPlugin': ['Dynamics'],
+    'AmplifierPlugin': ['Dynamics', 'Amplifier'],
+    'CompressorPlugin': ['Dynamics', 'Compressor'],
+    'ExpanderPlugin': ['Dynamics', 'Expander'],
+    'GatePlugin': ['Dynamics', 'Gate'],
+    'LimiterPlugin': ['Dynamics', 'Limiter'],
+    'FilterPlugin': ['Filter'],
+    'AllpassPlugin': ['Filter', 'Allpass'],
+    'BandpassPlugin': ['Filter', 'Bandpass'],
+    'CombPlugin': ['Filter', 'Comb'],
+    'EQPlugin': ['Filter', 'Equaliser'],
+    'MultiEQPlugin': ['Filter', 'Equaliser', 'Multiband'],
+    'ParaEQPlugin': ['Filter', 'Equaliser', 'Parametric'],
+    'HighpassPlugin': ['Filter', 'Highpass'],
+    'LowpassPlugin': ['Filter', 'Lowpass'],
+    'GeneratorPlugin': ['Generator'],
+    'ConstantPlugin': ['Generator', 'Constant'],
+    'InstrumentPlugin': ['Generator', 'Instrument'],
+    'OscillatorPlugin': ['Generator', 'Oscillator'],
+    'ModulatorPlugin': ['Modulator'],
+    'ChorusPlugin': ['Modulator', 'Chorus'],
+    'FlangerPlugin': ['Modulator', 'Flanger'],
+    'PhaserPlugin': ['Modulator', 'Phaser'],
+    'ReverbPlugin': ['Reverb'],
+    'SimulatorPlugin': ['Simulator'],
+    'SpatialPlugin': ['Spatial'],
+    'SpectralPlugin': ['Spectral'],
+    'PitchPlugin': ['Spectral', 'Pitch Shifter'],
+    'UtilityPlugin': ['Utility'],
+    'AnalyserPlugin': ['Utility', 'Analyser'],
+    'ConverterPlugin': ['Utility', 'Converter'],
+    'FunctionPlugin': ['Utility', 'Function'],
+    'MixerPlugin': ['Utility', 'Mixer'],
+    #'MIDIPlugin': ['MIDI', 'Utility'],
+}
+
+# mod plugin class -> categories, these take precedence over the lv2 ones
+MOD_CATEGORY_INDEXES = {
+    'DelayPlugin': ['Delay'],
+    'DistortionPlugin': ['Distortion'],
+    'DynamicsPlugin': ['Dynamics'],
+    'FilterPlugin': ['Filter'],
+    'GeneratorPlugin': ['Generator'],
+    'ModulatorPlugin': ['Modulator'],
+    'ReverbPlugin': ['Reverb'],
+    'SimulatorPlugin': ['Simulator'],
+    'SpatialPlugin': ['Spatial'],
+    'SpectralPlugin': ['Spectral'],
+    'UtilityPlugin': ['Utility'],
+    'MIDIPlugin': ['Utility', 'MIDI'],
+    'ControlVoltagePlugin': ['ControlVoltage'],
+}
+
+# full uri -> categories, so plugin types can be looked up directly
+LV2_CATEGORY_URIS = dict((PREFIX_LV2CORE + name, cats) for name, cats in LV2_CATEGORY_INDEXES.items())
+MOD_CATEGORY_URIS = dict((PREFIX_MOD + name, cats) for name, cats in MOD_CATEGORY_INDEXES.items())
+
 def get_category(nodes):
     if nodes is None:
         return []
 
-    lv2_category_indexes = {
-        'DelayPlugin': ['Delay'],
-        'DistortionPlugin': ['Distortion'],
-        'WaveshaperPlugin': ['Distortion', 'Waveshaper'],
-        'DynamicsPlugin': ['Dynamics'],
-        'AmplifierPlugin': ['Dynamics', 'Amplifier'],
-        'CompressorPlugin': ['Dynamics', 'Compressor'],
-        'ExpanderPlugin': ['Dynamics', 'Expander'],
-        'GatePlugin': ['Dynamics', 'Gate'],
-        'LimiterPlugin': ['Dynamics', 'Limiter'],
-        'FilterPlugin': ['Filter'],
-        'AllpassPlugin': ['Filter', 'Allpass'],
-        'BandpassPlugin': ['Filter', 'Bandpass'],
-        'CombPlugin': ['Filter', 'Comb'],
-        'EQPlugin': ['Filter', 'Equaliser'],
-        'MultiEQPlugin': ['Filter', 'Equaliser', 'Multiband'],
-        'ParaEQPlugin': ['Filter', 'Equaliser', 'Parametric'],
-        'HighpassPlugin': ['Filter', 'Highpass'],
-        'LowpassPlugin': ['Filter', 'Lowpass'],
-        'GeneratorPlugin': ['Generator'],
-        'ConstantPlugin': ['Generator', 'Constant'],
-        'InstrumentPlugin': ['Generator', 'Instrument'],
-        'OscillatorPlugin': ['Generator', 'Oscillator'],
-        'ModulatorPlugin': ['Modulator'],
-        'ChorusPlugin': ['Modulator', 'Chorus'],
-        'FlangerPlugin': ['Modulator', 'Flanger'],
-        'PhaserPlugin': ['Modulator', 'Phaser'],
-        'ReverbPlugin': ['Reverb'],
-        'SimulatorPlugin': ['Simulator'],
-        'SpatialPlugin': ['Spatial'],
-        'SpectralPlugin': ['Spectral'],
-        'PitchPlugin': ['Spectral', 'Pitch Shifter'],
-        'UtilityPlugin': ['Utility'],
-        'AnalyserPlugin': ['Utility', 'Analyser'],
-        'ConverterPlugin': ['Utility', 'Converter'],
-        'FunctionPlugin': ['Utility', 'Function'],
-        'MixerPlugin': ['Utility', 'Mixer'],
-        #'MIDIPlugin': ['MIDI', 'Utility'],
-    }
-    mod_category_indexes = {
-        'DelayPlugin': ['Delay'],
-        'DistortionPlugin': ['Distortion'],
-        'DynamicsPlugin': ['Dynamics'],
-        'FilterPlugin': ['Filter'],
-        'GeneratorPlugin': ['Generator'],
-        'ModulatorPlugin': ['Modulator'],
-        'ReverbPlugin': ['Reverb'],
-        'SimulatorPlugin': ['Simulator'],
-        'SpatialPlugin': ['Spatial'],
-        'SpectralPlugin': ['Spectral'],
-        'UtilityPlugin': ['Utility'],
-        'MIDIPlugin': ['Utility', 'MIDI'],
-        'ControlVoltagePlugin': ['ControlVoltage'],
-    }
-
-    def fill_in_lv2_categories(nodes):
-        cats = []
-        for node in nodes:
-            category = str(node).replace(PREFIX_LV2CORE,"")
-            if category in lv2_category_indexes.keys():
-                cats += lv2_category_indexes[category]
-        return cats
-
-    def fill_in_mod_categories(nodes):
-        cats = []
-        for node in nodes:
-            category = str(node).replace(PREFIX_MOD,"")
-            if category in mod_category_indexes.keys():
-                cats += mod_category_indexes[category]
-        return cats
-
+    uris       = [str(node) for node in nodes]
     categories = []
 
     # find MOD category first, takes precedence
-    for cat in fill_in_mod_categories(nodes):
-        if cat not in categories:
-            categories.append(cat)
-
-    if len(categories) > 0:
-        return categories
+    for table in (MOD_CATEGORY_URIS, LV2_CATEGORY_URIS):
+        for uri in uris:
+            for cat in table.get(uri, ()):
+                if cat not in categories:
+                    categories.append(cat)
 
-    for cat in fill_in_lv2_categories(nodes):
-        if cat not in categories:
-            categories.append(cat)
+        if len(categories) > 0:
+            break
 
     return categories
 
+# uri -> short name of port types and properties, filled as new uris show up
+PORT_TYPE_NAMES = dict(
+    (PREFIX_LV2CORE + name + "Port", name) for name in ("Audio", "Control", "CV", "Input", "Output")
+)
+PORT_TYPE_NAMES["http://lv2plug.in/ns/ext/atom#AtomPort"] = "Atom"
+
+URI_FRAGMENTS = {}
+
+# Get the short name of a port type, like "Audio" for lv2:AudioPort
+def get_port_type_name(uri):
+    name = PORT_TYPE_NAMES.get(uri)
+    if name is None:
+        name = PORT_TYPE_NAMES[uri] = uri.rsplit("#",1)[-1].replace("Port","",1)
+    return name
+
+# Get the last part of an uri, like "integer" for lv2:integer
+def get_uri_fragment(uri):
+    fragment = URI_FRAGMENTS.get(uri)
+    if fragment is None:
+        fragment = URI_FRAGMENTS[uri] = uri.rsplit("#",1)[-1]
+    return fragment
+
 def get_port_data(port, subj):
     return iter_compat(port.get_value(subj))
 
@@ -208,11 +299,176 @@ def get_port_unit(miniuri):
       return units[miniuri]
   return ("","","")
 
+def bundle_abspath(bundle):
+    # lilv wants the last character as the separator
+    bundle = os.path.abspath(bundle)
+    if not bundle.endswith(os.sep):
+        bundle += os.sep
+    return bundle
+
+# Get a fingerprint of all the turtle files inside a bundle
+# It changes whenever a ttl file is added, removed or modified (as seen by its mtime and size).
+def get_bundle_fingerprint(bundle):
+    bundle  = bundle_abspath(bundle)
+    entries = []
+
+    for root, dirs, files in os.walk(bundle):
+        dirs.sort()
+        for filename in sorted(files):
+            if not filename.endswith(".ttl"):
+                continue
+            try:
+                stat = os.stat(os.path.join(root, filename))
+            except OSError:
+                continue
+            entries.append("%s:%d:%d" % (os.path.join(root, filename)[len(bundle):], stat.st_mtime_ns, stat.st_size))
+
+    return hashlib.sha1("\n".join(entries).encode("utf-8", "surrogateescape")).hexdigest()
+
+# Get the uris a bundle manifest says something about, read with the turtle parser (without lilv)
+# These are all uri subjects (plugins, modgui or overlay data for plugins, presets) plus the plugins of presets.
+def get_manifest_uris(bundle):
+    graph = parse_turtle_file(os.path.join(bundle_abspath(bundle), "manifest.ttl"))
+    uris  = set()
+
+    for subject in graph.subjects:
+        if subject.is_uri():
+            uris.add(subject)
+        for obj in graph.objects(subject, PREFIX_LV2CORE + "appliesTo"):
+            if obj.is_uri():
+                uris.add(obj)
+
+    return uris
+
+# Split bundles into groups that need to be loaded together, because their manifests describe the same uris
+# For example a plugin bundle plus separate modgui, preset or overlay bundles for the same plugin.
+# Bundles keep their order inside each group, and groups are ordered by their first bundle.
+# A bundle whose manifest cannot be read is put in a group of its own.
+def group_related_bundles(bundles):
+    parents = list(range(len(bundles)))
+    owners  = {}
+
+    def find(index):
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    for index, bundle in enumerate(bundles):
+        try:
+            uris = get_manifest_uris(bundle)
+        except (TurtleError, OSError, ValueError):
+            continue
+
+        for uri in uris:
+            if uri not in owners:
+                owners[uri] = index
+                continue
+            first, second = find(owners[uri]), find(index)
+            parents[max(first, second)] = min(first, second)
+
+    groups = {}
+
+    for index, bundle in enumerate(bundles):
+        groups.setdefault(find(index), []).append(bundle)
+
+    return list(groups.values())
+
+# ------------------------------------------------------------------------------------------------------------
+# WorldPool
+
+# A lilv world that can be shared between calls
+# Specifications and plugin classes are loaded only once, bundles are then loaded and unloaded incrementally.
+# Anything not defined here is forwarded to the lilv world, so a pool can be used wherever a world is expected.
+class WorldPool(object):
+    def __init__(self, loadAll = False):
+        self.world   = lilv.World()
+        self.bundles = {}
+        self.loadAll = loadAll
+
+        # modgui files seen so far, forgotten whenever bundles change
+        self.modguiResolver = ModguiResolver()
+
+        with profile_phase('world'):
+            if loadAll:
+                self.world.load_all()
+            else:
+                # this is needed when loading specific bundles instead of load_all
+                self.world.load_specifications()
+                self.world.load_plugin_classes()
+
+    def __getattr__(self, attr):
+        return getattr(self.world, attr)
+
+    # Load a bundle into the world, does nothing if already loaded
+    # @a bundle is a string, consisting of a directory in the filesystem.
+    def add_bundle(self, bundle):
+        bundle = bundle_abspath(bundle)
+
+        if bundle in self.bundles:
+            return self.bundles[bundle]
+
+        # convert bundle string into a lilv node
+        bundlenode = self.world.new_file_uri(None, bundle)
+
+        # load the bundle
+        with profile_phase('load'):
+            self.world.load_bundle(bundlenode)
+
+        self.bundles[bundle] = bundlenode
+        self.modguiResolver.clear()
+        return bundlenode
+
+    # Unload a previously loaded bundle, returns False if the bundle was not loaded
+    def remove_bundle(self, bundle):
+        bundlenode = self.bundles.pop(bundle_abspath(bundle), None)
+
+        if bundlenode is None:
+            return False
+
+        with profile_phase('unload'):
+            self.world.unload_bundle(bundlenode)
+
+        self.modguiResolver.clear()
+        return True
+
+    def has_bundle(self, bundle):
+        return bundle_abspath(bundle) in self.bundles
+
+    # Get all plugins that were loaded from a list of bundles
+    def get_bundles_plugins(self, bundles):
+        bundles = set(bundle_abspath(bundle) for bundle in bundles)
+        plugins = self.world.get_all_plugins()
+
+        # quick path, nothing else is loaded in the world
+        if not self.loadAll and bundles.issuperset(self.bundles.keys()):
+            return list(plugins)
+
+        bundleuris = set(str(self.bundles[bundle]) for bundle in bundles if bundle in self.bundles)
+        return [p for p in plugins if str(p.get_bundle_uri()) in bundleuris]
+
+    def get_bundle_plugins(self, bundle):
+        return self.get_bundles_plugins((bundle,))
+
+    # Keep a bundle loaded only for the duration of a with-block
+    # Bundles that were already loaded before are left untouched.
+    @contextmanager
+    def temporary_bundle(self, bundle):
+        loaded     = self.has_bundle(bundle)
+        bundlenode = self.add_bundle(bundle)
+        try:
+            yield bundlenode
+        finally:
+            if not loaded:
+                self.remove_bundle(bundle)
+
 # ------------------------------------------------------------------------------------------------------------
 # get_bundle_dirname
 
-def get_bundle_dirname(bundleuri):
-    world = lilv.World()
+def get_bundle_dirname(bundleuri, world = None):
+    if world is None:
+        world = lilv.World()
+
     bundle = str(world.new_uri(bundleuri).get_path())
 
     if not os.path.exists(bundle):
@@ -228,50 +484,61 @@ def get_bundle_dirname(bundleuri):
 
 # Get info from an lv2 bundle
 # @a bundle is a string, consisting of a directory in the filesystem (absolute pathname).
-def get_pedalboard_info(bundle):
+# @a world is an optional WorldPool to use, the bundle is only kept loaded in it if it already was before.
+# @a fast reads the bundle without lilv when possible, see get_pedalboard_info_fast.
+# @a fields is an optional list of PEDALBOARD_INFO_FIELDS to get, everything else is skipped.
+def get_pedalboard_info(bundle, world = None, fast = False, fields = None):
     # lilv wants the last character as the separator
-    bundle = os.path.abspath(bundle)
-    if not bundle.endswith(os.sep):
-        bundle += os.sep
+    bundle = bundle_abspath(bundle)
 
-    # Create our own unique lilv world
-    # We'll load a single bundle and get all plugins from it
-    world = lilv.World()
+    if fields is not None and not set(fields).issubset(PEDALBOARD_INFO_FIELDS):
+        raise Exception('get_pedalboard_info(%s) - unknown fields requested' % bundle)
 
-    # this is needed when loading specific bundles instead of load_all
-    world.load_specifications()
-    world.load_plugin_classes()
+    if fast:
+        try:
+            with profile_phase('fast', bundle):
+                return get_pedalboard_info_fast(bundle, fields)
+        except (TurtleError, OSError, ValueError):
+            pass
 
-    # convert bundle string into a lilv node
-    bundlenode = world.new_file_uri(None, bundle)
+    with profile_phase('lilv', bundle):
+        # Create our own unique lilv world if needed
+        # We'll load a single bundle and get all plugins from it
+        if world is None:
+            world = WorldPool()
 
-    # load the bundle
-    world.load_bundle(bundlenode)
+        with world.temporary_bundle(bundle):
+            return get_pedalboard_info_from_world(world, bundle, fields)
+
+def get_pedalboard_info_from_world(world, bundle, fields = None):
+    def wanted(field):
+        return fields is None or field in fields
 
     # get all plugins in the bundle
-    plugins = world.get_all_plugins()
+    plugins = world.get_bundle_plugins(bundle)
 
     # make sure the bundle includes 1 and only 1 plugin (the pedalboard)
     if len(plugins) != 1:
-        raise Exception('get_pedalboard_info(%s) - bundle has 0 or > 1 plugin'.format(bundle))
+        raise Exception('get_pedalboard_info(%s) - bundle has 0 or > 1 plugin' % bundle)
 
     plugin = first_or(plugins, None)
 
     if plugin is None:
-        raise Exception('get_pedalboard_info(%s) - failed to get plugin, you are using an old lilv!'.format(bundle))
+        raise Exception('get_pedalboard_info(%s) - failed to get plugin, you are using an old lilv!' % bundle)
 
     # define the needed stuff
-    ns_rdf      = NS(world, lilv.LILV_NS_RDF)
-    ns_lv2core  = NS(world, lilv.LILV_NS_LV2)
-    ns_ingen    = NS(world, PREFIX_INGEN)
-    ns_mod      = NS(world, PREFIX_MOD)
-    ns_modpedal = NS(world, PREFIX_MODPEDAL)
+    vocabulary  = get_vocabulary(world)
+    ns_rdf      = vocabulary.rdf
+    ns_lv2core  = vocabulary.lv2core
+    ns_ingen    = vocabulary.ingen
+    ns_mod      = vocabulary.mod
+    ns_modpedal = vocabulary.modpedal
 
     # check if the plugin is a pedalboard
     plugin_types = tuple(str(node) for node in plugin.get_value(ns_rdf.type_))
 
     if "http://moddevices.com/ns/modpedal#Pedalboard" not in plugin_types:
-        raise Exception('get_pedalboard_info(%s) - plugin has no mod:Pedalboard type'.format(bundle))
+        raise Exception('get_pedalboard_info(%s) - plugin has no mod:Pedalboard type' % bundle)
 
     # let's get all the info now
     ingenarcs   = []
@@ -331,115 +598,121 @@ def get_pedalboard_info(bundle):
             }
 
     # connections
-    for arc in plugin.get_value(ns_ingen.arc):
-        head = world.get(arc, ns_ingen.head, None)
-        tail = world.get(arc, ns_ingen.tail, None)
+    with profile_phase('connections'):
+        for arc in (plugin.get_value(ns_ingen.arc) if wanted('connections') else ()):
+            head = world.get(arc, ns_ingen.head, None)
+            tail = world.get(arc, ns_ingen.tail, None)
 
-        if head is None or tail is None:
-            continue
+            if head is None or tail is None:
+                continue
 
-        ingenarcs.append({
-            "source": tail.get_path().replace(bundle,"",1),
-            "target": head.get_path().replace(bundle,"",1)
-        })
+            ingenarcs.append({
+                "source": tail.get_path().replace(bundle,"",1),
+                "target": head.get_path().replace(bundle,"",1)
+            })
 
     # hardware ports
-    handled_port_uris = []
-    for port in plugin.get_value(ns_lv2core.port):
-        # check if we already handled this port
-        port_uri = str(port)
-        if port_uri in handled_port_uris:
-            continue
-        if port_uri.endswith("/control_in") or port_uri.endswith("/control_out"):
-            continue
-        handled_port_uris.append(port_uri)
-
-        # get types
-        port_types = world.find_nodes(port, ns_rdf.type_, None)
-
-        if port_types is None:
-            continue
-
-        portDir  = "" # input or output
-        portType = "" # atom, audio or cv
-
-        for port_type in port_types:
-            port_type_uri = str(port_type)
-
-            if port_type_uri == (PREFIX_LV2CORE + "InputPort"):
-                portDir = "input"
-            elif port_type_uri == (PREFIX_LV2CORE + "OutputPort"):
-                portDir = "output"
-            elif port_type_uri == (PREFIX_LV2CORE + "AudioPort"):
-                portType = "audio"
-            elif port_type_uri in ((PREFIX_LV2CORE + "CVPort"), (PREFIX_MOD + "CVPort")):
-                portType = "cv"
-            elif port_type_uri == "http://lv2plug.in/ns/ext/atom#AtomPort":
-                portType = "atom"
-
-        if not (portDir or portType):
-            continue
-
-        if portType == "audio":
-            if portDir == "input":
-                info['hardware']['audio']['ins'] += 1
-            else:
-                info['hardware']['audio']['outs'] += 1
+    with profile_phase('hardware'):
+        handled_port_uris = []
+        for port in (plugin.get_value(ns_lv2core.port) if wanted('hardware') else ()):
+            # check if we already handled this port
+            port_uri = str(port)
+            if port_uri in handled_port_uris:
+                continue
+            if port_uri.endswith("/control_in") or port_uri.endswith("/control_out"):
+                continue
+            handled_port_uris.append(port_uri)
+
+            # get types
+            port_types = world.find_nodes(port, ns_rdf.type_, None)
+
+            if port_types is None:
+                continue
+
+            portDir  = "" # input or output
+            portType = "" # atom, audio or cv
+
+            for port_type in port_types:
+                port_type_uri = str(port_type)
+
+                if port_type_uri == (PREFIX_LV2CORE + "InputPort"):
+                    portDir = "input"
+                elif port_type_uri == (PREFIX_LV2CORE + "OutputPort"):
+                    portDir = "output"
+                elif port_type_uri == (PREFIX_LV2CORE + "AudioPort"):
+                    portType = "audio"
+                elif port_type_uri in ((PREFIX_LV2CORE + "CVPort"), (PREFIX_MOD + "CVPort")):
+                    portType = "cv"
+                elif port_type_uri == "http://lv2plug.in/ns/ext/atom#AtomPort":
+                    portType = "atom"
+
+            if not (portDir or portType):
+                continue
+
+            if portType == "audio":
+                if portDir == "input":
+                    info['hardware']['audio']['ins'] += 1
+                else:
+                    info['hardware']['audio']['outs'] += 1
 
-        elif portType == "atom":
-            if portDir == "input":
-                info['hardware']['midi']['ins'] += 1
-            else:
-                info['hardware']['midi']['outs'] += 1
+            elif portType == "atom":
+                if portDir == "input":
+                    info['hardware']['midi']['ins'] += 1
+                else:
+                    info['hardware']['midi']['outs'] += 1
 
-        elif portType == "cv":
-            if portDir == "input":
-                info['hardware']['cv']['ins'] += 1
-            else:
-                info['hardware']['cv']['outs'] += 1
+            elif portType == "cv":
+                if portDir == "input":
+                    info['hardware']['cv']['ins'] += 1
+                else:
+                    info['hardware']['cv']['outs'] += 1
 
     # plugins
-    for block in plugin.get_value(ns_ingen.block):
-        protouri1 = world.get(block, ns_lv2core.prototype, None)
-        protouri2 = world.get(block, ns_ingen.prototype, None)
-
-        if protouri1 is not None:
-            proto = protouri1
-        elif protouri2 is not None:
-            proto = protouri2
-        else:
-            continue
-
-        instance = block.get_path().replace(bundle,"",1)
-        uri      = str(proto)
-
-        x        = world.get(block, ns_ingen.canvasX, None)
-        y        = world.get(block, ns_ingen.canvasY, None)
-        enabled  = world.get(block, ns_ingen.enabled, None)
-        builder  = world.get(block, ns_mod.builderVersion, None)
-        release  = world.get(block, ns_mod.releaseNumber, None)
-        minorver = world.get(block, ns_lv2core.minorVersion, None)
-        microver = world.get(block, ns_lv2core.microVersion, None)
-        buildId  = world.get(block, ns_mod.buildId, None)
-        buildEnv = world.get(block, ns_mod.buildEnvironment, None)
-
-        ingenblocks.append({
-            "instance": instance,
-            "uri"     : uri,
-            "x"       : float(x),
-            "y"       : float(y),
-            "enabled" : bool(enabled) if enabled is not None else False,
-            "builder" : int(builder) if builder is not None else 0,
-            "release" : int(release) if release is not None else 0,
-            "minorVersion": int(minorver) if minorver is not None else 0,
-            "microVersion": int(microver) if microver is not None else 0,
-            "buildId"         : str(buildId) if buildId is not None else "",
-            "buildEnvironment": str(buildEnv) if buildEnv is not None else "",
-        })
+    with profile_phase('plugins'):
+        for block in (plugin.get_value(ns_ingen.block) if wanted('plugins') else ()):
+            protouri1 = world.get(block, ns_lv2core.prototype, None)
+            protouri2 = world.get(block, ns_ingen.prototype, None)
+
+            if protouri1 is not None:
+                proto = protouri1
+            elif protouri2 is not None:
+                proto = protouri2
+            else:
+                continue
+
+            instance = block.get_path().replace(bundle,"",1)
+            uri      = str(proto)
+
+            x        = world.get(block, ns_ingen.canvasX, None)
+            y        = world.get(block, ns_ingen.canvasY, None)
+            enabled  = world.get(block, ns_ingen.enabled, None)
+            builder  = world.get(block, ns_mod.builderVersion, None)
+            release  = world.get(block, ns_mod.releaseNumber, None)
+            minorver = world.get(block, ns_lv2core.minorVersion, None)
+            microver = world.get(block, ns_lv2core.microVersion, None)
+            buildId  = world.get(block, ns_mod.buildId, None)
+            buildEnv = world.get(block, ns_mod.buildEnvironment, None)
+
+            ingenblocks.append({
+                "instance": instance,
+                "uri"     : uri,
+                "x"       : float(x),
+                "y"       : float(y),
+                "enabled" : bool(enabled) if enabled is not None else False,
+                "builder" : int(builder) if builder is not None else 0,
+                "release" : int(release) if release is not None else 0,
+                "minorVersion": int(minorver) if minorver is not None else 0,
+                "microVersion": int(microver) if microver is not None else 0,
+                "buildId"         : str(buildId) if buildId is not None else "",
+                "buildEnvironment": str(buildEnv) if buildEnv is not None else "",
+            })
 
     info['connections'] = ingenarcs
     info['plugins']     = ingenblocks
 
+    if fields is not None:
+        info = dict((key, value) for key, value in info.items() if key in fields)
+
     return info
 
 # ------------------------------------------------------------------------------------------------------------
@@ -447,56 +720,384 @@ def get_pedalboard_info(bundle):
 
 # Faster version of get_pedalboard_info when we just need to know the pedalboard name
 # @a bundle is a string, consisting of a directory in the filesystem (absolute pathname).
-def get_pedalboard_name(bundle):
+# @a world is an optional WorldPool to use, the bundle is only kept loaded in it if it already was before.
+# @a fast reads the bundle without lilv when possible, see get_pedalboard_info_fast.
+def get_pedalboard_name(bundle, world = None, fast = False):
     # lilv wants the last character as the separator
-    bundle = os.path.abspath(bundle)
-    if not bundle.endswith(os.sep):
-        bundle += os.sep
+    bundle = bundle_abspath(bundle)
 
-    # Create our own unique lilv world
-    # We'll load a single bundle and get all plugins from it
-    world = lilv.World()
+    if fast:
+        try:
+            graph, pluginuri = read_pedalboard_bundle(bundle)
+            return str(graph.value(pluginuri, lilv.LILV_NS_DOAP + "name"))
+        except (TurtleError, OSError, ValueError):
+            pass
 
-    # this is needed when loading specific bundles instead of load_all
-    world.load_specifications()
-    world.load_plugin_classes()
-
-    # convert bundle string into a lilv node
-    bundlenode = world.new_file_uri(None, bundle)
+    # Create our own unique lilv world if needed
+    # We'll load a single bundle and get all plugins from it
+    if world is None:
+        world = WorldPool()
 
-    # load the bundle
-    world.load_bundle(bundlenode)
+    with world.temporary_bundle(bundle):
+        return get_pedalboard_name_from_world(world, bundle)
 
+def get_pedalboard_name_from_world(world, bundle):
     # get all plugins in the bundle
-    plugins = world.get_all_plugins()
+    plugins = world.get_bundle_plugins(bundle)
 
     # make sure the bundle includes 1 and only 1 plugin (the pedalboard)
     if len(plugins) != 1:
-        raise Exception('get_pedalboard_info(%s) - bundle has 0 or > 1 plugin'.format(bundle))
+        raise Exception('get_pedalboard_info(%s) - bundle has 0 or > 1 plugin' % bundle)
 
     plugin = first_or(plugins, None)
 
     if plugin is None:
-        raise Exception('get_pedalboard_info(%s) - failed to get plugin'.format(bundle))
+        raise Exception('get_pedalboard_info(%s) - failed to get plugin' % bundle)
 
     # define the needed stuff
-    ns_rdf = NS(world, lilv.LILV_NS_RDF)
+    vocabulary = get_vocabulary(world)
+    ns_rdf     = vocabulary.rdf
 
     # check if the plugin is a pedalboard
     plugin_types = tuple(str(node) for node in plugin.get_value(ns_rdf.type_))
 
     if "http://moddevices.com/ns/modpedal#Pedalboard" not in plugin_types:
-        raise Exception('get_pedalboard_info(%s) - plugin has no mod:Pedalboard type'.format(bundle))
+        raise Exception('get_pedalboard_info(%s) - plugin has no mod:Pedalboard type' % bundle)
 
     return str(plugin.get_name())
 
+# ------------------------------------------------------------------------------------------------------------
+# get_pedalboards_info
+
+# Get all pedalboard bundles inside a directory, sorted by name
+def list_pedalboard_bundles(directory):
+    bundles = []
+
+    for entry in sorted(os.listdir(directory)):
+        bundle = os.path.join(directory, entry)
+        if os.path.isfile(os.path.join(bundle, "manifest.ttl")):
+            bundles.append(bundle_abspath(bundle))
+
+    return bundles
+
+# Get info from many pedalboards at once
+# Bundles are read with the fast path when possible, otherwise loaded one by one into a single shared world.
+# @a dir_or_bundles is either a directory containing pedalboard bundles, or a list of bundles.
+# @a fields is an optional list of PEDALBOARD_INFO_FIELDS to get, everything else is skipped.
+# @a world is an optional WorldPool to use, a new one is created if needed.
+# Returns a tuple of 2 dictionaries, info and error message by bundle; failures never raise.
+def get_pedalboards_info(dir_or_bundles, fields = None, world = None, fast = True):
+    if isinstance(dir_or_bundles, str):
+        bundles = list_pedalboard_bundles(dir_or_bundles)
+    else:
+        bundles = [bundle_abspath(bundle) for bundle in dir_or_bundles]
+
+    if fields is not None and not set(fields).issubset(PEDALBOARD_INFO_FIELDS):
+        raise Exception('get_pedalboards_info() - unknown fields requested')
+
+    nameOnly = fields is not None and set(fields) == set(('name',))
+    infos    = {}
+    errors   = {}
+
+    for bundle in bundles:
+        try:
+            if fast:
+                try:
+                    if nameOnly:
+                        graph, pluginuri = read_pedalboard_bundle(bundle)
+                        infos[bundle] = { 'name': str(graph.value(pluginuri, lilv.LILV_NS_DOAP + "name")) }
+                    else:
+                        infos[bundle] = get_pedalboard_info_fast(bundle, fields)
+                    continue
+                except (TurtleError, OSError, ValueError):
+                    pass
+
+            if world is None:
+                world = WorldPool()
+
+            if nameOnly:
+                infos[bundle] = { 'name': get_pedalboard_name(bundle, world) }
+            else:
+                infos[bundle] = get_pedalboard_info(bundle, world, False, fields)
+
+        except Exception as e:
+            errors[bundle] = str(e)
+
+    return infos, errors
+
+# ------------------------------------------------------------------------------------------------------------
+# get_pedalboard_info_fast
+
+# Get the objects of a subject and predicate in the order lilv gives them back in
+# MOD never saves values of mixed node types here, so those raise TurtleError and are left to lilv.
+def get_sorted_objects(graph, subject, predicate):
+    objects = graph.objects(subject, predicate)
+
+    if len(set(type(node) for node in objects)) > 1:
+        raise TurtleError("<%s> has <%s> values of mixed node types" % (subject, predicate))
+
+    return sort_nodes(objects)
+
+# Read the turtle files of a pedalboard bundle without lilv
+# Only the layout of pedalboards saved by MOD is known here, anything unexpected raises TurtleError.
+# Returns the parsed graph and the pedalboard uri.
+def read_pedalboard_bundle(bundle):
+    bundleuri = file_uri(bundle)
+    manifest  = URIRef(bundleuri + "manifest.ttl")
+    graph     = parse_turtle_file(manifest.get_path(), manifest, None, "m")
+
+    # make sure the bundle includes 1 and only 1 plugin (the pedalboard)
+    plugins = graph.subjects_of_type(PREFIX_LV2CORE + "Plugin")
+
+    if len(plugins) != 1 or not isinstance(plugins[0], URIRef):
+        raise TurtleError("bundle has 0 or > 1 plugin")
+
+    pluginuri = plugins[0]
+
+    # load the plugin data, which must be inside the bundle
+    for index, seealso in enumerate(get_sorted_objects(graph, pluginuri, lilv.LILV_NS_RDFS + "seeAlso")):
+        path = seealso.get_path() if isinstance(seealso, URIRef) else None
+
+        if path is None or not path.startswith(bundle):
+            raise TurtleError("plugin data is outside the bundle")
+
+        parse_turtle_file(path, seealso, graph, "f%d" % index)
+
+    # check if the plugin is a pedalboard, otherwise let lilv complain about it
+    if PREFIX_MODPEDAL + "Pedalboard" not in graph.objects(pluginuri, lilv.LILV_NS_RDF + "type"):
+        raise TurtleError("plugin has no mod:Pedalboard type")
+
+    # lilv only gives us a plain string as name
+    name = graph.value(pluginuri, lilv.LILV_NS_DOAP + "name")
+
+    if name is None or not name.is_literal() or not name.is_string():
+        raise TurtleError("plugin has no valid name")
+
+    # lilv also looks for the author in the maintainer and project, which pedalboards do not have
+    if graph.objects(pluginuri, lilv.LILV_NS_DOAP + "maintainer") or graph.objects(pluginuri, PREFIX_LV2CORE + "project"):
+        raise TurtleError("plugin has author information")
+
+    return graph, pluginuri
+
+# Get info from a pedalboard bundle without lilv
+# Gives the exact same result as get_pedalboard_info, raises TurtleError if the bundle is not in the usual format.
+# @a bundle is a string, consisting of a directory in the filesystem (absolute pathname with a trailing separator).
+# @a fields is an optional list of PEDALBOARD_INFO_FIELDS to get, everything else is skipped.
+def get_pedalboard_info_fast(bundle, fields = None):
+    with profile_phase('parse'):
+        graph, pluginuri = read_pedalboard_bundle(bundle)
+
+    def wanted(field):
+        return fields is None or field in fields
+
+    def get_str(subject, predicate):
+        node = graph.value(subject, predicate)
+        return str(node) if node is not None else ""
+
+    def get_number(subject, predicate, isInteger, fallback = None):
+        node = graph.value(subject, predicate)
+        if node is None and fallback is not None:
+            return fallback
+        if node is None or not node.is_literal() or not (node.is_int() if isInteger else node.is_float()):
+            raise TurtleError("<%s> has an invalid <%s> value" % (subject, predicate))
+        return int(node) if isInteger else float(node)
+
+    def get_path(node):
+        path = node.get_path() if isinstance(node, URIRef) else None
+        if path is None:
+            raise TurtleError("<%s> is not a local path" % node)
+        return path.replace(bundle,"",1)
+
+    ports = get_sorted_objects(graph, pluginuri, PREFIX_LV2CORE + "port")
+
+    info = {
+        'name'  : str(graph.value(pluginuri, lilv.LILV_NS_DOAP + "name")),
+        'uri'   : str(pluginuri),
+        'author': "",
+        'unit': {
+            'name': get_str(pluginuri, PREFIX_MODPEDAL + "unitName"),
+            'model': get_str(pluginuri, PREFIX_MODPEDAL + "unitModel"),
+        },
+        'hardware': {
+            'audio': {
+                'ins' : 0,
+                'outs': 0
+             },
+            'cv': {
+                'ins' : 0,
+                'outs': 0
+             },
+            'midi': {
+                'ins' : 0,
+                'outs': 0
+             },
+        },
+        'size': {
+            'width' : get_number(pluginuri, PREFIX_MODPEDAL + "width", True, 0),
+            'height': get_number(pluginuri, PREFIX_MODPEDAL + "height", True, 0),
+        },
+        'screenshot' : os.path.basename(get_str(pluginuri, PREFIX_MODPEDAL + "screenshot")),
+        'thumbnail'  : os.path.basename(get_str(pluginuri, PREFIX_MODPEDAL + "thumbnail")),
+        'connections': [],
+        'plugins'    : [],
+    }
+
+    # handle unit name and model for old pedalboards
+    if not info['unit']['name']:
+        if any(str(port).endswith(("/midi_legacy_mode", "/midi_separated_mode")) for port in ports):
+            info['unit'] = {
+              'name': "MOD Duo X",
+              'model': "duox:aarch64-a53",
+            }
+        else:
+            info['unit'] = {
+              'name': "MOD Duo",
+              'model': "duo:arm-a7",
+            }
+
+    # connections
+    for arc in (get_sorted_objects(graph, pluginuri, PREFIX_INGEN + "arc") if wanted('connections') else ()):
+        head = graph.value(arc, PREFIX_INGEN + "head")
+        tail = graph.value(arc, PREFIX_INGEN + "tail")
+
+        if head is None or tail is None:
+            continue
+
+        info['connections'].append({
+            "source": get_path(tail),
+            "target": get_path(head)
+        })
+
+    # hardware ports
+    for port in (ports if wanted('hardware') else ()):
+        port_uri = str(port)
+        if port_uri.endswith("/control_in") or port_uri.endswith("/control_out"):
+            continue
+
+        portDir  = "" # input or output
+        portType = "" # atom, audio or cv
+
+        for port_type_uri in graph.objects(port, lilv.LILV_NS_RDF + "type"):
+            if port_type_uri == (PREFIX_LV2CORE + "InputPort"):
+                portDir = "input"
+            elif port_type_uri == (PREFIX_LV2CORE + "OutputPort"):
+                portDir = "output"
+            elif port_type_uri == (PREFIX_LV2CORE + "AudioPort"):
+                portType = "audio"
+            elif port_type_uri in ((PREFIX_LV2CORE + "CVPort"), (PREFIX_MOD + "CVPort")):
+                portType = "cv"
+            elif port_type_uri == "http://lv2plug.in/ns/ext/atom#AtomPort":
+                portType = "atom"
+
+        if not (portDir or portType):
+            continue
+
+        if portType == "audio":
+            info['hardware']['audio']['ins' if portDir == "input" else 'outs'] += 1
+        elif portType == "atom":
+            info['hardware']['midi']['ins' if portDir == "input" else 'outs'] += 1
+        elif portType == "cv":
+            info['hardware']['cv']['ins' if portDir == "input" else 'outs'] += 1
+
+    # plugins
+    for block in (get_sorted_objects(graph, pluginuri, PREFIX_INGEN + "block") if wanted('plugins') else ()):
+        proto = graph.value(block, PREFIX_LV2CORE + "prototype")
+
+        if proto is None:
+            proto = graph.value(block, PREFIX_INGEN + "prototype")
+        if proto is None:
+            continue
+
+        enabled = graph.value(block, PREFIX_INGEN + "enabled")
+
+        if enabled is not None and not (enabled.is_literal() and enabled.is_bool()):
+            raise TurtleError("<%s> has an invalid enabled value" % block)
+
+        info['plugins'].append({
+            "instance": get_path(block),
+            "uri"     : str(proto),
+            "x"       : get_number(block, PREFIX_INGEN + "canvasX", False),
+            "y"       : get_number(block, PREFIX_INGEN + "canvasY", False),
+            "enabled" : enabled.as_bool() if enabled is not None else False,
+            "builder" : get_number(block, PREFIX_MOD + "builderVersion", True, 0),
+            "release" : get_number(block, PREFIX_MOD + "releaseNumber", True, 0),
+            "minorVersion": get_number(block, PREFIX_LV2CORE + "minorVersion", True, 0),
+            "microVersion": get_number(block, PREFIX_LV2CORE + "microVersion", True, 0),
+            "buildId"         : get_str(block, PREFIX_MOD + "buildId"),
+            "buildEnvironment": get_str(block, PREFIX_MOD + "buildEnvironment"),
+        })
+
+    if fields is not None:
+        info = dict((key, value) for key, value in info.items() if key in fields)
+
+    return info
+
 # ------------------------------------------------------------------------------------------------------------
 # plugin_has_modgui
 
+# Answers file checks for modgui resources from directory listings
+# Each directory is listed once (using os.scandir) and then kept in memory, instead of a stat call per file.
+# Listings are kept until clear() is called, WorldPool does that whenever a bundle is loaded or unloaded.
+class ModguiResolver(object):
+    def __init__(self):
+        self.home = os.path.expanduser("~")
+        # directory -> set of names of existing files and directories, None if the directory does not exist
+        self.listings = {}
+
+    def clear(self):
+        self.listings = {}
+
+    def list_dir(self, path):
+        if path in self.listings:
+            return self.listings[path]
+
+        names = None
+
+        try:
+            with os.scandir(path) as entries:
+                names = set()
+                for entry in entries:
+                    # same as os.path.exists, broken symlinks do not count
+                    try:
+                        if entry.is_file() or entry.is_dir():
+                            names.add(entry.name)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+        self.listings[path] = names
+        return names
+
+    # Same as os.path.exists
+    def exists(self, path):
+        path = os.path.normpath(path)
+        dirname, basename = os.path.split(path)
+
+        if not basename:
+            return os.path.exists(path)
+
+        names = self.list_dir(dirname)
+        return names is not None and basename in names
+
+    # Check if a path is inside the user home directory
+    def in_home(self, path):
+        return path.startswith(self.home)
+
+# Get the ModguiResolver to use with a world
+# WorldPool keeps one around, plain lilv worlds get a new one each time as there is no way to know when they change.
+def get_modgui_resolver(world):
+    resolver = getattr(world, 'modguiResolver', None)
+    return resolver if resolver is not None else ModguiResolver()
+
 # Check if a plugin has modgui
-def plugin_has_modgui(world, plugin):
+def plugin_has_modgui(world, plugin, resolver = None):
     # define the needed stuff
-    ns_modgui = NS(world, PREFIX_MODGUI)
+    vocabulary = get_vocabulary(world)
+    ns_modgui  = vocabulary.modgui
+
+    if resolver is None:
+        resolver = get_modgui_resolver(world)
 
     # --------------------------------------------------------------------------------------------------------
     # get the proper modgui
@@ -508,7 +1109,7 @@ def plugin_has_modgui(world, plugin):
         if resdir is None:
             continue
         modguigui = mgui
-        if resdir.get_path().startswith(os.path.expanduser("~")):
+        if resolver.in_home(resdir.get_path()):
             # found a modgui in the home dir, stop here and use it
             break
 
@@ -524,45 +1125,44 @@ def plugin_has_modgui(world, plugin):
     if modgui_resdir is None:
         return False
 
-    return os.path.exists(modgui_resdir.get_path())
+    return resolver.exists(modgui_resdir.get_path())
+
+# Batch version of plugin_has_modgui, returns a dictionary of plugin uri -> bool
+# All plugins share the same directory listings, so each directory is read at most once.
+def plugins_have_modgui(world, plugins = None):
+    if plugins is None:
+        plugins = world.get_all_plugins()
+
+    resolver = get_modgui_resolver(world)
+    return dict((str(plugin.get_uri()), plugin_has_modgui(world, plugin, resolver)) for plugin in plugins)
 
 # ------------------------------------------------------------------------------------------------------------
-# get_plugin_info
+# get_plugin_info sections
+# Each section gets part of the plugin info, reporting any problem it finds to the given ValidationReport.
 
-# Get info from a lilv plugin
-# This is used in get_plugins_info below and MOD-SDK
-def get_plugin_info(world, plugin, useAbsolutePath = True):
+# uri, name, binary, license, comment, version, author, brand and label
+def get_plugin_base_info(world, plugin, useAbsolutePath, report):
     # define the needed stuff
-    ns_doap    = NS(world, lilv.LILV_NS_DOAP)
-    ns_foaf    = NS(world, lilv.LILV_NS_FOAF)
-    ns_rdf     = NS(world, lilv.LILV_NS_RDF)
-    ns_rdfs    = NS(world, lilv.LILV_NS_RDFS)
-    ns_lv2core = NS(world, lilv.LILV_NS_LV2)
-    ns_atom    = NS(world, "http://lv2plug.in/ns/ext/atom#")
-    ns_midi    = NS(world, "http://lv2plug.in/ns/ext/midi#")
-    ns_morph   = NS(world, "http://lv2plug.in/ns/ext/morph#")
-    ns_pprops  = NS(world, "http://lv2plug.in/ns/ext/port-props#")
-    ns_pset    = NS(world, "http://lv2plug.in/ns/ext/presets#")
-    ns_units   = NS(world, "http://lv2plug.in/ns/extensions/units#")
-    ns_mod     = NS(world, PREFIX_MOD)
-    ns_modgui  = NS(world, PREFIX_MODGUI)
+    vocabulary = get_vocabulary(world)
+    ns_doap    = vocabulary.doap
+    ns_foaf    = vocabulary.foaf
+    ns_rdfs    = vocabulary.rdfs
+    ns_lv2core = vocabulary.lv2core
+    ns_mod     = vocabulary.mod
 
     bundleuri = plugin.get_bundle_uri()
     bundle    = bundleuri.get_path()
     bundleuri = str(bundleuri)
 
-    errors   = []
-    warnings = []
-
     # --------------------------------------------------------------------------------------------------------
     # uri
 
     uri = str(plugin.get_uri())
 
     if not uri:
-        errors.append("plugin uri is missing or invalid")
+        report.report('plugin-uri-missing')
     elif uri.startswith("file:"):
-        errors.append("plugin uri is local, and thus not suitable for redistribution")
+        report.report('plugin-uri-local')
     #elif not (uri.startswith("http:") or uri.startswith("https:")):
         #warnings.append("plugin uri is not a real url")
 
@@ -572,7 +1172,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
     name = str(plugin.get_name())
 
     if not name:
-        errors.append("plugin name is missing")
+        report.report('plugin-name-missing')
 
     # --------------------------------------------------------------------------------------------------------
     # binary
@@ -580,7 +1180,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
     binary = plugin.get_library_uri().get_path()
 
     if not binary:
-        errors.append("plugin binary is missing")
+        report.report('plugin-binary-missing')
     elif not useAbsolutePath:
         binary = binary.replace(bundle,"",1)
 
@@ -599,11 +1199,11 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
             license = str_first_or(world.get(project, ns_doap.license, None))
 
     if not license:
-        errors.append("plugin license is missing")
+        report.report('plugin-license-missing')
 
     elif license.startswith(bundleuri):
         license = license.replace(bundleuri,"",1)
-        warnings.append("plugin license entry is a local path instead of a string")
+        report.report('plugin-license-local')
 
     # --------------------------------------------------------------------------------------------------------
     # comment
@@ -615,7 +1215,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
         comment = ""
 
     if not comment:
-        errors.append("plugin comment is missing")
+        report.report('plugin-comment-missing')
 
     # --------------------------------------------------------------------------------------------------------
     # version
@@ -624,36 +1224,25 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
     minorver = first_or(plugin.get_value(ns_lv2core.minorVersion), None)
 
     if microver is None and minorver is None:
-        errors.append("plugin is missing version information")
+        report.report('plugin-version-missing')
         minorVersion = 0
         microVersion = 0
 
     else:
         if minorver is None:
-            errors.append("plugin is missing minorVersion")
+            report.report('plugin-minor-version-missing')
             minorVersion = 0
         else:
             minorVersion = int(minorver)
 
         if microver is None:
-            errors.append("plugin is missing microVersion")
+            report.report('plugin-micro-version-missing')
             microVersion = 0
         else:
             microVersion = int(microver)
 
-    version = "%d.%d" % (minorVersion, microVersion)
-
-    # 0.x is experimental
-    if minorVersion == 0:
-        stability = "experimental"
-
-    # odd x.2 or 2.x is testing/development
-    elif minorVersion % 2 != 0 or microVersion % 2 != 0:
-        stability = "testing"
-
-    # otherwise it's stable
-    else:
-        stability = "stable"
+    version   = "%d.%d" % (minorVersion, microVersion)
+    stability = get_stability(minorVersion, microVersion)
 
     # --------------------------------------------------------------------------------------------------------
     # author
@@ -665,7 +1254,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
     }
 
     if not author['name']:
-        errors.append("plugin author name is missing")
+        report.report('plugin-author-name-missing')
 
     if not author['homepage']:
         prj = first_or(plugin.get_value(ns_lv2core.project), None)
@@ -677,13 +1266,13 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                     author['homepage'] = str(homepage)
 
     if not author['homepage']:
-        warnings.append("plugin author homepage is missing")
+        report.report('plugin-author-homepage-missing')
 
     if not author['email']:
         pass
     elif author['email'].startswith(bundleuri):
         author['email'] = author['email'].replace(bundleuri,"",1)
-        warnings.append("plugin author email entry is missing 'mailto:' prefix")
+        report.report('plugin-author-email-prefix')
     elif author['email'].startswith("mailto:"):
         author['email'] = author['email'].replace("mailto:","",1)
 
@@ -693,15 +1282,12 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
     brand = str_first_or(plugin.get_value(ns_mod.brand))
 
     if not brand:
-        brand = author['name'].split(" - ",1)[0].split(" ",1)[0]
-        brand = brand.rstrip(",").rstrip(";")
-        if len(brand) > 16:
-            brand = brand[:16]
-        warnings.append("plugin brand is missing")
+        brand = get_default_brand(author['name'])
+        report.report('plugin-brand-missing')
 
     elif len(brand) > 16:
         brand = brand[:16]
-        errors.append("plugin brand has more than 16 characters")
+        report.report('plugin-brand-too-long')
 
     # --------------------------------------------------------------------------------------------------------
     # label
@@ -709,23 +1295,45 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
     label = str_first_or(plugin.get_value(ns_mod.label))
 
     if not label:
-        if len(name) <= 24:
-            label = name
-        else:
-            labels = name.split(" - ",1)[0].split(" ")
-            if labels[0].lower() in bundle.lower() and len(labels) > 1 and not labels[1].startswith(("(","[")):
-                label = labels[1]
-            else:
-                label = labels[0]
-
-            if len(label) > 24:
-                label = label[:24]
-
-            warnings.append("plugin label is missing")
+        label = get_default_label(name, bundle)
+        if len(name) > 24:
+            report.report('plugin-label-missing')
 
     elif len(label) > 24:
         label = label[:24]
-        errors.append("plugin label has more than 24 characters")
+        report.report('plugin-label-too-long')
+
+    return {
+        'uri' : uri,
+        'name': name,
+
+        'binary' : binary,
+        'brand'  : brand,
+        'label'  : label,
+        'license': license,
+        'comment': comment,
+
+        'microVersion': microVersion,
+        'minorVersion': minorVersion,
+
+        'version'  : version,
+        'stability': stability,
+
+        'author': author,
+    }
+
+# category
+def get_plugin_category_info(world, plugin, useAbsolutePath, report):
+    vocabulary = get_vocabulary(world)
+    ns_rdf     = vocabulary.rdf
+
+    return {
+        'category': get_category(plugin.get_value(ns_rdf.type_)),
+    }
+
+# bundles
+def get_plugin_bundles_info(world, plugin, useAbsolutePath, report):
+    bundle = plugin.get_bundle_uri().get_path()
 
     # --------------------------------------------------------------------------------------------------------
     # bundles
@@ -745,6 +1353,23 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
         if bundle not in bundles:
             bundles.append(bundle)
 
+    return {
+        'bundles': sorted(bundles),
+    }
+
+# modgui
+def get_plugin_gui_info(world, plugin, useAbsolutePath, report):
+    # define the needed stuff
+    vocabulary = get_vocabulary(world)
+    ns_lv2core = vocabulary.lv2core
+    ns_modgui  = vocabulary.modgui
+
+    resolver = get_modgui_resolver(world)
+
+    bundleuri = plugin.get_bundle_uri()
+    bundle    = bundleuri.get_path()
+    bundleuri = str(bundleuri)
+
     # --------------------------------------------------------------------------------------------------------
     # get the proper modgui
 
@@ -758,7 +1383,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
         if not useAbsolutePath:
             # special build, use first modgui found
             break
-        if resdir.get_path().startswith(os.path.expanduser("~")):
+        if resolver.in_home(resdir.get_path()):
             # found a modgui in the home dir, stop here and use it
             break
 
@@ -768,25 +1393,25 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
     gui = {}
 
     if modguigui is None:
-        warnings.append("no modgui available")
+        report.report('modgui-missing')
 
     else:
         # resourcesDirectory *must* be present
         modgui_resdir = first_or(world.find_nodes(modguigui, ns_modgui.resourcesDirectory, None), None)
 
         if modgui_resdir is None:
-            errors.append("modgui has no resourcesDirectory data")
+            report.report('modgui-resources-missing')
 
         else:
             if useAbsolutePath:
                 gui['resourcesDirectory'] = modgui_resdir.get_path()
 
                 # check if modgui is defined in a separate file
-                gui['usingSeeAlso'] = os.path.exists(os.path.join(bundle, "modgui.ttl"))
+                gui['usingSeeAlso'] = resolver.exists(os.path.join(bundle, "modgui.ttl"))
 
                 # check if the modgui definition is on its own file and in the user dir
                 gui['modificableInPlace'] = bool((bundle not in gui['resourcesDirectory'] or gui['usingSeeAlso']) and
-                                                 gui['resourcesDirectory'].startswith(os.path.expanduser("~")))
+                                                 resolver.in_home(gui['resourcesDirectory']))
             else:
                 gui['resourcesDirectory'] = str(modgui_resdir).replace(bundleuri,"",1)
 
@@ -795,20 +1420,20 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
             modgui_setts = first_or(world.find_nodes(modguigui, ns_modgui.settingsTemplate, None), None)
 
             if modgui_icon is None:
-                errors.append("modgui has no iconTemplate data")
+                report.report('modgui-icon-missing')
             else:
                 iconFile = modgui_icon.get_path()
-                if os.path.exists(iconFile):
+                if resolver.exists(iconFile):
                     gui['iconTemplate'] = iconFile if useAbsolutePath else iconFile.replace(bundle,"",1)
                 else:
-                    errors.append("modgui iconTemplate file is missing")
+                    report.report('modgui-icon-file-missing')
 
             if modgui_setts is not None:
                 settingsFile = modgui_setts.get_path()
-                if os.path.exists(settingsFile):
+                if resolver.exists(settingsFile):
                     gui['settingsTemplate'] = settingsFile if useAbsolutePath else settingsFile.replace(bundle,"",1)
                 else:
-                    errors.append("modgui settingsTemplate file is missing")
+                    report.report('modgui-settings-file-missing')
 
             # javascript and stylesheet files
             modgui_script = first_or(world.find_nodes(modguigui, ns_modgui.javascript, None), None)
@@ -816,28 +1441,28 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
 
             if modgui_script is not None:
                 javascriptFile = modgui_script.get_path()
-                if os.path.exists(javascriptFile):
+                if resolver.exists(javascriptFile):
                     gui['javascript'] = javascriptFile if useAbsolutePath else javascriptFile.replace(bundle,"",1)
                 else:
-                    errors.append("modgui javascript file is missing")
+                    report.report('modgui-javascript-file-missing')
 
             if modgui_style is None:
-                errors.append("modgui has no stylesheet data")
+                report.report('modgui-stylesheet-missing')
             else:
                 stylesheetFile = modgui_style.get_path()
-                if os.path.exists(stylesheetFile):
+                if resolver.exists(stylesheetFile):
                     gui['stylesheet'] = stylesheetFile if useAbsolutePath else stylesheetFile.replace(bundle,"",1)
                 else:
-                    errors.append("modgui stylesheet file is missing")
+                    report.report('modgui-stylesheet-file-missing')
 
             # template data for backwards compatibility
             # FIXME remove later once we got rid of all templateData files
             modgui_templ = first_or(world.find_nodes(modguigui, ns_modgui.templateData, None), None)
 
             if modgui_templ is not None:
-                warnings.append("modgui is using old deprecated templateData")
+                report.report('modgui-template-data')
                 templFile = modgui_templ.get_path()
-                if os.path.exists(templFile):
+                if resolver.exists(templFile):
                     with open(templFile, 'r') as fd:
                         try:
                             data = json.loads(fd.read())
@@ -871,21 +1496,21 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
 
             if modgui_scrn is not None:
                 gui['screenshot'] = modgui_scrn.get_path()
-                if not os.path.exists(gui['screenshot']):
-                    errors.append("modgui screenshot file is missing")
+                if not resolver.exists(gui['screenshot']):
+                    report.report('modgui-screenshot-file-missing')
                 if not useAbsolutePath:
                     gui['screenshot'] = gui['screenshot'].replace(bundle,"",1)
             else:
-                errors.append("modgui has no screnshot data")
+                report.report('modgui-screenshot-missing')
 
             if modgui_thumb is not None:
                 gui['thumbnail'] = modgui_thumb.get_path()
-                if not os.path.exists(gui['thumbnail']):
-                    errors.append("modgui thumbnail file is missing")
+                if not resolver.exists(gui['thumbnail']):
+                    report.report('modgui-thumbnail-file-missing')
                 if not useAbsolutePath:
                     gui['thumbnail'] = gui['thumbnail'].replace(bundle,"",1)
             else:
-                errors.append("modgui has no thumbnail data")
+                report.report('modgui-thumbnail-missing')
 
             # extra stuff, all optional
             modgui_brand = first_or(world.find_nodes(modguigui, ns_modgui.brand, None), None)
@@ -910,7 +1535,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
 
             # ports
             errpr = False
-            sybls = []
+            sybls = set()
             ports = []
             for port in world.find_nodes(modguigui, ns_modgui.port, None):
                 port_indx = first_or(world.find_nodes(port, ns_lv2core.index, None), None)
@@ -919,7 +1544,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
 
                 if None in (port_indx, port_name, port_symb):
                     if not errpr:
-                        errors.append("modgui has some invalid port data")
+                        report.report('modgui-port-invalid')
                         errpr = True
                     continue
 
@@ -934,9 +1559,9 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                 })
 
                 if port_symb not in sybls:
-                    sybls.append(port_symb)
+                    sybls.add(port_symb)
                 elif not errpr:
-                    errors.append("modgui has some duplicated port symbols")
+                    report.report('modgui-port-symbol-duplicated')
                     errpr = True
 
             # sort ports
@@ -947,6 +1572,172 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                     ports2[port['index']] = port
                 gui['ports'] = [ports2[i] for i in ports2]
 
+    return {
+        'gui': gui,
+    }
+
+# bulk port data
+
+# plugins with at least this many ports get their port data read in bulk, None (the default) always uses lilv
+# Bulk reading parses the plugin data files again with the turtle parser, which is not proven to be faster than
+# asking lilv for each port, so it needs to be enabled explicitly (after measuring on the target device).
+BULK_PORTS_MIN = None
+
+# port predicates where only the first value is used, bulk reading gives up if any of them has more than one
+BULK_SINGLE_PREDICATES = frozenset(uri for ns, names in (
+    (PREFIX_LV2CORE, ("name", "shortName", "default", "minimum", "maximum", "designation")),
+    (PREFIX_MOD, ("default", "minimum", "maximum", "rangeSteps")),
+    ("http://lv2plug.in/ns/ext/port-props#", ("rangeSteps",)),
+    ("http://lv2plug.in/ns/extensions/units#", ("unit", "render", "symbol")),
+    ("http://lv2plug.in/ns/ext/atom#", ("bufferType",)),
+    ("http://www.w3.org/2000/01/rdf-schema#", ("comment", "label")),
+    ("http://www.w3.org/1999/02/22-rdf-syntax-ns#", ("value",)),
+) for uri in (ns + name for name in names))
+
+# literal datatypes that are known to convert the same way as in lilv
+BULK_DATATYPES = frozenset((None, PREFIX_XSD + "integer", PREFIX_XSD + "int", PREFIX_XSD + "decimal",
+                            PREFIX_XSD + "double", PREFIX_XSD + "boolean"))
+
+BULK_EVENT_PREDICATES = ("http://lv2plug.in/ns/ext/event#supportsEvent", "http://lv2plug.in/ns/ext/atom#supports")
+
+class BulkScalePoint(object):
+    def __init__(self, label, value):
+        self.label = label
+        self.value = value
+
+    def get_label(self):
+        return self.label
+
+    def get_value(self):
+        return self.value
+
+# A port read from the plugin data files, with the subset of the lilv port api used in get_plugin_ports_info
+class BulkPort(object):
+    def __init__(self, graph, node, symbol):
+        self.graph  = graph
+        self.node   = node
+        self.symbol = symbol
+
+    def get_value(self, predicate):
+        return sort_nodes(self.graph.objects(self.node, str(predicate)))
+
+    # same as lilv, the first name but only if it is a string
+    def get_name(self):
+        name = first_or(self.get_value(PREFIX_LV2CORE + "name"), None)
+        return name if name is not None and name.is_literal() and name.is_string() else None
+
+    def get_symbol(self):
+        return self.symbol
+
+    def supports_event(self, event):
+        event = str(event)
+        return any(event in self.graph.objects(self.node, predicate) for predicate in BULK_EVENT_PREDICATES)
+
+    # same as lilv, points without a value or label are skipped
+    def get_scale_points(self):
+        points = []
+
+        for point in self.graph.objects(self.node, PREFIX_LV2CORE + "scalePoint"):
+            value = self.graph.value(point, lilv.LILV_NS_RDF + "value")
+            label = self.graph.value(point, lilv.LILV_NS_RDFS + "label")
+
+            if value is not None and label is not None:
+                points.append(BulkScalePoint(label, value))
+
+        return points if points else None
+
+# Check if the statements about a subject can be used as they are, instead of asking lilv
+def is_bulk_subject_safe(graph, subject):
+    for predicate, objects in graph.predicates(subject).items():
+        if len(objects) > 1 and predicate in BULK_SINGLE_PREDICATES:
+            return False
+
+        for obj in objects:
+            if obj.is_literal() and (obj.language is not None or obj.datatype not in BULK_DATATYPES):
+                return False
+
+    return True
+
+# Read all ports of a plugin at once, by parsing its data files instead of asking lilv for each value
+# Returns a list of BulkPort objects sorted by index, or None when the result could differ from lilv's
+# (data that cannot be parsed, literals with language tags or unknown datatypes, several values where lilvlib
+# uses the first one, scale points with the same value), the lilv port api needs to be used in that case.
+def get_bulk_ports(world, plugin):
+    graph = Graph()
+
+    try:
+        for i, node in enumerate(plugin.get_data_uris()):
+            path = node.get_path()
+            if path is None:
+                return None
+            parse_turtle_file(path, graph=graph, blankPrefix="f%d_" % i)
+    except (TurtleError, OSError, UnicodeDecodeError, ValueError):
+        return None
+
+    numports  = plugin.get_num_ports()
+    portnodes = graph.objects(str(plugin.get_uri()), PREFIX_LV2CORE + "port")
+
+    if len(portnodes) != numports:
+        return None
+
+    ports = [None] * numports
+
+    for node in portnodes:
+        # ports with an uri could have data coming from other files
+        if not isinstance(node, BlankNode) or not is_bulk_subject_safe(graph, node):
+            return None
+
+        indexes = graph.objects(node, PREFIX_LV2CORE + "index")
+        symbols = graph.objects(node, PREFIX_LV2CORE + "symbol")
+
+        if len(indexes) != 1 or len(symbols) != 1 or not indexes[0].is_literal() or not indexes[0].is_int():
+            return None
+        if not symbols[0].is_literal() or not symbols[0].is_string():
+            return None
+
+        index = int(indexes[0])
+
+        if index < 0 or index >= numports or ports[index] is not None:
+            return None
+
+        port = BulkPort(graph, node, symbols[0])
+
+        # scale points are sorted by value later on, same values would depend on lilv's internal order
+        values = set()
+        for point in graph.objects(node, PREFIX_LV2CORE + "scalePoint"):
+            if not is_bulk_subject_safe(graph, point):
+                return None
+            value = graph.value(point, lilv.LILV_NS_RDF + "value")
+            if value is None or graph.value(point, lilv.LILV_NS_RDFS + "label") is None:
+                continue
+            # compare numbers by value, so that "1" and "1.0" are seen as the same
+            key = float(value) if value.is_literal() and (value.is_int() or value.is_float()) else str(value)
+            if key in values:
+                return None
+            values.add(key)
+
+        for unit in graph.objects(node, "http://lv2plug.in/ns/extensions/units#unit"):
+            if isinstance(unit, BlankNode) and not is_bulk_subject_safe(graph, unit):
+                return None
+
+        ports[index] = port
+
+    return ports
+
+# ports
+def get_plugin_ports_info(world, plugin, useAbsolutePath, report):
+    # define the needed stuff
+    vocabulary = get_vocabulary(world)
+    ns_rdf     = vocabulary.rdf
+    ns_rdfs    = vocabulary.rdfs
+    ns_lv2core = vocabulary.lv2core
+    ns_atom    = vocabulary.atom
+    ns_midi    = vocabulary.midi
+    ns_morph   = vocabulary.morph
+    ns_pprops  = vocabulary.pprops
+    ns_units   = vocabulary.units
+    ns_mod     = vocabulary.mod
+
     # --------------------------------------------------------------------------------------------------------
     # ports
 
@@ -957,8 +1748,23 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
         'midi'   : { 'input': [], 'output': [] }
     }
 
-    portsymbols = []
-    portnames   = []
+    portsymbols = set()
+    portnames   = set()
+
+    # read all ports at once for plugins with many of them
+    bulkports = None
+
+    if BULK_PORTS_MIN is not None and plugin.get_num_ports() >= BULK_PORTS_MIN:
+        bulkports = get_bulk_ports(world, plugin)
+
+    def find_nodes(subject, predicate):
+        # blank nodes from bulk ports only exist in the plugin data files
+        if isinstance(subject, BlankNode):
+            return sort_nodes(bulkports[0].graph.objects(subject, str(predicate)))
+        # other bulk nodes can be described anywhere, so ask lilv
+        if isinstance(subject, URIRef):
+            subject = world.new_uri(subject)
+        return world.find_nodes(subject, predicate, None)
 
     # function for filling port info
     def fill_port_info(port):
@@ -967,25 +1773,25 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
 
         if not portname:
             portname = "_%i" % index
-            errors.append("port with index %i has no name" % index)
+            report.report('port-name-missing', index=index)
 
         portsymbol = str_or(port.get_symbol())
 
         if not portsymbol:
             portsymbol = "_%i" % index
-            errors.append("port with index %i has no symbol" % index)
+            report.report('port-symbol-missing', index=index)
 
-        # check for duplicate names
-        if portname in portnames:
-            warnings.append("port name '%s' is not unique" % portname)
-        else:
-            portnames.append(portname)
+        # check for duplicate names and symbols
+        if report.enabled:
+            if portname in portnames:
+                report.report('port-name-duplicated', port=portname)
+            else:
+                portnames.add(portname)
 
-        # check for duplicate symbols
-        if portsymbol in portsymbols:
-            errors.append("port symbol '%s' is not unique" % portsymbol)
-        else:
-            portsymbols.append(portsymbol)
+            if portsymbol in portsymbols:
+                report.report('port-symbol-duplicated', symbol=portsymbol)
+            else:
+                portsymbols.add(portsymbol)
 
         # short name
         psname = str_first_or(port.get_value(ns_lv2core.shortName))
@@ -993,18 +1799,18 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
         if not psname:
             psname = get_short_port_name(portname)
             if len(psname) > 16:
-                warnings.append("port '%s' name is too big, reduce the name size or provide a shortName" % portname)
+                report.report('port-name-too-long', port=portname)
 
         elif len(psname) > 16:
             psname = psname[:16]
-            errors.append("port '%s' short name has more than 16 characters" % portname)
+            report.report('port-short-name-too-long', port=portname)
 
         # check for old style shortName
-        if first_or(port.get_value(ns_lv2core.shortname), None) is not None:
-            errors.append("port '%s' short name is using old style 'shortname' instead of 'shortName'" % portname)
+        if report.enabled and first_or(port.get_value(ns_lv2core.shortname), None) is not None:
+            report.report('port-short-name-old-style', port=portname)
 
         # port types
-        types = [typ.rsplit("#",1)[-1].replace("Port","",1) for typ in get_port_data(port, ns_rdf.type_)]
+        types = [get_port_type_name(typ) for typ in get_port_data(port, ns_rdf.type_)]
 
         if "Atom" in types \
             and port.supports_event(ns_midi.MidiEvent) \
@@ -1026,7 +1832,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
         rangeSteps = (get_port_data(port, ns_mod.rangeSteps) or get_port_data(port, ns_pprops.rangeSteps) or [None])[0]
 
         # port properties
-        properties = [typ.rsplit("#",1)[-1] for typ in get_port_data(port, ns_lv2core.portProperty)]
+        properties = [get_uri_fragment(typ) for typ in get_port_data(port, ns_lv2core.portProperty)]
 
         # data
         ranges      = {}
@@ -1042,7 +1848,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
             isInteger = "integer" in properties
 
             if isInteger and "CV" in types:
-                errors.append("port '%s' has integer property and CV type" % portname)
+                report.report('port-integer-cv', port=portname)
 
             xdefault = first_or(port.get_value(ns_mod.default), first_or(port.get_value(ns_lv2core.default), None))
             xminimum = first_or(port.get_value(ns_mod.minimum), first_or(port.get_value(ns_lv2core.minimum), None))
@@ -1054,40 +1860,40 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                         ranges['minimum'] = int(xminimum)
                     elif xminimum.is_float():
                         ranges['minimum'] = int(float(xminimum))
-                        warnings.append("port '%s' has integer property but minimum value is not an integer" % portname)
+                        report.report('port-range-not-integer', port=portname, range="minimum")
                     else:
-                        errors.append("port '%s' minimum value is not an integer or float" % portname)
+                        report.report('port-range-invalid', port=portname, range="minimum")
 
                     if xmaximum.is_int():
                         ranges['maximum'] = int(xmaximum)
                     elif xmaximum.is_float():
                         ranges['maximum'] = int(float(xmaximum))
-                        warnings.append("port '%s' has integer property but maximum value is not an integer" % portname)
+                        report.report('port-range-not-integer', port=portname, range="maximum")
                     else:
-                        errors.append("port '%s' maximum value is not an integer or float" % portname)
+                        report.report('port-range-invalid', port=portname, range="maximum")
 
                 else:
                     if xminimum.is_float():
                         ranges['minimum'] = float(xminimum)
                     elif xminimum.is_int():
                         ranges['minimum'] = float(int(xminimum))
-                        warnings.append("port '%s' does not have integer property but minimum value is an integer" % portname)
+                        report.report('port-range-integer', port=portname, range="minimum")
                     else:
                         ranges['minimum'] = 0.0
-                        errors.append("port '%s' minimum value is not an integer or float" % portname)
+                        report.report('port-range-invalid', port=portname, range="minimum")
 
                     if xmaximum.is_float():
                         ranges['maximum'] = float(xmaximum)
                     elif xmaximum.is_int():
                         ranges['maximum'] = float(int(xmaximum))
-                        warnings.append("port '%s' does not have integer property but maximum value is an integer" % portname)
+                        report.report('port-range-integer', port=portname, range="maximum")
                     else:
                         ranges['maximum'] = 1.0
-                        errors.append("port '%s' maximum value is not an integer or float" % portname)
+                        report.report('port-range-invalid', port=portname, range="maximum")
 
                 if ranges['minimum'] >= ranges['maximum']:
                     ranges['maximum'] = ranges['minimum'] + (1 if isInteger else 0.1)
-                    errors.append("port '%s' minimum value is equal or higher than its maximum" % portname)
+                    report.report('port-range-inverted', port=portname)
 
                 if xdefault is not None:
                     if isInteger:
@@ -1095,20 +1901,20 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                             ranges['default'] = int(xdefault)
                         elif xdefault.is_float():
                             ranges['default'] = int(float(xdefault))
-                            warnings.append("port '%s' has integer property but default value is not an integer" % portname)
+                            report.report('port-range-not-integer', port=portname, range="default")
                         else:
                             ranges['default'] = ranges['minimum']
-                            errors.append("port '%s' default value is not an integer or float" % portname)
+                            report.report('port-range-invalid', port=portname, range="default")
 
                     else:
                         if xdefault.is_float():
                             ranges['default'] = float(xdefault)
                         elif xdefault.is_int():
                             ranges['default'] = float(int(xdefault))
-                            warnings.append("port '%s' does not have integer property but default value is an integer" % portname)
+                            report.report('port-range-integer', port=portname, range="default")
                         else:
                             ranges['default'] = 0.0
-                            errors.append("port '%s' default value is not an integer or float" % portname)
+                            report.report('port-range-invalid', port=portname, range="default")
 
                     testmin = ranges['minimum']
                     testmax = ranges['maximum']
@@ -1119,13 +1925,13 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
 
                     if not (testmin <= ranges['default'] <= testmax):
                         ranges['default'] = ranges['minimum']
-                        errors.append("port '%s' default value is out of bounds" % portname)
+                        report.report('port-default-out-of-bounds', port=portname)
 
                 else:
                     ranges['default'] = ranges['minimum']
 
                     if "Input" in types:
-                        errors.append("port '%s' is missing default value" % portname)
+                        report.report('port-default-missing', port=portname)
 
             else:
                 if isInteger:
@@ -1138,7 +1944,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                     ranges['default'] = 0.0
 
                 if "CV" not in types and designation != (PREFIX_LV2CORE + "latency"):
-                    errors.append("port '%s' is missing value ranges" % portname)
+                    report.report('port-ranges-missing', port=portname)
 
             scalepoint_nodes = port.get_scale_points()
 
@@ -1150,17 +1956,17 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                     value = sp.get_value()
 
                     if label is None:
-                        errors.append("a port scalepoint is missing its label")
+                        report.report('port-scalepoint-label-missing')
                         continue
 
                     label = str(label)
 
                     if not label:
-                        errors.append("a port scalepoint label is empty")
+                        report.report('port-scalepoint-label-empty')
                         continue
 
                     if value is None:
-                        errors.append("port scalepoint '%s' is missing its value" % label)
+                        report.report('port-scalepoint-value-missing', label=label)
                         continue
 
                     if isInteger:
@@ -1168,26 +1974,28 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                             value = int(value)
                         elif value.is_float():
                             value = float(value)
-                            warnings.append("port '%s' scalepoint '%s' value is not an integer" % (portname, label))
+                            report.report('port-scalepoint-not-integer', port=portname, label=label)
                         else:
                             value = ranges['minimum']
-                            warnings.append("port '%s' scalepoint '%s' value is not an integer or float" % (portname, label))
+                            report.report('port-scalepoint-invalid', port=portname, label=label)
 
                     else:
                         if value.is_int():
                             value = int(value)
-                            warnings.append("port '%s' scalepoint '%s' value is an integer" % (portname, label))
+                            report.report('port-scalepoint-integer', port=portname, label=label)
                         elif value.is_float():
                             value = float(value)
                         else:
                             value = ranges['minimum']
-                            warnings.append("port '%s' scalepoint '%s' value is not an integer or float" % (portname, label))
+                            report.report('port-scalepoint-invalid', port=portname, label=label)
 
                     if ranges['minimum'] <= value <= ranges['maximum']:
                         scalepoints_unsorted.append((value, label))
                     else:
-                        errors.append(("port scalepoint '%s' has an out-of-bounds value:\n" % label) +
-                                      ("%d < %d < %d" if isInteger else "%f < %f < %f") % (ranges['minimum'], value, ranges['maximum']))
+                        report.report('port-scalepoint-out-of-bounds', label=label,
+                                      bounds=("%d < %d < %d" if isInteger else "%f < %f < %f") % (ranges['minimum'],
+                                                                                                 value,
+                                                                                                 ranges['maximum']))
 
                 if len(scalepoints_unsorted) != 0:
                     unsorted = dict(s for s in scalepoints_unsorted)
@@ -1196,7 +2004,7 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                     scalepoints = list({ 'value': v, 'label': unsorted[v] } for v in values)
 
             if "enumeration" in properties and len(scalepoints) <= 1:
-                errors.append("port '%s' wants to use enumeration but doesn't have enough values" % portname)
+                report.report('port-enumeration-values', port=portname)
                 properties.remove("enumeration")
 
         # control ports might contain unit
@@ -1214,37 +2022,34 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                     alnum = uuri.isalnum()
 
                     if not alnum:
-                        errors.append("port '%s' has wrong lv2 unit uri" % portname)
+                        report.report('port-unit-invalid', port=portname)
                         uuri = uuri.rsplit("#",1)[-1].rsplit("/",1)[-1]
 
                     ulabel, urender, usymbol = get_port_unit(uuri)
 
                     if alnum and not (ulabel and urender and usymbol):
-                        errors.append("port '%s' has unknown lv2 unit (our bug?, data is '%s', '%s', '%s')" % (portname,
-                                                                                                               ulabel,
-                                                                                                               urender,
-                                                                                                               usymbol))
+                        report.report('port-unit-unknown', port=portname, label=ulabel, render=urender, symbol=usymbol)
 
                 # using custom unit
                 else:
-                    xlabel = first_or(world.find_nodes(uunit, ns_rdfs.label, None), None)
-                    xrender = first_or(world.find_nodes(uunit, ns_units.render, None), None)
-                    xsymbol = first_or(world.find_nodes(uunit, ns_units.symbol, None), None)
+                    xlabel = first_or(find_nodes(uunit, ns_rdfs.label), None)
+                    xrender = first_or(find_nodes(uunit, ns_units.render), None)
+                    xsymbol = first_or(find_nodes(uunit, ns_units.symbol), None)
 
                     if xlabel is not None:
                         ulabel = str(xlabel)
                     else:
-                        errors.append("port '%s' has custom unit with no label" % portname)
+                        report.report('port-unit-label-missing', port=portname)
 
                     if xrender is not None:
                         urender = str(xrender)
                     else:
-                        errors.append("port '%s' has custom unit with no render" % portname)
+                        report.report('port-unit-render-missing', port=portname)
 
                     if xsymbol is not None:
                         usymbol = str(xsymbol)
                     else:
-                        errors.append("port '%s' has custom unit with no symbol" % portname)
+                        report.report('port-unit-symbol-missing', port=portname)
 
         return (types, {
             'name'   : portname,
@@ -1263,7 +2068,10 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
             'shortName'  : psname,
         })
 
-    for p in (plugin.get_port_by_index(i) for i in range(plugin.get_num_ports())):
+    if bulkports is None:
+        bulkports = (plugin.get_port_by_index(i) for i in range(plugin.get_num_ports()))
+
+    for p in bulkports:
         types, info = fill_port_info(p)
 
         info['index'] = index
@@ -1277,146 +2085,530 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
                 ports[typ] = { 'input': [], 'output': [] }
             ports[typ]["input" if isInput else "output"].append(info)
 
-    # --------------------------------------------------------------------------------------------------------
-    # presets
+    return {
+        'ports': ports,
+    }
 
-    def get_preset_data(preset):
-        world.load_resource(preset)
+# presets
+def get_plugin_presets_info(world, plugin, useAbsolutePath, report):
+    return {
+        'presets': [{ 'uri': p['uri'], 'label': p['label'] } for p in get_plugin_presets(world, plugin, report)],
+    }
+
+# all the keys returned by get_plugin_info, in order
+PLUGIN_INFO_FIELDS = (
+    'uri', 'name', 'binary', 'brand', 'label', 'license', 'comment', 'category', 'microVersion', 'minorVersion',
+    'version', 'stability', 'author', 'bundles', 'gui', 'ports', 'presets', 'errors', 'warnings'
+)
+
+# sections of get_plugin_info, in order, together with the keys they provide
+PLUGIN_INFO_SECTIONS = (
+    ('base', get_plugin_base_info, ('uri', 'name', 'binary', 'brand', 'label', 'license', 'comment',
+                                    'microVersion', 'minorVersion', 'version', 'stability', 'author')),
+    ('category', get_plugin_category_info, ('category',)),
+    ('bundles', get_plugin_bundles_info, ('bundles',)),
+    ('gui', get_plugin_gui_info, ('gui',)),
+    ('ports', get_plugin_ports_info, ('ports',)),
+    ('presets', get_plugin_presets_info, ('presets',)),
+)
+
+# ------------------------------------------------------------------------------------------------------------
+# get_plugin_info
+
+# Get info from a lilv plugin
+# This is used in get_plugins_info below and MOD-SDK
+# @a fields is an optional list of PLUGIN_INFO_FIELDS to get, sections not needed for them are skipped.
+# @a validate can be set to False to skip all validation, 'errors' and 'warnings' are empty in that case.
+# Validation is also skipped when @a fields does not include 'errors' or 'warnings'.
+def get_plugin_info(world, plugin, useAbsolutePath = True, fields = None, validate = True):
+    if fields is not None:
+        if not set(fields).issubset(PLUGIN_INFO_FIELDS):
+            raise Exception('get_plugin_info(%s) - unknown fields requested' % str(plugin.get_uri()))
+        if 'errors' not in fields and 'warnings' not in fields:
+            validate = False
+
+    return PluginInfo(world, plugin, useAbsolutePath, validate).to_dict(fields)
+
+# ------------------------------------------------------------------------------------------------------------
+# PluginInfo
+
+# Lazy version of get_plugin_info, each section is only computed (once) when one of its keys is first accessed
+# It can be used as a read-only dictionary with the same keys and values as get_plugin_info returns.
+# Note that the lilv world and plugin must be kept alive (and their bundles loaded) while this is in use.
+# Accessing 'errors' or 'warnings' computes everything, since all sections can report problems.
+# @a validate can be set to False to skip all validation, or be a ValidationReport to use (with its own ignored rules).
+# The rule ids of the problems found are available in report.issues once 'errors' or 'warnings' are accessed.
+class PluginInfo(Mapping):
+    def __init__(self, world, plugin, useAbsolutePath = True, validate = True):
+        self.world           = world
+        self.plugin          = plugin
+        self.useAbsolutePath = useAbsolutePath
+        self.report          = validate if isinstance(validate, ValidationReport) else ValidationReport(validate)
+        self.data            = {}
+        self.loaded          = set()
+
+    def load_section(self, name, func):
+        if name in self.loaded:
+            return
+        # only marked as loaded once it worked, so a section that raised is tried again on the next access
+        with profile_phase(name, self.plugin):
+            self.data.update(func(self.world, self.plugin, self.useAbsolutePath, self.report))
+        self.loaded.add(name)
+
+    def __getitem__(self, key):
+        if key in self.data:
+            return self.data[key]
+
+        if key in ('errors', 'warnings'):
+            for name, func, keys in PLUGIN_INFO_SECTIONS:
+                self.load_section(name, func)
+            with profile_phase('checks', self.plugin):
+                self.report.check(dict(self.data))
+            self.data['errors']   = sorted(self.report.errors)
+            self.data['warnings'] = sorted(self.report.warnings)
+            return self.data[key]
+
+        for name, func, keys in PLUGIN_INFO_SECTIONS:
+            if key in keys:
+                self.load_section(name, func)
+                return self.data[key]
+
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(PLUGIN_INFO_FIELDS)
+
+    def __len__(self):
+        return len(PLUGIN_INFO_FIELDS)
+
+    # Get everything (or only the keys in @a fields) as a regular dictionary
+    def to_dict(self, fields = None):
+        return dict((key, self[key]) for key in PLUGIN_INFO_FIELDS if fields is None or key in fields)
+
+# ------------------------------------------------------------------------------------------------------------
+# get_plugin_info_helper
+
+# Get info from a simple URI, without the need of your own lilv world
+# This is used by get_plugins_info in MOD-SDK
+# @a world is an optional WorldPool to use instead of a new world with everything loaded
+# @a fields and @a validate are the same as in get_plugin_info.
+def get_plugin_info_helper(uri, world = None, fields = None, validate = True):
+    if world is None:
+        world = WorldPool(True)
+    plugins = world.get_all_plugins()
+    return [get_plugin_info(world, p, False, fields, validate) for p in plugins]
+
+# ------------------------------------------------------------------------------------------------------------
+# get_plugins_info
+
+# Get plugin-related info from a list of lv2 bundles
+# @a bundles is a list of strings, consisting of directories in the filesystem (absolute pathnames).
+# @a world is an optional WorldPool to use, bundles are kept loaded in it so they can be queried again later.
+# @a fields and @a validate are the same as in get_plugin_info.
+def get_plugins_info(bundles, world = None, fields = None, validate = True):
+    # if empty, do nothing
+    if len(bundles) == 0:
+        raise Exception('get_plugins_info() - no bundles provided')
+
+    if fields is not None and not set(fields).issubset(PLUGIN_INFO_FIELDS):
+        raise Exception('get_plugins_info() - unknown fields requested')
+
+    # Create our own unique lilv world if needed
+    # We'll load the selected bundles and get all plugins from it
+    if world is None:
+        world = WorldPool()
+
+    # load all bundles
+    for bundle in bundles:
+        world.add_bundle(bundle)
 
+    # get all plugins available in the selected bundles
+    plugins = world.get_bundles_plugins(bundles)
+
+    # make sure the bundles include something
+    if len(plugins) == 0:
+        raise Exception('get_plugins_info() - selected bundles have no plugins')
+
+    # return all the info
+    return [get_plugin_info(world, p, False, fields, validate) for p in plugins]
+
+# ------------------------------------------------------------------------------------------------------------
+# presets
+
+# Get the presets of a plugin, as a list of uri, label and file (the ttl with the preset data), sorted by uri
+# Preset files are only loaded when the label is not already known (usually it is in the bundle manifest).
+# @a report is an optional ValidationReport for missing uris and labels.
+def get_plugin_presets(world, plugin, report = None):
+    # define the needed stuff
+    vocabulary = get_vocabulary(world)
+    ns_rdfs    = vocabulary.rdfs
+    ns_pset    = vocabulary.pset
+
+    if report is None:
+        report = ValidationReport(False)
+
+    presets = {}
+
+    for preset in plugin.get_related(ns_pset.Preset):
         uri   = str_or(preset)
         label = str_first_or(world.find_nodes(preset, ns_rdfs.label, None))
 
+        if not label:
+            world.load_resource(preset)
+            label = str_first_or(world.find_nodes(preset, ns_rdfs.label, None))
+
         if not uri:
-            errors.append("preset with label '%s' has no uri" % (label or "<unknown>"))
+            report.report('preset-uri-missing', label=label or "<unknown>")
         if not label:
-            errors.append("preset with uri '%s' has no label" % (uri or "<unknown>"))
+            report.report('preset-label-missing', uri=uri or "<unknown>")
 
-        return (uri, label)
+        filenode = first_or(world.find_nodes(preset, ns_rdfs.seeAlso, None), None)
 
-    presets = []
+        if filenode is not None:
+            filename = filenode.get_path()
+        elif uri.startswith("file:"):
+            filename = preset.get_path()
+        else:
+            filename = ""
+
+        presets[uri] = {
+            'uri'  : uri,
+            'label': label,
+            'file' : filename,
+        }
+
+    return [presets[uri] for uri in sorted(presets)]
+
+# Convert a turtle node from a preset state into a json-friendly value
+def get_state_value(graph, node):
+    if isinstance(node, BlankNode):
+        return dict((str(pred), get_state_value(graph, first_or(graph.objects(node, pred), None)))
+                    for pred in graph.predicates(node))
+    if isinstance(node, Literal):
+        if node.is_bool():
+            return node.as_bool()
+        if node.is_int():
+            return int(node)
+        if node.is_float():
+            return float(node)
+    return str(node) if node is not None else None
+
+# Get the full data of a preset, loading its resource file
+# Returns uri, label, plugin (the uri it applies to), bank, the value of each port (by symbol) and the plugin state
+# as a dictionary of state property uri -> value.
+def get_preset_info(world, uri):
+    # define the needed stuff
+    vocabulary = get_vocabulary(world)
+    ns_rdf     = vocabulary.rdf
+    ns_rdfs    = vocabulary.rdfs
+    ns_lv2core = vocabulary.lv2core
+    ns_pset    = vocabulary.pset
+    ns_state   = vocabulary.state
 
-    presets_data = iter_compat(plugin.get_related(ns_pset.Preset), get_preset_data)
+    preset = world.new_uri(uri)
+    world.load_resource(preset)
 
-    if len(presets_data) != 0:
-        unsorted = dict(p for p in presets_data)
-        uris     = list(unsorted.keys())
-        uris.sort()
-        presets  = list({ 'uri': p, 'label': unsorted[p] } for p in uris)
-        del unsorted, uris
+    if not world.ask(preset, ns_rdf.type_, ns_pset.Preset):
+        raise Exception('get_preset_info(%s) - not a preset' % uri)
 
-    # --------------------------------------------------------------------------------------------------------
-    # done
+    ports = {}
 
-    return {
-        'uri' : uri,
-        'name': name,
+    for port in world.find_nodes(preset, ns_lv2core.port, None):
+        symbol = world.get(port, ns_lv2core.symbol, None)
+        value  = world.get(port, ns_pset.value, None)
 
-        'binary' : binary,
-        'brand'  : brand,
-        'label'  : label,
-        'license': license,
-        'comment': comment,
+        if symbol is None or value is None:
+            continue
 
-        'category'    : get_category(plugin.get_value(ns_rdf.type_)),
-        'microVersion': microVersion,
-        'minorVersion': minorVersion,
+        ports[str(symbol)] = float(value)
 
-        'version'  : version,
-        'stability': stability,
+    # lilv cannot list the properties of the state, read them from the preset file instead
+    # A state that cannot be read raises, so it is never confused with a preset without state.
+    state = {}
 
-        'author' : author,
-        'bundles': sorted(bundles),
-        'gui'    : gui,
-        'ports'  : ports,
-        'presets': presets,
+    if world.get(preset, ns_state.state, None) is not None:
+        filenode = first_or(world.find_nodes(preset, ns_rdfs.seeAlso, None), None)
+        filename = filenode.get_path() if filenode is not None else preset.get_path()
+
+        if not filename:
+            raise Exception('get_preset_info(%s) - preset state is not in a local file' % uri)
+
+        try:
+            graph = parse_turtle_file(filename)
+        except (TurtleError, OSError, ValueError) as e:
+            raise Exception('get_preset_info(%s) - cannot read preset state: %s' % (uri, e))
+
+        for node in graph.objects(URIRef(uri), str(ns_state.state)):
+            state.update(get_state_value(graph, node))
 
-        'errors'  : sorted(errors),
-        'warnings': sorted(warnings),
+    return {
+        'uri'   : uri,
+        'label' : str_or(world.get(preset, ns_rdfs.label, None)),
+        'plugin': str_or(world.get(preset, ns_lv2core.appliesTo, None)),
+        'bank'  : str_or(world.get(preset, ns_pset.bank, None)),
+        'ports' : [{ 'symbol': symbol, 'value': ports[symbol] } for symbol in sorted(ports)],
+        'state' : state,
     }
 
-# ------------------------------------------------------------------------------------------------------------
-# get_plugin_info_helper
+# Cache of get_plugin_presets, for looking up presets many times without querying lilv again
+# Presets are kept per bundle (the one containing each preset file, plus the plugin bundle) until that bundle is
+# invalidated, which is needed when presets are added, changed or removed.
+class PresetIndex(object):
+    def __init__(self, world):
+        self.world = world
+        # plugin uri -> presets
+        self.plugins = {}
+        # bundle -> plugin uris with presets in it
+        self.bundles = {}
 
-# Get info from a simple URI, without the need of your own lilv world
-# This is used by get_plugins_info in MOD-SDK
-def get_plugin_info_helper(uri):
-    world = lilv.World()
-    world.load_all()
-    plugins = world.get_all_plugins()
-    return [get_plugin_info(world, p, False) for p in plugins]
+    def get_plugin_presets(self, plugin):
+        uri = str(plugin.get_uri())
+
+        if uri in self.plugins:
+            return self.plugins[uri]
+
+        presets = get_plugin_presets(self.world, plugin)
+        bundles = set(bundle_abspath(os.path.dirname(p['file'])) for p in presets if p['file'])
+        bundles.add(bundle_abspath(plugin.get_bundle_uri().get_path()))
+
+        for bundle in bundles:
+            if bundle not in self.bundles:
+                self.bundles[bundle] = set()
+            self.bundles[bundle].add(uri)
+
+        self.plugins[uri] = presets
+        return presets
+
+    # Forget the presets related to a bundle, or all of them if @a bundle is None
+    # Bundles that are not in the index yet (like a newly saved preset) can belong to any plugin, so also clear all.
+    def invalidate(self, bundle = None):
+        if bundle is not None:
+            bundle = bundle_abspath(bundle)
+
+        if bundle is None or bundle not in self.bundles:
+            self.plugins = {}
+            self.bundles = {}
+            return
+
+        for uri in self.bundles.pop(bundle):
+            self.plugins.pop(uri, None)
 
 # ------------------------------------------------------------------------------------------------------------
-# get_plugins_info
+# get_plugins_summary
 
-# Get plugin-related info from a list of lv2 bundles
+# Faster version of get_plugin_info when we just need what goes in a plugin list
+# Returns uri, name, brand, label, category, version, minorVersion, microVersion, stability and the number of
+# audio, cv and midi ports (in the same format as the pedalboard 'hardware').
+# No validation is done and the filesystem is never touched, only the plugin data already loaded in lilv is used.
+def get_plugin_summary(world, plugin):
+    # define the needed stuff
+    vocabulary = get_vocabulary(world)
+    ns_rdf     = vocabulary.rdf
+    ns_lv2core = vocabulary.lv2core
+    ns_atom    = vocabulary.atom
+    ns_midi    = vocabulary.midi
+    ns_mod     = vocabulary.mod
+
+    name = str(plugin.get_name())
+
+    brand = str_first_or(plugin.get_value(ns_mod.brand))[:16]
+    if not brand:
+        brand = get_default_brand(str_or(plugin.get_author_name()))
+
+    label = str_first_or(plugin.get_value(ns_mod.label))[:24]
+    if not label:
+        label = get_default_label(name, plugin.get_bundle_uri().get_path())
+
+    minorVersion = int_first_or(plugin.get_value(ns_lv2core.minorVersion))
+    microVersion = int_first_or(plugin.get_value(ns_lv2core.microVersion))
+
+    ins  = ns_lv2core.InputPort
+    outs = ns_lv2core.OutputPort
+
+    # cv ports can be lv2:CVPort or mod:CVPort (like in get_plugin_info), ports with both types count only once
+    def get_num_cv_ports(direction):
+        return (plugin.get_num_ports_of_class(ns_lv2core.CVPort, direction) +
+                plugin.get_num_ports_of_class(ns_mod.CVPort, direction) -
+                plugin.get_num_ports_of_class(ns_lv2core.CVPort, ns_mod.CVPort, direction))
+
+    # midi ports need to be checked one by one, but only if the plugin has atom ports
+    midiins  = 0
+    midiouts = 0
+
+    if plugin.get_num_ports_of_class(ns_atom.AtomPort) > 0:
+        for i in range(plugin.get_num_ports()):
+            port = plugin.get_port_by_index(i)
+
+            if not port.is_a(ns_atom.AtomPort) or not port.supports_event(ns_midi.MidiEvent):
+                continue
+            if str_first_or(port.get_value(ns_atom.bufferType)) != str(ns_atom.Sequence):
+                continue
+
+            if port.is_a(ins):
+                midiins += 1
+            else:
+                midiouts += 1
+
+    return {
+        'uri'  : str(plugin.get_uri()),
+        'name' : name,
+        'brand': brand,
+        'label': label,
+
+        'category': get_category(plugin.get_value(ns_rdf.type_)),
+
+        'version'     : "%d.%d" % (minorVersion, microVersion),
+        'minorVersion': minorVersion,
+        'microVersion': microVersion,
+        'stability'   : get_stability(minorVersion, microVersion),
+
+        'io': {
+            'audio': {
+                'ins' : plugin.get_num_ports_of_class(ns_lv2core.AudioPort, ins),
+                'outs': plugin.get_num_ports_of_class(ns_lv2core.AudioPort, outs),
+            },
+            'cv': {
+                'ins' : get_num_cv_ports(ins),
+                'outs': get_num_cv_ports(outs),
+            },
+            'midi': {
+                'ins' : midiins,
+                'outs': midiouts,
+            },
+        },
+    }
+
+# Faster version of get_plugins_info, see get_plugin_summary
 # @a bundles is a list of strings, consisting of directories in the filesystem (absolute pathnames).
-def get_plugins_info(bundles):
+def get_plugins_summary(bundles, world = None):
     # if empty, do nothing
     if len(bundles) == 0:
-        raise Exception('get_plugins_info() - no bundles provided')
+        raise Exception('get_plugins_summary() - no bundles provided')
 
-    # Create our own unique lilv world
-    # We'll load the selected bundles and get all plugins from it
-    world = lilv.World()
-
-    # this is needed when loading specific bundles instead of load_all
-    world.load_specifications()
-    world.load_plugin_classes()
+    # Create our own unique lilv world if needed
+    if world is None:
+        world = WorldPool()
 
     # load all bundles
     for bundle in bundles:
-        # lilv wants the last character as the separator
-        bundle = os.path.abspath(bundle)
-        if not bundle.endswith(os.sep):
-            bundle += os.sep
-
-        # convert bundle string into a lilv node
-        bundlenode = world.new_file_uri(None, bundle)
-
-        # load the bundle
-        world.load_bundle(bundlenode)
+        world.add_bundle(bundle)
 
     # get all plugins available in the selected bundles
-    plugins = world.get_all_plugins()
+    plugins = world.get_bundles_plugins(bundles)
 
     # make sure the bundles include something
     if len(plugins) == 0:
-        raise Exception('get_plugins_info() - selected bundles have no plugins')
+        raise Exception('get_plugins_summary() - selected bundles have no plugins')
 
-    # return all the info
-    return [get_plugin_info(world, p, False) for p in plugins]
+    summaries = []
+
+    for plugin in plugins:
+        with profile_phase('summary', plugin):
+            summaries.append(get_plugin_summary(world, plugin))
+
+    return summaries
 
 # ------------------------------------------------------------------------------------------------------------
+# iter_plugins_info
+
+# Generator version of get_plugin_info_helper, yields the info of each plugin as soon as it is ready
+# A plugin that fails to be extracted is skipped instead of aborting the whole scan,
+# @a onerror is called with the plugin uri and the exception when that happens.
+# @a plugins is an optional list of plugins to use instead of all the ones in the world.
+# @a validate is the same as in get_plugin_info.
+def iter_world_plugins_info(world, plugins = None, useAbsolutePath = False, onerror = None, validate = True):
+    if plugins is None:
+        plugins = world.get_all_plugins()
+
+    for plugin in plugins:
+        try:
+            info = get_plugin_info(world, plugin, useAbsolutePath, None, validate)
+        except Exception as e:
+            if onerror is not None:
+                onerror(str(plugin.get_uri()), e)
+            continue
 
-def main():
-    from sys import argv
-    from pprint import pprint
+        yield info
+
+# Generator version of get_plugins_info
+# @a bundles is a list of strings, consisting of directories in the filesystem (absolute pathnames).
+# @a world is an optional WorldPool to use, bundles are kept loaded in it so they can be queried again later.
+def iter_plugins_info(bundles, world = None, useAbsolutePath = False, onerror = None, validate = True):
+    # Create our own unique lilv world if needed
+    if world is None:
+        world = WorldPool()
+
+    # load all bundles
+    for bundle in bundles:
+        world.add_bundle(bundle)
 
-    for i in get_plugins_info(argv[1:]):
-        warnings = i['warnings'].copy()
+    yield from iter_world_plugins_info(world, world.get_bundles_plugins(bundles), useAbsolutePath, onerror, validate)
 
-        if 'plugin brand is missing' in warnings:
-            i['warnings'].remove('plugin brand is missing')
+# ------------------------------------------------------------------------------------------------------------
+# get_plugins_info_parallel
+
+# lilv objects cannot be shared between processes, so each worker process gets its own world
+_parallel_world = None
+
+def _parallel_init():
+    global _parallel_world
+    _parallel_world = WorldPool()
+
+def _parallel_run(bundles, useAbsolutePath):
+    for bundle in bundles:
+        _parallel_world.add_bundle(bundle)
+
+    try:
+        return [get_plugin_info(_parallel_world, p, useAbsolutePath) for p in _parallel_world.get_bundles_plugins(bundles)]
+    finally:
+        for bundle in bundles:
+            _parallel_world.remove_bundle(bundle)
+
+# Parallel version of get_plugins_info, bundles are split in chunks and extracted in a pool of processes
+# The result is the same list as get_plugins_info, sorted by plugin uri as lilv does.
+# Bundles that describe the same uris (see group_related_bundles) always go in the same chunk, so plugin data spread
+# across bundles is seen just like when everything is loaded together.
+# @a bundles is a list of strings, consisting of directories in the filesystem (absolute pathnames).
+# @a workers is the number of processes to use, defaults to the number of CPUs.
+# @a chunksize is the number of bundles each process loads at once, a chunk can be bigger to fit related bundles.
+def get_plugins_info_parallel(bundles, workers = None, chunksize = 16, useAbsolutePath = False):
+    # if empty, do nothing
+    if len(bundles) == 0:
+        raise Exception('get_plugins_info_parallel() - no bundles provided')
+
+    bundles   = [bundle_abspath(bundle) for bundle in bundles]
+    chunksize = max(1, chunksize)
+    chunks    = [[]]
+    infos     = {}
 
-        if 'plugin label is missing' in warnings:
-            i['warnings'].remove('plugin label is missing')
+    for group in group_related_bundles(bundles):
+        if chunks[-1] and len(chunks[-1]) + len(group) > chunksize:
+            chunks.append([])
+        chunks[-1] += group
 
-        if 'no modgui available' in warnings:
-            i['warnings'].remove('no modgui available')
+    with ProcessPoolExecutor(max_workers=workers, initializer=_parallel_init) as executor:
+        for chunkinfos in executor.map(_parallel_run, chunks, [useAbsolutePath] * len(chunks)):
+            for info in chunkinfos:
+                # lilv ignores duplicate plugins, keeping the one from the first loaded bundle
+                if info['uri'] not in infos:
+                    infos[info['uri']] = info
+
+    # make sure the bundles include something
+    if len(infos) == 0:
+        raise Exception('get_plugins_info_parallel() - selected bundles have no plugins')
 
-        for warn in warnings:
-            if "has no short name" in warn:
-                i['warnings'].remove(warn)
+    return [infos[uri] for uri in sorted(infos)]
 
-        pprint({
-            'uri'     : i['uri'],
-            'errors'  : i['errors'],
-            'warnings': i['warnings']
-        }, width=200)
+# ------------------------------------------------------------------------------------------------------------
+
+# Kept for compatibility, see lilvlib.validate
+def main():
+    from lilvlib.validate import main as validate_main
+    return validate_main()
 
 # ------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
-    main()
+    raise SystemExit(main())
 
 # ------------------------------------------------------------------------------------------------------------
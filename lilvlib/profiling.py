@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import lilv
+import os
+import time
+
+from contextlib import contextmanager, nullcontext
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+# calls counted while profiling, as (object, method name, counter name)
+PROFILED_CALLS = (
+    (lilv.World,  'get',           'World.get'),
+    (lilv.World,  'find_nodes',    'World.find_nodes'),
+    (lilv.World,  'load_bundle',   'World.load_bundle'),
+    (lilv.World,  'load_resource', 'World.load_resource'),
+    (lilv.Plugin, 'get_value',     'Plugin.get_value'),
+    (lilv.Plugin, 'get_related',   'Plugin.get_related'),
+    (lilv.Port,   'get_value',     'Port.get_value'),
+    (os.path,     'exists',        'os.path.exists'),
+    (os,          'scandir',       'os.scandir'),
+)
+
+# active profilers, innermost last
+_profilers = []
+
+# ------------------------------------------------------------------------------------------------------------
+# Hooks, used in lilvlib to mark what is being done
+
+# Mark a phase of work, like a section of get_plugin_info, for the duration of a with-block
+# @a item is the plugin (or its uri) or pedalboard bundle the phase belongs to, None for scan-wide phases.
+# Does nothing unless a Profiler is active.
+def profile_phase(phase, item = None):
+    if not _profilers:
+        return nullcontext()
+    return _profilers[-1].phase(phase, item)
+
+# ------------------------------------------------------------------------------------------------------------
+# Profiler
+
+def new_stats():
+    return {
+        'phases': {},
+        'counts': {},
+    }
+
+def add_stats(stats, phase, elapsed, selfElapsed, counts):
+    if phase is not None:
+        if phase not in stats['phases']:
+            stats['phases'][phase] = { 'time': 0.0, 'self': 0.0, 'calls': 0 }
+        stats['phases'][phase]['time']  += elapsed
+        stats['phases'][phase]['self']  += selfElapsed
+        stats['phases'][phase]['calls'] += 1
+
+    for name, count in counts.items():
+        stats['counts'][name] = stats['counts'].get(name, 0) + count
+
+# Records timings of each phase of plugin and pedalboard extraction, plus counts of lilv queries and file checks
+# Timings and counts are aggregated for the whole scan and for each plugin (by uri) or pedalboard (by bundle).
+# Phase 'time' includes the time of any phase nested inside, 'self' does not (so 'self' times can be added up).
+# Counts only go to the innermost phase.
+# To be used as a context manager, profiling only happens inside the with-block:
+#
+#   with Profiler() as profiler:
+#       get_plugins_info(bundles)
+#   print(profiler.to_dict())
+#
+# Counting works by wrapping the lilv methods in PROFILED_CALLS, so this is not thread-safe.
+class Profiler(object):
+    def __init__(self):
+        self.total   = new_stats()
+        self.items   = {}
+        self.stack   = []
+        self.patched = []
+
+    def __enter__(self):
+        if not _profilers:
+            self.install()
+        _profilers.append(self)
+        return self
+
+    def __exit__(self, *args):
+        _profilers.remove(self)
+        if self.patched:
+            self.uninstall()
+
+    def install(self):
+        for obj, name, counter in PROFILED_CALLS:
+            func = getattr(obj, name)
+            setattr(obj, name, self.wrap(func, counter))
+            self.patched.append((obj, name, func))
+
+    def uninstall(self):
+        for obj, name, func in reversed(self.patched):
+            setattr(obj, name, func)
+        self.patched = []
+
+    def wrap(self, func, counter):
+        def wrapper(*args, **kwargs):
+            for profiler in _profilers:
+                profiler.count(counter)
+            return func(*args, **kwargs)
+        return wrapper
+
+    def count(self, counter):
+        counts = self.stack[-1][2] if self.stack else self.total['counts']
+        counts[counter] = counts.get(counter, 0) + 1
+
+    @contextmanager
+    def phase(self, phase, item = None):
+        if item is not None and not isinstance(item, str):
+            item = str(item.get_uri())
+
+        # nested phases without an item belong to the item of the outer phase
+        if item is None and self.stack:
+            item = self.stack[-1][1]
+
+        # the last value is the time spent in nested phases, updated by them
+        counts = {}
+        entry  = [phase, item, counts, 0.0]
+        self.stack.append(entry)
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed     = time.perf_counter() - start
+            selfElapsed = elapsed - entry[3]
+            self.stack.pop()
+
+            if self.stack:
+                self.stack[-1][3] += elapsed
+
+            add_stats(self.total, phase, elapsed, selfElapsed, counts)
+
+            if item is not None:
+                if item not in self.items:
+                    self.items[item] = new_stats()
+                add_stats(self.items[item], phase, elapsed, selfElapsed, counts)
+
+    # Get the items (plugin uris or pedalboard bundles) that took the most time
+    # Only 'self' times are added up, so nested phases are not counted twice.
+    def get_slowest(self, count = 10):
+        def total(stats):
+            return sum(p['self'] for p in stats['phases'].values())
+        return sorted(self.items, key=lambda item: total(self.items[item]), reverse=True)[:count]
+
+    def to_dict(self):
+        return {
+            'total': self.total,
+            'items': self.items,
+        }
+
+# ------------------------------------------------------------------------------------------------------------
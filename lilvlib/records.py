@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Compact records for plugin info, for keeping large catalogs in memory
+# Records use __slots__ and tuples instead of dictionaries and lists, and everything that repeats across the catalog
+# (strings, units, properties, scale points and even whole ports) is shared through an Interner.
+# Records are meant to be read-only, to_dict converts them back to the format of get_plugin_info.
+# This module does not import lilv.
+
+# ------------------------------------------------------------------------------------------------------------
+# Interner
+
+# Key for comparing values including their types, so that 1, 1.0 and True are not seen as the same value
+def typed_key(value):
+    if isinstance(value, tuple):
+        return (tuple, tuple(typed_key(v) for v in value))
+    return (type(value), value)
+
+# Keeps a single copy of equal strings, tuples and port records
+class Interner(object):
+    __slots__ = ('strings', 'tuples', 'ports')
+
+    def __init__(self):
+        self.strings = {}
+        self.tuples  = {}
+        self.ports   = {}
+
+    def str(self, value):
+        if not isinstance(value, str):
+            return value
+        return self.strings.setdefault(value, value)
+
+    def tuple(self, values):
+        values = tuple(self.str(value) for value in values)
+        return self.tuples.setdefault(typed_key(values), values)
+
+    def port(self, port):
+        return self.ports.setdefault(port.key(), port)
+
+# ------------------------------------------------------------------------------------------------------------
+# PortRecord
+
+class PortRecord(object):
+    __slots__ = ('index', 'name', 'symbol', 'shortName', 'comment', 'designation', 'rangeSteps',
+                 'minimum', 'maximum', 'default', 'units', 'properties', 'scalePoints')
+
+    @classmethod
+    def from_info(cls, info, interner):
+        ranges = info.get('ranges', {})
+        units  = info.get('units', {})
+
+        port = cls()
+        port.index       = info['index']
+        port.name        = interner.str(info['name'])
+        port.symbol      = interner.str(info['symbol'])
+        port.shortName   = interner.str(info['shortName'])
+        port.comment     = interner.str(info['comment'])
+        port.designation = interner.str(info['designation'])
+        port.rangeSteps  = info['rangeSteps']
+        port.minimum     = ranges.get('minimum')
+        port.maximum     = ranges.get('maximum')
+        port.default     = ranges.get('default')
+        port.units       = interner.tuple((units['label'], units['render'], units['symbol'])) if units else None
+        port.properties  = interner.tuple(info['properties'])
+        port.scalePoints = interner.tuple(interner.tuple((sp['value'], sp['label'])) for sp in info['scalePoints'])
+        return interner.port(port)
+
+    def key(self):
+        return typed_key(tuple(getattr(self, slot) for slot in self.__slots__))
+
+    def to_dict(self):
+        ranges = {}
+
+        for key in ('minimum', 'maximum', 'default'):
+            value = getattr(self, key)
+            if value is not None:
+                ranges[key] = value
+
+        return {
+            'name'   : self.name,
+            'symbol' : self.symbol,
+            'ranges' : ranges,
+            'units'  : {
+                'label' : self.units[0],
+                'render': self.units[1],
+                'symbol': self.units[2],
+            } if self.units is not None else {},
+            'comment'    : self.comment,
+            'designation': self.designation,
+            'properties' : list(self.properties),
+            'rangeSteps' : self.rangeSteps,
+            'scalePoints': [{ 'value': v, 'label': l } for v, l in self.scalePoints],
+            'shortName'  : self.shortName,
+            'index'      : self.index,
+        }
+
+# ------------------------------------------------------------------------------------------------------------
+# PluginRecord
+
+class PluginRecord(object):
+    __slots__ = ('uri', 'name', 'binary', 'brand', 'label', 'license', 'comment', 'category', 'microVersion',
+                 'minorVersion', 'version', 'stability', 'author', 'bundles', 'gui', 'ports', 'presets',
+                 'errors', 'warnings')
+
+    @classmethod
+    def from_info(cls, info, interner = None):
+        if interner is None:
+            interner = Interner()
+
+        plugin = cls()
+        plugin.uri          = info['uri']
+        plugin.name         = info['name']
+        plugin.binary       = info['binary']
+        plugin.brand        = interner.str(info['brand'])
+        plugin.label        = info['label']
+        plugin.license      = interner.str(info['license'])
+        plugin.comment      = info['comment']
+        plugin.category     = interner.tuple(info['category'])
+        plugin.microVersion = info['microVersion']
+        plugin.minorVersion = info['minorVersion']
+        plugin.version      = interner.str(info['version'])
+        plugin.stability    = interner.str(info['stability'])
+        plugin.author       = interner.tuple((info['author']['name'], info['author']['homepage'], info['author']['email']))
+        plugin.bundles      = interner.tuple(info['bundles'])
+        plugin.gui          = tuple((interner.str(k), interner.str(v) if k != 'ports' else
+                                     tuple(interner.tuple((p['index'], p['name'], p['symbol'])) for p in v))
+                                    for k, v in info['gui'].items())
+        plugin.ports        = tuple((interner.str(typ),
+                                     tuple(PortRecord.from_info(p, interner) for p in ports['input']),
+                                     tuple(PortRecord.from_info(p, interner) for p in ports['output']))
+                                    for typ, ports in info['ports'].items())
+        plugin.presets      = tuple((p['uri'], p['label']) for p in info['presets'])
+        plugin.errors       = interner.tuple(info['errors'])
+        plugin.warnings     = interner.tuple(info['warnings'])
+        return plugin
+
+    # Get all ports as a single list, sorted by index
+    def get_ports(self):
+        ports = {}
+        for typ, inputs, outputs in self.ports:
+            for port in inputs + outputs:
+                ports[port.index] = port
+        return [ports[index] for index in sorted(ports)]
+
+    def to_dict(self):
+        # a port can be in more than one type list, make sure it's still the same dictionary in all of them
+        portdicts = {}
+
+        def port_dict(port):
+            if port.index not in portdicts:
+                portdicts[port.index] = port.to_dict()
+            return portdicts[port.index]
+
+        return {
+            'uri' : self.uri,
+            'name': self.name,
+
+            'binary' : self.binary,
+            'brand'  : self.brand,
+            'label'  : self.label,
+            'license': self.license,
+            'comment': self.comment,
+
+            'category'    : list(self.category),
+            'microVersion': self.microVersion,
+            'minorVersion': self.minorVersion,
+
+            'version'  : self.version,
+            'stability': self.stability,
+
+            'author' : {
+                'name'    : self.author[0],
+                'homepage': self.author[1],
+                'email'   : self.author[2],
+            },
+            'bundles': list(self.bundles),
+            'gui'    : dict((k, v if k != 'ports' else [{ 'index': p[0], 'name': p[1], 'symbol': p[2] } for p in v])
+                            for k, v in self.gui),
+            'ports'  : dict((typ, {
+                'input' : [port_dict(p) for p in inputs],
+                'output': [port_dict(p) for p in outputs],
+            }) for typ, inputs, outputs in self.ports),
+            'presets': [{ 'uri': uri, 'label': label } for uri, label in self.presets],
+
+            'errors'  : list(self.errors),
+            'warnings': list(self.warnings),
+        }
+
+# ------------------------------------------------------------------------------------------------------------
+# compact_plugins_info
+
+# Convert a list of plugin info (as returned by get_plugins_info) into records sharing a single Interner
+def compact_plugins_info(infos, interner = None):
+    if interner is None:
+        interner = Interner()
+    return [PluginRecord.from_info(info, interner) for info in infos]
+
+# ------------------------------------------------------------------------------------------------------------
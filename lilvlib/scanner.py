@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import ctypes
+import ctypes.util
+import os
+import struct
+
+from lilvlib.lilvlib import WorldPool, bundle_abspath, get_bundle_fingerprint, get_pedalboard_info, get_plugin_info
+
+# ------------------------------------------------------------------------------------------------------------
+# Inotify
+
+# Minimal inotify wrapper, only available on Linux
+# Raises OSError if inotify cannot be used.
+class Inotify(object):
+    IN_MODIFY      = 0x00000002
+    IN_ATTRIB      = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM  = 0x00000040
+    IN_MOVED_TO    = 0x00000080
+    IN_CREATE      = 0x00000100
+    IN_DELETE      = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF   = 0x00000800
+    IN_Q_OVERFLOW  = 0x00004000
+    IN_IGNORED     = 0x00008000
+    IN_ONLYDIR     = 0x01000000
+    IN_CLOEXEC     = 0o2000000
+    IN_NONBLOCK    = 0o4000
+
+    IN_CHANGES = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+    def __init__(self):
+        try:
+            self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            self.libc.inotify_init1
+        except (OSError, AttributeError):
+            raise OSError("inotify is not available")
+
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.watches = {}
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def add_watch(self, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.IN_CHANGES | self.IN_ONLYDIR)
+        if wd < 0:
+            return False
+        self.watches[wd] = path
+        return True
+
+    # Get all pending events, as a list of (watched path, file name, mask)
+    def read_events(self):
+        events = []
+
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = struct.unpack_from("iIII", data, offset)
+                offset += 16
+                name = os.fsdecode(data[offset:offset+length].rstrip(b"\0"))
+                offset += length
+
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+
+                events.append((self.watches.get(wd), name, mask))
+
+        return events
+
+# ------------------------------------------------------------------------------------------------------------
+# BundleScanner
+
+# Scanner for LV2 directories that only extracts bundles that changed since the last scan
+# The state of each directory (mtime and subdirectories) and of each bundle (fingerprint of its ttl files) is kept
+# between scans. With inotify (Linux only), only bundles that got filesystem events are checked again.
+# Note that inotify only watches the top level of each bundle, changes inside subdirectories need a full rescan.
+# @a paths is a list of directories containing bundles, like the ones in LV2_PATH.
+# @a pedalboards scans pedalboard bundles (using get_pedalboard_info) instead of plugins (using get_plugin_info).
+class BundleScanner(object):
+    def __init__(self, paths, pedalboards = False, world = None, useAbsolutePath = False, useInotify = False):
+        self.paths           = [os.path.abspath(path) for path in paths]
+        self.pedalboards     = pedalboards
+        self.world           = world
+        self.useAbsolutePath = useAbsolutePath
+
+        # directory -> (mtime, subdirectories, subdirectories with a manifest.ttl)
+        self.dirstate = {}
+        # bundle -> fingerprint
+        self.fingerprints = {}
+        # bundle -> list of plugin info, or pedalboard info
+        self.infos = {}
+        # bundle -> error message
+        self.errors = {}
+
+        self.inotify = None
+        self.dirty   = None
+
+        if useInotify:
+            try:
+                self.inotify = Inotify()
+            except OSError:
+                pass
+
+    def close(self):
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    # Force everything to be checked again on the next scan
+    def invalidate(self):
+        self.dirstate = {}
+        self.dirty    = None
+
+    # Subdirectories are listed only when the directory mtime changes, but the ones without a manifest.ttl are
+    # checked again every time, since a manifest can be written later without touching the parent directory.
+    def list_bundles(self, path):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+
+        state = self.dirstate.get(path)
+
+        if state is None or state[0] != mtime:
+            subdirs = [os.path.join(path, entry) for entry in sorted(os.listdir(path))]
+            subdirs = [subdir for subdir in subdirs if os.path.isdir(subdir)]
+            state   = (mtime, subdirs, set())
+            self.dirstate[path] = state
+
+            if self.inotify is not None:
+                self.inotify.add_watch(path)
+                for subdir in subdirs:
+                    self.inotify.add_watch(subdir)
+
+        mtime, subdirs, found = state
+
+        for subdir in subdirs:
+            if subdir not in found and os.path.isfile(os.path.join(subdir, "manifest.ttl")):
+                found.add(subdir)
+
+        return [bundle_abspath(subdir) for subdir in subdirs if subdir in found]
+
+    # Collect the bundles touched by inotify events, returns None if everything needs to be checked
+    def collect_dirty_bundles(self):
+        dirty = self.dirty
+        self.dirty = set()
+
+        for watched, name, mask in self.inotify.read_events():
+            if mask & Inotify.IN_Q_OVERFLOW or watched is None or dirty is None:
+                dirty = None
+                continue
+
+            watched = os.path.abspath(watched)
+
+            if watched in self.paths:
+                # something was added or removed inside a LV2 directory
+                self.dirstate.pop(watched, None)
+                if name:
+                    dirty.add(bundle_abspath(os.path.join(watched, name)))
+            else:
+                dirty.add(bundle_abspath(watched))
+
+        return dirty
+
+    def extract(self, bundle):
+        if self.pedalboards:
+            return get_pedalboard_info(bundle, self.world, True)
+
+        return [get_plugin_info(self.world, p, self.useAbsolutePath) for p in self.world.get_bundle_plugins(bundle)]
+
+    # Scan all directories and extract the bundles that were added or changed
+    # Returns a dictionary with 'added' and 'changed' bundles (with their new info), a list of 'removed' ones and
+    # the 'errors' of bundles that failed to extract in this scan (bundle -> error message).
+    def scan(self):
+        dirty = self.collect_dirty_bundles() if self.inotify is not None else None
+
+        bundles = []
+        for path in self.paths:
+            bundles += self.list_bundles(path)
+
+        added   = [bundle for bundle in bundles if bundle not in self.fingerprints]
+        removed = sorted(set(self.fingerprints.keys()) - set(bundles))
+        changed = []
+
+        for bundle in bundles:
+            if bundle not in self.fingerprints or (dirty is not None and bundle not in dirty):
+                continue
+            if get_bundle_fingerprint(bundle) != self.fingerprints[bundle]:
+                changed.append(bundle)
+
+        if self.world is None and (added or changed or removed):
+            self.world = WorldPool()
+
+        for bundle in removed:
+            del self.fingerprints[bundle]
+            self.infos.pop(bundle, None)
+            self.errors.pop(bundle, None)
+            if not self.pedalboards:
+                self.world.remove_bundle(bundle)
+
+        # plugin data can span several bundles, so load all of them before extracting anything
+        if not self.pedalboards:
+            for bundle in changed:
+                self.world.remove_bundle(bundle)
+            for bundle in added + changed:
+                self.world.add_bundle(bundle)
+
+        result = {
+            'added'  : {},
+            'changed': {},
+            'removed': removed,
+            'errors' : {},
+        }
+
+        for bundle in added + changed:
+            isNew = bundle not in self.fingerprints
+            self.fingerprints[bundle] = get_bundle_fingerprint(bundle)
+            self.infos.pop(bundle, None)
+            self.errors.pop(bundle, None)
+
+            try:
+                self.infos[bundle] = self.extract(bundle)
+            except Exception as e:
+                self.errors[bundle] = result['errors'][bundle] = str(e)
+                continue
+
+            result['added' if isNew else 'changed'][bundle] = self.infos[bundle]
+
+        return result
+
+# ------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import re
+
+from urllib.parse import quote, unquote, urljoin
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+PREFIX_RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+PREFIX_XSD = "http://www.w3.org/2001/XMLSchema#"
+
+# characters serd leaves untouched when making a file uri, anything else is percent-encoded
+FILE_URI_SAFE_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-._~:@/!$&'()*+,;="
+
+# ------------------------------------------------------------------------------------------------------------
+# Nodes
+# All nodes are strings, so they can be used directly as dictionary keys and compared to plain uris.
+# Literals have the same type checks and conversions as lilv nodes.
+
+class TurtleError(Exception):
+    pass
+
+class URIRef(str):
+    __slots__ = ()
+
+    def is_uri(self):
+        return True
+
+    def is_blank(self):
+        return False
+
+    def is_literal(self):
+        return False
+
+    # same as lilv, only local files have a path
+    def get_path(self):
+        if not self.startswith("file:///"):
+            return None
+        return unquote(self[7:], errors="surrogateescape")
+
+class BlankNode(str):
+    __slots__ = ()
+
+    def is_uri(self):
+        return False
+
+    def is_blank(self):
+        return True
+
+    def is_literal(self):
+        return False
+
+class Literal(str):
+    def __new__(cls, value, datatype = None, language = None):
+        self = str.__new__(cls, value)
+        self.datatype = datatype
+        self.language = language
+        return self
+
+    def is_uri(self):
+        return False
+
+    def is_blank(self):
+        return False
+
+    def is_literal(self):
+        return True
+
+    def is_int(self):
+        return self.datatype in (PREFIX_XSD + "integer", PREFIX_XSD + "int")
+
+    def is_float(self):
+        return self.datatype in (PREFIX_XSD + "decimal", PREFIX_XSD + "double")
+
+    def is_bool(self):
+        return self.datatype == PREFIX_XSD + "boolean"
+
+    def is_string(self):
+        return self.datatype in (None, PREFIX_XSD + "string") and self.language is None
+
+    def as_bool(self):
+        return self in ("true", "1")
+
+    def __int__(self):
+        return int(str(self))
+
+    def __float__(self):
+        return float(str(self))
+
+# ------------------------------------------------------------------------------------------------------------
+# Utilities
+
+# Get the file uri of a local path, the same way lilv does
+# Characters other than FILE_URI_SAFE_CHARS are percent-encoded as utf-8 bytes, like serd does.
+def file_uri(path):
+    if not path.startswith("/"):
+        raise TurtleError("path '%s' is not absolute" % path)
+    return URIRef("file://" + quote(path, safe=FILE_URI_SAFE_CHARS, errors="surrogateescape"))
+
+# Sort nodes in the same way sord does, which is the order lilv gives them back in
+# sord compares the serd node type first (literal, then uri, then blank), then the string. Literals with the same
+# string are then ordered by datatype (none first) and language.
+def sort_nodes(nodes):
+    return sorted(nodes, key=get_node_sort_key)
+
+def get_node_sort_key(node):
+    if node.is_literal():
+        return (0, str(node), node.datatype is not None, node.datatype or "", node.language or "")
+    return (1 if node.is_uri() else 2, str(node))
+
+# ------------------------------------------------------------------------------------------------------------
+# Graph
+
+# Simple in-memory set of triples, indexed by subject and predicate
+class Graph(object):
+    def __init__(self):
+        self.subjects = {}
+
+    def add(self, subject, predicate, obj):
+        objects = self.subjects.setdefault(subject, {}).setdefault(predicate, [])
+
+        # same statement twice is only stored once, like in sord
+        for other in objects:
+            if other == obj and type(other) is type(obj) and getattr(other, "__dict__", None) == getattr(obj, "__dict__", None):
+                return
+
+        objects.append(obj)
+
+    def predicates(self, subject):
+        return self.subjects.get(subject, {})
+
+    def objects(self, subject, predicate):
+        return self.subjects.get(subject, {}).get(predicate, [])
+
+    # Get the single value of a subject and predicate
+    # Returns @a fallback if there is no value, raises TurtleError if there is more than one.
+    def value(self, subject, predicate, fallback = None):
+        objects = self.objects(subject, predicate)
+        if len(objects) == 0:
+            return fallback
+        if len(objects) != 1:
+            raise TurtleError("<%s> has more than one <%s>" % (subject, predicate))
+        return objects[0]
+
+    def subjects_of_type(self, rdftype):
+        return [s for s, preds in self.subjects.items() if rdftype in preds.get(PREFIX_RDF + "type", ())]
+
+# ------------------------------------------------------------------------------------------------------------
+# Parser
+
+PN_CHARS_BASE = "A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD"
+PN_CHARS_U    = PN_CHARS_BASE + "_"
+PN_CHARS      = PN_CHARS_U + "\\-0-9\u00B7\u0300-\u036F\u203F-\u2040"
+PLX           = "%[0-9A-Fa-f]{2}|\\\\[_~.\\-!$&'()*+,;=/?#@%]"
+
+TOKENS = re.compile(r"""
+    (?P<ws>(?:\s+|\#[^\n]*)+)
+  | (?P<iri><(?P<iriref>[^<>"{}|^`\\\x00-\x20]*)>)
+  | (?P<pname>(?P<prefix>(?:[%(base)s](?:[%(chars)s.]*[%(chars)s])?)?):(?P<local>(?:[%(u)s:0-9]|%(plx)s)(?:(?:[%(chars)s.:]|%(plx)s)*(?:[%(chars)s:]|%(plx)s))?)?)
+  | (?P<blank>_:(?P<label>[%(u)s0-9](?:[%(chars)s.]*[%(chars)s])?))
+  | (?P<string>\"\"\"(?:(?:"|"")?(?:[^"\\]|\\.))*\"\"\"|'''(?:(?:'|'')?(?:[^'\\]|\\.))*'''|"(?:[^"\\\n\r]|\\.)*"|'(?:[^'\\\n\r]|\\.)*')
+  | (?P<lang>@[a-zA-Z]+(?:-[a-zA-Z0-9]+)*)
+  | (?P<double>[+-]?(?:[0-9]+\.[0-9]*[eE][+-]?[0-9]+|\.[0-9]+[eE][+-]?[0-9]+|[0-9]+[eE][+-]?[0-9]+))
+  | (?P<decimal>[+-]?[0-9]*\.[0-9]+)
+  | (?P<integer>[+-]?[0-9]+)
+  | (?P<punct>\^\^|[.;,\[\]()])
+  | (?P<word>[A-Za-z]+)
+""" % { 'base': PN_CHARS_BASE, 'chars': PN_CHARS, 'u': PN_CHARS_U, 'plx': PLX }, re.VERBOSE | re.DOTALL)
+
+ESCAPES = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))", re.DOTALL)
+ECHARS  = { 't': "\t", 'b': "\b", 'n': "\n", 'r': "\r", 'f': "\f", '"': '"', "'": "'", '\\': "\\" }
+
+def unescape_string(match):
+    if match.group(1) or match.group(2):
+        return chr(int(match.group(1) or match.group(2), 16))
+    if match.group(3) not in ECHARS:
+        raise TurtleError("invalid escape sequence '\\%s'" % match.group(3))
+    return ECHARS[match.group(3)]
+
+class TurtleParser(object):
+    def __init__(self, graph, base, blankPrefix = ""):
+        self.graph    = graph
+        self.base     = base
+        self.bprefix  = blankPrefix
+        self.prefixes = {}
+        self.tokens   = []
+        self.pos      = 0
+        self.genid    = 0
+
+    # tokenizer
+
+    def tokenize(self, text):
+        tokens = []
+        pos    = 0
+        end    = len(text)
+
+        while pos < end:
+            match = TOKENS.match(text, pos)
+            if match is None:
+                raise TurtleError("syntax error at offset %d" % pos)
+            if match.lastgroup != "ws":
+                tokens.append((match.lastgroup, match))
+            pos = match.end()
+
+        tokens.append(("eof", None))
+        return tokens
+
+    def peek(self):
+        return self.tokens[self.pos]
+
+    def next(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def expect_punct(self, char):
+        kind, match = self.next()
+        if kind != "punct" or match.group() != char:
+            raise TurtleError("expected '%s'" % char)
+
+    def is_punct(self, token, char):
+        return token[0] == "punct" and token[1].group() == char
+
+    # terms
+
+    def resolve(self, iri):
+        if re.match(r"[A-Za-z][A-Za-z0-9+.\-]*:", iri) is None:
+            iri = urljoin(self.base, iri)
+        return URIRef(iri)
+
+    def read_iri(self, token):
+        kind, match = token
+
+        if kind == "iri":
+            return self.resolve(match.group("iriref"))
+
+        if kind == "pname":
+            prefix = match.group("prefix") or ""
+            local  = match.group("local") or ""
+            if prefix not in self.prefixes:
+                raise TurtleError("undefined prefix '%s'" % prefix)
+            if "\\" in local:
+                local = re.sub(r"\\(.)", r"\1", local)
+            return URIRef(self.prefixes[prefix] + local)
+
+        raise TurtleError("expected an iri")
+
+    # blank node ids are generated the same way as serd does
+    def new_blank(self):
+        self.genid += 1
+        return BlankNode("_:%sb%d" % (self.bprefix, self.genid))
+
+    def read_subject(self):
+        token = self.next()
+
+        if token[0] == "blank":
+            label = token[1].group("label")
+            # rename labels that could clash with generated ids, like serd does
+            if label[0] == "b" and label[1:2].isdigit():
+                label = "B" + label[1:]
+            return BlankNode("_:" + self.bprefix + label), False
+
+        if self.is_punct(token, "["):
+            subject = self.new_blank()
+            if self.is_punct(self.peek(), "]"):
+                self.next()
+                return subject, False
+            self.read_predicate_object_list(subject)
+            self.expect_punct("]")
+            return subject, True
+
+        if self.is_punct(token, "("):
+            raise TurtleError("collections are not supported")
+
+        return self.read_iri(token), False
+
+    def read_predicate(self):
+        token = self.next()
+        if token[0] == "word" and token[1].group() == "a":
+            return URIRef(PREFIX_RDF + "type")
+        return self.read_iri(token)
+
+    def read_object(self):
+        token = self.peek()
+        kind  = token[0]
+
+        if kind == "string":
+            self.next()
+            raw = token[1].group()
+            raw = raw[3:-3] if raw[:3] in ('"""', "'''") else raw[1:-1]
+            if "\\" in raw:
+                raw = ESCAPES.sub(unescape_string, raw)
+
+            after = self.peek()
+            if after[0] == "lang":
+                self.next()
+                return Literal(raw, None, after[1].group()[1:])
+            if self.is_punct(after, "^^"):
+                self.next()
+                return Literal(raw, self.read_iri(self.next()))
+            return Literal(raw)
+
+        if kind in ("integer", "decimal", "double"):
+            self.next()
+            return Literal(token[1].group(), PREFIX_XSD + kind)
+
+        if kind == "word" and token[1].group() in ("true", "false"):
+            self.next()
+            return Literal(token[1].group(), PREFIX_XSD + "boolean")
+
+        if kind == "blank" or self.is_punct(token, "[") or self.is_punct(token, "("):
+            return self.read_subject()[0]
+
+        return self.read_iri(self.next())
+
+    # statements
+
+    def read_predicate_object_list(self, subject):
+        while True:
+            predicate = self.read_predicate()
+
+            while True:
+                self.graph.add(subject, predicate, self.read_object())
+                if not self.is_punct(self.peek(), ","):
+                    break
+                self.next()
+
+            if not self.is_punct(self.peek(), ";"):
+                return
+            while self.is_punct(self.peek(), ";"):
+                self.next()
+
+            token = self.peek()
+            if token[0] not in ("iri", "pname", "word"):
+                return
+
+    def read_directive(self, keyword, sparql):
+        if keyword == "prefix":
+            kind, match = self.next()
+            if kind != "pname" or match.group("local"):
+                raise TurtleError("invalid prefix name")
+            prefix = match.group("prefix") or ""
+            kind, match = self.next()
+            if kind != "iri":
+                raise TurtleError("expected an iri")
+            self.prefixes[prefix] = self.resolve(match.group("iriref"))
+        else:
+            kind, match = self.next()
+            if kind != "iri":
+                raise TurtleError("expected an iri")
+            self.base = self.resolve(match.group("iriref"))
+
+        if not sparql:
+            self.expect_punct(".")
+
+    def parse(self, text):
+        self.tokens = self.tokenize(text)
+        self.pos    = 0
+
+        while self.peek()[0] != "eof":
+            kind, match = self.peek()
+
+            if kind == "lang" and match.group() in ("@prefix", "@base"):
+                self.next()
+                self.read_directive(match.group()[1:], False)
+                continue
+
+            if kind == "word" and match.group().lower() in ("prefix", "base"):
+                self.next()
+                self.read_directive(match.group().lower(), True)
+                continue
+
+            subject, anonymous = self.read_subject()
+
+            if not (anonymous and self.is_punct(self.peek(), ".")):
+                self.read_predicate_object_list(subject)
+
+            self.expect_punct(".")
+
+        self.tokens = []
+        return self.graph
+
+# ------------------------------------------------------------------------------------------------------------
+# parse_turtle
+
+# Parse a turtle document into a graph
+# @a base is the uri used to resolve relative iris, usually the file uri of the document.
+# @a blankPrefix is prepended to blank node labels, so that several documents can share the same graph.
+def parse_turtle(text, base, graph = None, blankPrefix = ""):
+    if graph is None:
+        graph = Graph()
+    return TurtleParser(graph, base, blankPrefix).parse(text)
+
+# Same as parse_turtle, but reading from a file
+def parse_turtle_file(filename, base = None, graph = None, blankPrefix = ""):
+    if base is None:
+        base = file_uri(filename)
+
+    with open(filename, 'r', encoding="utf-8") as fh:
+        text = fh.read()
+
+    return parse_turtle(text, base, graph, blankPrefix)
+
+# ------------------------------------------------------------------------------------------------------------
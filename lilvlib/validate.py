@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Bundle validator, runs plugin extraction with validation over many bundles in parallel
+#
+# Results are written to stdout as JSON lines as soon as each bundle is done, one line per plugin:
+#   {"bundle": "...", "uri": "...", "issues": [{"rule": "...", "severity": "...", "message": "..."}],
+#    "errors": 1, "warnings": 0}
+# or, when a bundle or plugin cannot be extracted at all:
+#   {"bundle": "...", "uri": null, "failure": "..."}
+# or, for bundles without plugins (which do not change the exit code):
+#   {"bundle": "...", "uri": null, "skipped": "bundle has no plugins"}
+#
+# Rules can be suppressed with --ignore or a JSON config file, using the rule ids from lilvlib.validation:
+#   {
+#     "ignore": ["plugin-comment-missing"],
+#     "plugins": { "http://example.org/plugin": ["modgui-missing"] }
+#   }
+#
+# The exit code is the worst thing found, see the EXIT_ values below.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports
+
+import hashlib
+import json
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from lilvlib.lilvlib import (
+    WorldPool, PluginInfo, bundle_abspath, get_bundle_fingerprint, group_related_bundles, list_pedalboard_bundles
+)
+from lilvlib.validation import ERROR, PLUGIN_RULES, ValidationReport
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+EXIT_OK       = 0 # nothing found
+EXIT_WARNINGS = 1 # only warnings
+EXIT_USAGE    = 2 # invalid arguments or config (same as argparse)
+EXIT_ERRORS   = 3 # at least one error
+EXIT_FAILURE  = 4 # at least one bundle or plugin could not be extracted
+
+# where lilv looks for bundles when LV2_PATH is not set
+DEFAULT_LV2_PATH = ("~/.lv2", "/usr/local/lib/lv2", "/usr/lib/lv2")
+
+STATE_VERSION = 1
+
+# ------------------------------------------------------------------------------------------------------------
+# Utilities
+
+# Get the bundles to validate from the command line arguments
+# Each argument can be a bundle, or a directory with bundles inside. Without arguments, LV2_PATH is used.
+def find_bundles(paths):
+    if not paths:
+        lv2path = os.environ.get('LV2_PATH')
+        paths   = lv2path.split(os.pathsep) if lv2path else [os.path.expanduser(p) for p in DEFAULT_LV2_PATH]
+        paths   = [path for path in paths if os.path.isdir(path)]
+
+    bundles = []
+
+    for path in paths:
+        if os.path.isfile(os.path.join(path, "manifest.ttl")):
+            bundles.append(bundle_abspath(path))
+        elif os.path.isdir(path):
+            bundles += list_pedalboard_bundles(path)
+        else:
+            raise Exception('find_bundles(%s) - not a bundle or directory' % path)
+
+    # keep the first of any duplicates, like lilv does
+    return list(dict.fromkeys(bundles))
+
+# Read a suppression config file, returns a tuple of (global rule ids, plugin uri -> rule ids)
+def read_config(filename):
+    with open(filename, 'r') as fh:
+        config = json.load(fh)
+
+    ignore  = set(config.get('ignore', ()))
+    plugins = dict((uri, set(rules)) for uri, rules in config.get('plugins', {}).items())
+
+    for ruleid in ignore.union(*plugins.values()):
+        if ruleid not in PLUGIN_RULES:
+            raise Exception('read_config(%s) - unknown rule id %s' % (filename, ruleid))
+
+    return ignore, plugins
+
+# Validate the plugins of a bundle (or several, loaded together) using a world, yields one record at a time
+# Bundles that fail to load get a failure record, bundles without plugins (spec or preset bundles) are skipped.
+def validate_bundles(world, bundles, ignore):
+    loaded = []
+
+    for bundle in bundles:
+        try:
+            world.add_bundle(bundle)
+        except Exception as e:
+            yield { 'bundle': bundle, 'uri': None, 'failure': str(e) }
+            continue
+        loaded.append(bundle)
+
+    for bundle in loaded:
+        try:
+            plugins = world.get_bundle_plugins(bundle)
+        except Exception as e:
+            yield { 'bundle': bundle, 'uri': None, 'failure': str(e) }
+            continue
+
+        if len(plugins) == 0:
+            yield { 'bundle': bundle, 'uri': None, 'skipped': "bundle has no plugins" }
+            continue
+
+        for plugin in plugins:
+            uri    = str(plugin.get_uri())
+            report = ValidationReport(True, ignore)
+
+            try:
+                PluginInfo(world, plugin, False, report)['errors']
+            except Exception as e:
+                yield { 'bundle': bundle, 'uri': uri, 'failure': str(e) }
+                continue
+
+            yield {
+                'bundle': bundle,
+                'uri'   : uri,
+                'issues': [{ 'rule': r, 'severity': s, 'message': m } for r, s, m in report.issues],
+            }
+
+# Worker processes keep a single world, each group of related bundles is unloaded again once validated
+_worker_world = None
+
+def _worker_init():
+    global _worker_world
+    _worker_world = WorldPool()
+
+def _worker_run(bundles, ignore):
+    try:
+        return list(validate_bundles(_worker_world, bundles, ignore))
+    except Exception as e:
+        return [{ 'bundle': bundle, 'uri': None, 'failure': str(e) } for bundle in bundles]
+    finally:
+        for bundle in bundles:
+            _worker_world.remove_bundle(bundle)
+
+# ------------------------------------------------------------------------------------------------------------
+# Validator
+
+# Runs the validation and keeps track of the results
+# @a jobs is the number of processes to use. With a single job everything is validated in one world with all bundles
+# loaded; parallel jobs load one group of related bundles at a time (see group_related_bundles), so plugin data spread
+# across bundles is seen either way.
+class Validator(object):
+    def __init__(self, ignore = (), pluginIgnore = None, jobs = None, output = None):
+        self.ignore       = set(ignore)
+        self.pluginIgnore = pluginIgnore or {}
+        self.jobs         = jobs or os.cpu_count() or 1
+        self.output       = output if output is not None else sys.stdout
+        # bundle -> exit code
+        self.status       = {}
+        self.counts       = { 'plugins': 0, 'errors': 0, 'warnings': 0, 'failures': 0, 'skipped': 0 }
+
+    def emit(self, record):
+        bundle = record['bundle']
+        status = self.status.get(bundle, EXIT_OK)
+
+        if 'failure' in record:
+            self.counts['failures'] += 1
+            status = EXIT_FAILURE
+
+        elif 'skipped' in record:
+            self.counts['skipped'] += 1
+
+        else:
+            ignore = self.pluginIgnore.get(record['uri'], ())
+            record['issues']   = [issue for issue in record['issues'] if issue['rule'] not in ignore]
+            record['errors']   = len([issue for issue in record['issues'] if issue['severity'] == ERROR])
+            record['warnings'] = len(record['issues']) - record['errors']
+
+            self.counts['plugins']  += 1
+            self.counts['errors']   += record['errors']
+            self.counts['warnings'] += record['warnings']
+
+            if record['errors']:
+                status = max(status, EXIT_ERRORS)
+            elif record['warnings']:
+                status = max(status, EXIT_WARNINGS)
+
+        self.status[bundle] = status
+        self.output.write(json.dumps(record, ensure_ascii=False, separators=(",",":")) + "\n")
+        self.output.flush()
+
+    def run(self, bundles):
+        groups = group_related_bundles(bundles) if self.jobs != 1 else [bundles]
+
+        if len(groups) == 1:
+            for record in validate_bundles(WorldPool(), bundles, self.ignore):
+                self.emit(record)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_worker_init) as executor:
+            futures = [executor.submit(_worker_run, group, self.ignore) for group in groups]
+
+            for future in as_completed(futures):
+                for record in future.result():
+                    self.emit(record)
+
+# ------------------------------------------------------------------------------------------------------------
+# State, for --changed-only
+
+# Key of everything besides the bundle contents that changes the results
+def get_config_key(ignore, pluginIgnore):
+    from lilvlib import __version__
+    data = json.dumps([__version__, sorted(ignore), sorted((u, sorted(r)) for u, r in pluginIgnore.items())])
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+def read_state(filename, configKey):
+    try:
+        with open(filename, 'r') as fh:
+            state = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+    if state.get('version') != STATE_VERSION or state.get('config') != configKey:
+        return {}
+
+    return state.get('bundles', {})
+
+def write_state(filename, configKey, bundles):
+    tmpfilename = filename + ".tmp"
+
+    with open(tmpfilename, 'w') as fh:
+        json.dump({ 'version': STATE_VERSION, 'config': configKey, 'bundles': bundles }, fh)
+
+    os.replace(tmpfilename, filename)
+
+# ------------------------------------------------------------------------------------------------------------
+
+def main(argv = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate LV2 plugin bundles, writing results as JSON lines",
+                                     epilog="exit codes: %d ok, %d warnings, %d usage, %d errors, %d failures" %
+                                            (EXIT_OK, EXIT_WARNINGS, EXIT_USAGE, EXIT_ERRORS, EXIT_FAILURE))
+    parser.add_argument("paths", nargs="*", help="bundles, or directories with bundles (defaults to LV2_PATH)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of processes to use, defaults to the number of CPUs")
+    parser.add_argument("-c", "--config", help="JSON file with rules to ignore, globally or by plugin uri")
+    parser.add_argument("-i", "--ignore", action="append", default=[], metavar="RULE", help="rule id to ignore")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="only validate bundles that changed since the last run with the same --state file")
+    parser.add_argument("--state", default=".lilvlib-validate.json", help="state file used by --changed-only")
+    parser.add_argument("--list-rules", action="store_true", help="list all rule ids and exit")
+    args = parser.parse_args(argv)
+
+    if args.list_rules:
+        for ruleid in sorted(PLUGIN_RULES):
+            print("%s\t%s\t%s" % (ruleid, PLUGIN_RULES[ruleid][0], PLUGIN_RULES[ruleid][1]))
+        return EXIT_OK
+
+    try:
+        ignore, pluginIgnore = read_config(args.config) if args.config else (set(), {})
+        bundles = find_bundles(args.paths)
+    except Exception as e:
+        print(e, file=sys.stderr)
+        return EXIT_USAGE
+
+    for ruleid in args.ignore:
+        if ruleid not in PLUGIN_RULES:
+            parser.error("unknown rule id %s" % ruleid)
+        ignore.add(ruleid)
+
+    configKey    = get_config_key(ignore, pluginIgnore)
+    state        = read_state(args.state, configKey) if args.changed_only else {}
+    fingerprints = dict((bundle, get_bundle_fingerprint(bundle)) for bundle in bundles)
+    unchanged    = [b for b in bundles if b in state and state[b]['fingerprint'] == fingerprints[b]]
+
+    # a change in a related bundle (like a separate modgui one) changes the results of the plugin bundle too
+    if unchanged:
+        changed   = set(bundles) - set(unchanged)
+        unchanged = set(unchanged)
+        for group in group_related_bundles(bundles):
+            if changed.intersection(group):
+                unchanged.difference_update(group)
+        unchanged = [b for b in bundles if b in unchanged]
+
+    pending = [b for b in bundles if b not in unchanged]
+
+    validator = Validator(ignore, pluginIgnore, args.jobs)
+
+    if pending:
+        validator.run(pending)
+
+    status = dict((bundle, state[bundle]['status']) for bundle in unchanged)
+    status.update(validator.status)
+
+    if args.changed_only:
+        write_state(args.state, configKey, dict((bundle, { 'fingerprint': fingerprints[bundle], 'status': code })
+                                                for bundle, code in status.items()))
+
+    print("%d bundles (%d unchanged, %d without plugins), %d plugins, %d errors, %d warnings, %d failures" %
+          (len(bundles), len(unchanged), validator.counts['skipped'], validator.counts['plugins'],
+           validator.counts['errors'], validator.counts['warnings'], validator.counts['failures']), file=sys.stderr)
+
+    return max(status.values(), default=EXIT_OK)
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# ------------------------------------------------------------------------------------------------------------
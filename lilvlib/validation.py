@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------------------------------------
+# Definitions
+
+ERROR   = "error"
+WARNING = "warning"
+
+# rule id -> (severity, message)
+# Messages are only formatted (with the arguments given to ValidationReport.report) when validation is enabled.
+PLUGIN_RULES = {
+    # plugin
+    'plugin-uri-missing'           : (ERROR,   "plugin uri is missing or invalid"),
+    'plugin-uri-local'             : (ERROR,   "plugin uri is local, and thus not suitable for redistribution"),
+    'plugin-name-missing'          : (ERROR,   "plugin name is missing"),
+    'plugin-binary-missing'        : (ERROR,   "plugin binary is missing"),
+    'plugin-license-missing'       : (ERROR,   "plugin license is missing"),
+    'plugin-license-local'         : (WARNING, "plugin license entry is a local path instead of a string"),
+    'plugin-comment-missing'       : (ERROR,   "plugin comment is missing"),
+    'plugin-version-missing'       : (ERROR,   "plugin is missing version information"),
+    'plugin-minor-version-missing' : (ERROR,   "plugin is missing minorVersion"),
+    'plugin-micro-version-missing' : (ERROR,   "plugin is missing microVersion"),
+    'plugin-author-name-missing'   : (ERROR,   "plugin author name is missing"),
+    'plugin-author-homepage-missing': (WARNING, "plugin author homepage is missing"),
+    'plugin-author-email-prefix'   : (WARNING, "plugin author email entry is missing 'mailto:' prefix"),
+    'plugin-brand-missing'         : (WARNING, "plugin brand is missing"),
+    'plugin-brand-too-long'        : (ERROR,   "plugin brand has more than 16 characters"),
+    'plugin-label-missing'         : (WARNING, "plugin label is missing"),
+    'plugin-label-too-long'        : (ERROR,   "plugin label has more than 24 characters"),
+
+    # modgui
+    'modgui-missing'                 : (WARNING, "no modgui available"),
+    'modgui-resources-missing'       : (ERROR,   "modgui has no resourcesDirectory data"),
+    'modgui-icon-missing'            : (ERROR,   "modgui has no iconTemplate data"),
+    'modgui-icon-file-missing'       : (ERROR,   "modgui iconTemplate file is missing"),
+    'modgui-settings-file-missing'   : (ERROR,   "modgui settingsTemplate file is missing"),
+    'modgui-javascript-file-missing' : (ERROR,   "modgui javascript file is missing"),
+    'modgui-stylesheet-missing'      : (ERROR,   "modgui has no stylesheet data"),
+    'modgui-stylesheet-file-missing' : (ERROR,   "modgui stylesheet file is missing"),
+    'modgui-template-data'           : (WARNING, "modgui is using old deprecated templateData"),
+    'modgui-screenshot-missing'      : (ERROR,   "modgui has no screnshot data"),
+    'modgui-screenshot-file-missing' : (ERROR,   "modgui screenshot file is missing"),
+    'modgui-thumbnail-missing'       : (ERROR,   "modgui has no thumbnail data"),
+    'modgui-thumbnail-file-missing'  : (ERROR,   "modgui thumbnail file is missing"),
+    'modgui-port-invalid'            : (ERROR,   "modgui has some invalid port data"),
+    'modgui-port-symbol-duplicated'  : (ERROR,   "modgui has some duplicated port symbols"),
+
+    # ports
+    'port-name-missing'           : (ERROR,   "port with index %(index)i has no name"),
+    'port-symbol-missing'         : (ERROR,   "port with index %(index)i has no symbol"),
+    'port-name-duplicated'        : (WARNING, "port name '%(port)s' is not unique"),
+    'port-symbol-duplicated'      : (ERROR,   "port symbol '%(symbol)s' is not unique"),
+    'port-name-too-long'          : (WARNING, "port '%(port)s' name is too big, reduce the name size or provide a shortName"),
+    'port-short-name-too-long'    : (ERROR,   "port '%(port)s' short name has more than 16 characters"),
+    'port-short-name-old-style'   : (ERROR,   "port '%(port)s' short name is using old style 'shortname' instead of 'shortName'"),
+    'port-integer-cv'             : (ERROR,   "port '%(port)s' has integer property and CV type"),
+    'port-range-not-integer'      : (WARNING, "port '%(port)s' has integer property but %(range)s value is not an integer"),
+    'port-range-integer'          : (WARNING, "port '%(port)s' does not have integer property but %(range)s value is an integer"),
+    'port-range-invalid'          : (ERROR,   "port '%(port)s' %(range)s value is not an integer or float"),
+    'port-range-inverted'         : (ERROR,   "port '%(port)s' minimum value is equal or higher than its maximum"),
+    'port-default-out-of-bounds'  : (ERROR,   "port '%(port)s' default value is out of bounds"),
+    'port-default-missing'        : (ERROR,   "port '%(port)s' is missing default value"),
+    'port-ranges-missing'         : (ERROR,   "port '%(port)s' is missing value ranges"),
+    'port-scalepoint-label-missing': (ERROR,  "a port scalepoint is missing its label"),
+    'port-scalepoint-label-empty' : (ERROR,   "a port scalepoint label is empty"),
+    'port-scalepoint-value-missing': (ERROR,  "port scalepoint '%(label)s' is missing its value"),
+    'port-scalepoint-not-integer' : (WARNING, "port '%(port)s' scalepoint '%(label)s' value is not an integer"),
+    'port-scalepoint-integer'     : (WARNING, "port '%(port)s' scalepoint '%(label)s' value is an integer"),
+    'port-scalepoint-invalid'     : (WARNING, "port '%(port)s' scalepoint '%(label)s' value is not an integer or float"),
+    'port-scalepoint-out-of-bounds': (ERROR,  "port scalepoint '%(label)s' has an out-of-bounds value:\n%(bounds)s"),
+    'port-enumeration-values'     : (ERROR,   "port '%(port)s' wants to use enumeration but doesn't have enough values"),
+    'port-unit-invalid'           : (ERROR,   "port '%(port)s' has wrong lv2 unit uri"),
+    'port-unit-unknown'           : (ERROR,   "port '%(port)s' has unknown lv2 unit (our bug?, data is '%(label)s', '%(render)s', '%(symbol)s')"),
+    'port-unit-label-missing'     : (ERROR,   "port '%(port)s' has custom unit with no label"),
+    'port-unit-render-missing'    : (ERROR,   "port '%(port)s' has custom unit with no render"),
+    'port-unit-symbol-missing'    : (ERROR,   "port '%(port)s' has custom unit with no symbol"),
+
+    # presets
+    'preset-uri-missing'   : (ERROR, "preset with label '%(label)s' has no uri"),
+    'preset-label-missing' : (ERROR, "preset with uri '%(uri)s' has no label"),
+}
+
+# Extra checks run on the complete plugin info once extraction is done, see register_plugin_check
+PLUGIN_CHECKS = []
+
+# ------------------------------------------------------------------------------------------------------------
+# Registry
+
+# Add (or replace) a rule, so it can be reported by a check
+def register_plugin_rule(ruleid, severity, message):
+    if severity not in (ERROR, WARNING):
+        raise Exception('register_plugin_rule(%s) - invalid severity' % ruleid)
+    PLUGIN_RULES[ruleid] = (severity, message)
+
+# Add a check that runs on the complete plugin info (the same dictionary get_plugin_info returns, without
+# errors and warnings), @a func is called with the info and a ValidationReport.
+def register_plugin_check(func):
+    if func not in PLUGIN_CHECKS:
+        PLUGIN_CHECKS.append(func)
+    return func
+
+# ------------------------------------------------------------------------------------------------------------
+# ValidationReport
+
+# Collects the problems found while extracting plugin info
+# When not @a enabled nothing is collected, and extraction skips the queries that are only needed for validation.
+# @a ignore is an optional list of rule ids to leave out of the report.
+class ValidationReport(object):
+    def __init__(self, enabled = True, ignore = ()):
+        self.enabled  = enabled
+        self.ignore   = set(ignore)
+        self.issues   = []
+        self.errors   = []
+        self.warnings = []
+
+    def report(self, ruleid, **args):
+        if not self.enabled or ruleid in self.ignore:
+            return
+
+        severity, message = PLUGIN_RULES[ruleid]
+
+        if args:
+            message = message % args
+
+        self.issues.append((ruleid, severity, message))
+
+        if severity == ERROR:
+            self.errors.append(message)
+        else:
+            self.warnings.append(message)
+
+    # Run the registered checks on the complete plugin info
+    def check(self, info):
+        if not self.enabled:
+            return
+        for func in PLUGIN_CHECKS:
+            func(info, self)
+
+# ------------------------------------------------------------------------------------------------------------